@@ -0,0 +1,78 @@
+"""
+Per-request agent setup cost: fresh EducationAgents per request (the old
+behaviour, eight Agent constructions and a new LLM client) versus leasing
+from the process-wide AgentPool.
+
+    python benchmarks/bench_agent_setup.py --requests 200
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('OPENAI_API_KEY', 'sk-benchmark')
+
+from edu_agent.agents import AgentPool, EducationAgents
+from edu_agent.tasks import EducationTasks
+
+STUDENT = {
+    'percentage': 82.5,
+    'school_name': 'Benchmark School',
+    'age': 16,
+    'current_class': 'Class 11',
+    'preparation_status': 'Just beginning',
+    'target_exams': ['JEE Main', 'JEE Advanced'],
+    'strong_subjects': ['Mathematics'],
+    'weak_subjects': ['Chemistry']
+}
+
+
+def build_tasks(tasks):
+    return [
+        tasks.analyze_academic_profile_task(STUDENT),
+        tasks.create_study_roadmap_task(STUDENT),
+        tasks.recommend_resources_task(STUDENT),
+        tasks.optimize_study_schedule_task(STUDENT)
+    ]
+
+
+def fresh_setup():
+    agents = EducationAgents()
+    crew_agents = [agents.build(role) for role in EducationAgents.ROLES]
+    build_tasks(EducationTasks(agents))
+    return crew_agents
+
+
+def pooled_setup(pool):
+    with pool.lease() as agents:
+        agents.all()
+        build_tasks(EducationTasks(agents))
+
+
+def measure(fn, requests):
+    start = time.perf_counter()
+    for _ in range(requests):
+        fn()
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=100)
+    args = parser.parse_args()
+    
+    pool = AgentPool()
+    pooled_setup(pool)  # warm the pool, as the first request in a process would
+    
+    fresh = measure(fresh_setup, args.requests)
+    pooled = measure(lambda: pooled_setup(pool), args.requests)
+    
+    print(f"fresh agents per request : {fresh * 1000:8.3f} ms")
+    print(f"pooled agents per request: {pooled * 1000:8.3f} ms")
+    print(f"saved per request        : {(fresh - pooled) * 1000:8.3f} ms ({fresh / pooled:.1f}x)")
+    print(f"agent sets built by pool : {pool.created}")
+
+
+if __name__ == '__main__':
+    main()
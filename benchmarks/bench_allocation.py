@@ -0,0 +1,58 @@
+"""
+Study-hour allocation for a batch of students: one allocate_profiles call
+per student, as the UI makes, versus one vectorized call for the batch.
+
+    python benchmarks/bench_allocation.py --students 10000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from edu_agent.allocation import SUBJECTS, allocate, allocate_profiles, profile_arrays
+
+CLASSES = ['Class 9', 'Class 10', 'Class 11', 'Class 12', 'Dropper (12th Pass)']
+
+
+def students(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            'current_class': rng.choice(CLASSES),
+            'strong_subjects': rng.sample(SUBJECTS, rng.randint(0, 1)),
+            'weak_subjects': rng.sample(SUBJECTS, rng.randint(0, 2))
+        }
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--students', type=int, default=10000)
+    args = parser.parse_args()
+    
+    profiles = students(args.students)
+    
+    start = time.perf_counter()
+    for profile in profiles:
+        allocate_profiles([profile])
+    single = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    arrays = profile_arrays(profiles)
+    convert = time.perf_counter() - start
+    start = time.perf_counter()
+    allocate(*arrays)
+    batch = time.perf_counter() - start
+    
+    print(f"students                 : {args.students}")
+    print(f"one call per student     : {single * 1000:8.3f} ms")
+    print(f"profiles to arrays       : {convert * 1000:8.3f} ms")
+    print(f"one vectorized call      : {batch * 1000:8.3f} ms ({single / (convert + batch):.1f}x overall)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Progress tracker analytics over a synthetic score history: the class-wide
+trend summary and one student's series, straight from the columnar store.
+
+    python benchmarks/bench_progress.py --students 5000 --tests 40
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from edu_agent.progress import SUBJECTS, ProgressStore, cohort_summary, student_progress
+
+COHORTS = ['Class 11', 'Class 12', 'Dropper']
+
+
+def fill(store, students, tests, seed=0):
+    """``tests`` scores per student spread over 180 days, drifting per student"""
+    rng = np.random.default_rng(seed)
+    count = students * tests
+    student = np.repeat(np.arange(students), tests)
+    days = rng.integers(19000, 19180, count)
+    drift = rng.normal(0.05, 0.1, students)[student]
+    scores = rng.normal(60, 12, count) + drift * (days - 19000)
+    store.append(
+        student, [SUBJECTS[i] for i in rng.integers(0, len(SUBJECTS), count)], scores, days,
+        [COHORTS[i % len(COHORTS)] for i in student]
+    )
+    return count
+
+
+def measure(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--students', type=int, default=5000)
+    parser.add_argument('--tests', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as path:
+        store = ProgressStore(path)
+        records = fill(store, args.students, args.tests)
+        
+        start = time.perf_counter()
+        store.columns()
+        load = time.perf_counter() - start
+        
+        everyone = measure(lambda: cohort_summary(store), args.repeat)
+        cohort = measure(lambda: cohort_summary(store, COHORTS[0]), args.repeat)
+        student = measure(lambda: student_progress(store, 0), args.repeat)
+        
+        print(f"records                  : {records}")
+        print(f"load columns             : {load * 1000:8.3f} ms")
+        print(f"summary, all students    : {everyone * 1000:8.3f} ms")
+        print(f"summary, one cohort      : {cohort * 1000:8.3f} ms")
+        print(f"one student's progress   : {student * 1000:8.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
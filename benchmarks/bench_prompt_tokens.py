@@ -0,0 +1,142 @@
+"""
+Prompt tokens per task before and after shared-context prompt assembly.
+
+"Before" renders the original per-task prompts: a multi-line profile block
+repeated in every description, and the full output of the previous task as
+context (Process.sequential). "After" renders config/tasks.yaml through
+PromptAssembler: one compact profile line and bounded summaries of the
+upstream outputs. Both sides count description + expected output + context,
+the parts this package controls; crewai's fixed ReAct wrapper is the same
+on both sides and is left out.
+
+    python benchmarks/bench_prompt_tokens.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from edu_agent.config import TASK_NAMES, PromptConfig
+from edu_agent.prompts import PromptAssembler, estimate_tokens
+
+STUDENT = {
+    'percentage': 82.5,
+    'school_name': 'Delhi Public School',
+    'age': 16,
+    'current_class': 'Class 11',
+    'preparation_status': 'Just beginning',
+    'target_exams': ['JEE Main', 'JEE Advanced'],
+    'strong_subjects': ['Mathematics'],
+    'weak_subjects': ['Chemistry']
+}
+
+LEGACY_PROFILE = """
+            - Academic Percentage: {percentage}%
+            - School Name: {school_name}
+            - Age: {age} years
+"""
+
+LEGACY_TASKS = {
+    'analyze_academic_profile': (
+        """
+            Analyze the student's academic profile based on the following information:{profile}
+            Provide insights on:
+            1. Current academic standing and strengths
+            2. Gaps that need to be addressed for JEE preparation
+            3. Realistic expectations based on current performance
+            4. Recommended preparation intensity level
+            """,
+        "Detailed academic analysis with strengths, weaknesses, and preparation recommendations"
+    ),
+    'create_study_roadmap': (
+        """
+            Create a comprehensive study roadmap for JEE preparation considering:{profile}
+            The roadmap should include:
+            1. Phase-wise preparation strategy
+            2. Subject-wise focus areas (Physics, Chemistry, Mathematics)
+            3. Monthly milestones and targets
+            4. Mock test schedule
+            5. Revision strategies
+            6. Backup college options (NITs, IIITs, etc.)
+            """,
+        "Detailed month-by-month study roadmap with clear milestones and strategies"
+    ),
+    'recommend_resources': (
+        """
+            Recommend the best study resources tailored for a student with:{profile}
+            Recommend:
+            1. Best books for each subject (Physics, Chemistry, Math)
+            2. Online platforms and courses
+            3. YouTube channels and free resources
+            4. Coaching institute recommendations (if needed)
+            5. Practice question banks and previous year papers
+            6. Mobile apps for preparation
+            """,
+        "Comprehensive list of recommended study materials and resources with reasons for selection"
+    ),
+    'optimize_study_schedule': (
+        """
+            Create an optimized daily and weekly study schedule for:{profile}
+            Consider:
+            1. School hours and homework time
+            2. Optimal study hours per day
+            3. Subject rotation and time allocation
+            4. Break times and recreational activities
+            5. Sleep and health considerations
+            6. Weekend intensive study plans
+            7. Exam and test schedules
+            """,
+        "Detailed daily and weekly study schedule with time allocations and balance considerations"
+    ),
+}
+
+# A typical length for one agent answer (~600 tokens)
+SAMPLE_OUTPUT = "\n".join(
+    ["# Assessment"] + [
+        f"- Area {i}: The student shows a solid base here, scoring well in school tests. "
+        f"However, JEE-level problems in this area need deeper practice with timed sets, "
+        f"error logs and weekly revision to convert understanding into speed."
+        for i in range(1, 13)
+    ]
+)
+
+
+def legacy_tokens():
+    profile = LEGACY_PROFILE.format(**STUDENT)
+    tokens = {}
+    for i, name in enumerate(TASK_NAMES):
+        description, expected = LEGACY_TASKS[name]
+        prompt = description.format(profile=profile) + expected
+        if i:
+            # Process.sequential fed each task the full previous output
+            prompt += SAMPLE_OUTPUT
+        tokens[name] = estimate_tokens(prompt)
+    return tokens
+
+
+def assembled_tokens():
+    config = PromptConfig()
+    prompts = PromptAssembler(STUDENT)
+    tasks = config.tasks()
+    tokens = {}
+    for name in TASK_NAMES:
+        spec = tasks[name]
+        prompt = spec['description'].render(prompts.values_for(spec['inputs'])) + spec['expected_output']
+        if spec['context']:
+            prompt += prompts.context((dep, SAMPLE_OUTPUT) for dep in spec['context'])
+        tokens[name] = estimate_tokens(prompt)
+    return tokens
+
+
+def main():
+    before = legacy_tokens()
+    after = assembled_tokens()
+    print(f"{'task':28s} {'before':>7s} {'after':>7s}")
+    for name in TASK_NAMES:
+        print(f"{name:28s} {before[name]:7d} {after[name]:7d}")
+    total_before, total_after = sum(before.values()), sum(after.values())
+    print(f"{'total':28s} {total_before:7d} {total_after:7d}  ({total_after / total_before:.0%} of before)")
+
+
+if __name__ == '__main__':
+    main()
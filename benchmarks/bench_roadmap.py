@@ -0,0 +1,240 @@
+"""
+Latency, throughput and peak memory of roadmap generation: the mock
+roadmap, the full crew against the offline FakeLLM, and the data and charts
+prepared for RoadmapDisplay.render, each at several concurrency levels.
+
+    python benchmarks/bench_roadmap.py --requests 64 --json before.json
+    python benchmarks/bench_roadmap.py --requests 64 --compare before.json
+
+With --compare the run exits non-zero when any p95 latency or throughput
+is worse than the baseline by more than --tolerance.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'streamlit_app'))
+os.environ.setdefault('OTEL_SDK_DISABLED', 'true')
+
+from components.input_form import StudentInputForm as Form
+
+
+def students(count, seed=0):
+    """Deterministic, varied student records, using only values the input form offers"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        subjects = rng.sample(Form.SUBJECTS, 2)
+        records.append({
+            # The form's slider runs from 40 to 100 in steps of 0.5
+            'percentage': rng.randint(80, 200) / 2,
+            'school_name': f'Benchmark School {i}',
+            'age': rng.choice(Form.AGES),
+            'current_class': rng.choice(Form.CLASSES),
+            'preparation_status': rng.choice(Form.PREPARATION_STATUSES),
+            'target_exams': rng.sample(Form.EXAMS, rng.randint(1, 2)),
+            'strong_subjects': subjects[:1],
+            'weak_subjects': subjects[1:]
+        })
+    return records
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def run_threads(fn, records, concurrency):
+    """Call fn once per record from ``concurrency`` threads; per-call latencies"""
+    def timed(record):
+        start = time.perf_counter()
+        fn(record)
+        return time.perf_counter() - start
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(timed, records))
+
+
+def run_crew(crew, records, concurrency):
+    """Generate one roadmap per record with ``concurrency`` in flight"""
+    async def timed(record):
+        start = time.perf_counter()
+        result = await crew.acreate_study_roadmap(record)
+        if result['status'] != 'success':
+            raise RuntimeError(result['message'])
+        return time.perf_counter() - start
+    
+    async def main():
+        crew.max_concurrent = concurrency
+        pending = iter(records)
+        
+        # Closed loop: each client sends its next request when the last returns
+        async def client():
+            return [await timed(record) for record in pending]
+        
+        latencies = await asyncio.gather(*[client() for _ in range(concurrency)])
+        return [latency for client_latencies in latencies for latency in client_latencies]
+    
+    # The agents print their reasoning; keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        return asyncio.run(main())
+
+
+def targets(args):
+    """name -> (runner(records, concurrency), number of requests per level)"""
+    from components.roadmap_display import RoadmapDisplay
+    from utils.helpers import HelperFunctions
+    
+    # Cached charts are built outside a Streamlit session here; that is fine
+    logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').setLevel(logging.ERROR)
+    
+    def display(record):
+        RoadmapDisplay.prepare(HelperFunctions.generate_mock_roadmap(record))
+    
+    selected = {
+        'mock_roadmap': (
+            lambda records, c: run_threads(HelperFunctions.generate_mock_roadmap, records, c),
+            args.requests * 10
+        ),
+        'display_prepare': (
+            lambda records, c: run_threads(display, records, c),
+            args.requests
+        ),
+    }
+    
+    if not args.skip_crew:
+        os.environ['EDU_AGENT_FAKE_LATENCY'] = str(args.latency)
+        os.environ['EDU_AGENT_FAKE_TOKENS'] = str(args.tokens)
+        from edu_agent.agents import AgentPool, EducationAgents
+        from edu_agent.crew import EducationCrew
+        from edu_agent.llm import build_llm
+        
+        # No LLM, roadmap, library, coalescing or task output reuse: every
+        # request runs all four agents
+        pool = AgentPool(EducationAgents(llm=build_llm(cache=False, backend='fake')), max_idle=64)
+        crew = EducationCrew(
+            pool=pool, roadmap_cache=False, library=False, coalesce=False, task_store=False,
+            schedule='agent'
+        )
+        selected['crew_fake_llm'] = (lambda records, c: run_crew(crew, records, c), args.requests)
+    
+    return selected
+
+
+def measure(runner, records, concurrency, memory):
+    # Warm up pools, imports and agent sets at this concurrency first
+    runner(records[:concurrency], concurrency)
+    
+    start = time.perf_counter()
+    latencies = runner(records, concurrency)
+    elapsed = time.perf_counter() - start
+    
+    result = {
+        'concurrency': concurrency,
+        'requests': len(records),
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'mean_ms': statistics.mean(latencies) * 1000,
+        'throughput_rps': len(records) / elapsed,
+    }
+    
+    if memory:
+        # Separate pass: tracing allocations slows everything down
+        tracemalloc.start()
+        runner(records, concurrency)
+        result['peak_memory_mb'] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """Print changes against a baseline report; returns the regressions"""
+    previous = {
+        (row['target'], row['concurrency']): row for row in baseline['results']
+    }
+    regressions = []
+    print(f"\nagainst {baseline.get('commit') or 'baseline'}:")
+    for row in results:
+        old = previous.get((row['target'], row['concurrency']))
+        if old is None:
+            continue
+        p95 = row['p95_ms'] / old['p95_ms'] - 1
+        throughput = row['throughput_rps'] / old['throughput_rps'] - 1
+        flag = ''
+        if p95 > tolerance or throughput < -tolerance:
+            regressions.append(row)
+            flag = '  REGRESSION'
+        print(f"{row['target']:16s} c={row['concurrency']:<3d} "
+              f"p95 {p95:+7.1%}  throughput {throughput:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=64,
+                        help="requests per concurrency level (x10 for the mock roadmap)")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 64])
+    parser.add_argument('--latency', type=float, default=0.05, help="FakeLLM median latency in seconds")
+    parser.add_argument('--tokens', type=int, default=200, help="FakeLLM completion tokens")
+    parser.add_argument('--skip-crew', action='store_true')
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--json', help="write the results to this file")
+    parser.add_argument('--compare', help="baseline JSON written by an earlier run")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+    
+    results = []
+    for name, (runner, requests) in targets(args).items():
+        records = students(requests)
+        for concurrency in args.concurrency:
+            row = dict(target=name, **measure(runner, records, concurrency, not args.no_memory))
+            results.append(row)
+            memory = f"{row['peak_memory_mb']:8.1f} MB" if 'peak_memory_mb' in row else ''
+            print(f"{name:16s} c={concurrency:<3d} p50 {row['p50_ms']:9.2f} ms  "
+                  f"p95 {row['p95_ms']:9.2f} ms  p99 {row['p99_ms']:9.2f} ms  "
+                  f"{row['throughput_rps']:9.1f} req/s {memory}")
+    
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'args': vars(args),
+        'results': results
+    }
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
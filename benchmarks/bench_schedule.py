@@ -0,0 +1,55 @@
+"""
+Local schedule optimizer latency: a full week of timetables per student,
+from the hour allocation through greedy placement and local search.
+
+    python benchmarks/bench_schedule.py --students 500
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from edu_agent.allocation import SUBJECTS
+from edu_agent.schedule_optimizer import optimize_week
+
+CLASSES = ['Class 9', 'Class 10', 'Class 11', 'Class 12', 'Dropper (12th Pass)']
+EXAMS = ['JEE Main', 'JEE Advanced', 'BITSAT', 'VITEEE', 'COMEDK']
+
+
+def students(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            'current_class': rng.choice(CLASSES),
+            'target_exams': rng.sample(EXAMS, rng.randint(1, 2)),
+            'strong_subjects': rng.sample(SUBJECTS, rng.randint(0, 1)),
+            'weak_subjects': rng.sample(SUBJECTS, rng.randint(0, 2))
+        }
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--students', type=int, default=500)
+    args = parser.parse_args()
+    
+    samples = []
+    for student in students(args.students):
+        start = time.perf_counter()
+        optimize_week(student)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    
+    print(f"students                 : {args.students}")
+    print(f"week per student, p50    : {statistics.median(samples) * 1000:8.3f} ms")
+    print(f"week per student, p95    : {samples[int(0.95 * (len(samples) - 1))] * 1000:8.3f} ms")
+    print(f"week per student, max    : {samples[-1] * 1000:8.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Cold-start import cost of the package and the Streamlit entry points,
+measured with ``python -X importtime`` in a fresh interpreter per target.
+
+    python benchmarks/bench_startup.py --repeat 5 --json startup.json
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# name -> (modules imported, extra sys.path entry)
+TARGETS = {
+    'python (interpreter baseline)': ([], 'src'),
+    'edu_agent': (['edu_agent'], 'src'),
+    'edu_agent.crew': (['edu_agent.crew'], 'src'),
+    'edu_agent.batch': (['edu_agent.batch'], 'src'),
+    'edu_agent.agents (first generation)': (['edu_agent.agents', 'edu_agent.tasks'], 'src'),
+    'app: input form + helpers': (
+        ['components.input_form', 'components.roadmap_display',
+         'components.roadmap_stream', 'utils.helpers'],
+        'streamlit_app'
+    ),
+}
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+
+def import_time(modules, path):
+    """
+    Total cumulative import time in microseconds of the top-level imports
+    triggered by importing ``modules`` in a fresh interpreter
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.join(ROOT, 'src'), os.path.join(ROOT, path)])
+    code = '; '.join(f'import {module}' for module in modules) or 'pass'
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        env=env, capture_output=True, text=True, check=True
+    )
+    
+    total = 0
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        # Nested imports are indented and already counted by their parent
+        if match and not match.group(3):
+            total += int(match.group(2))
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args()
+    
+    results = {}
+    for name, (modules, path) in TARGETS.items():
+        samples = [import_time(modules, path) / 1000 for _ in range(args.repeat)]
+        results[name] = {'median_ms': statistics.median(samples), 'min_ms': min(samples)}
+        print(f"{name:40s} {results[name]['median_ms']:9.1f} ms (min {results[name]['min_ms']:.1f})")
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9 @@
+"""
+Multi-agent IIT-JEE study roadmap generation.
+
+Importing the package is cheap: crewai and langchain are loaded the first
+time a crew actually generates a roadmap.
+"""
+from .crew import EducationCrew
+
+__all__ = ['EducationCrew']
\ No newline at end of file
@@ -1,54 +1,156 @@
+import threading
+from contextlib import contextmanager
+
 from crewai import Agent
-from langchain.llms import OpenAI
+
+from .config import AGENT_ROLES, PromptConfig
+from .llm import build_llm
 
 class EducationAgents:
-    def __init__(self):
-        self.llm = OpenAI(temperature = 0.7)
+    ROLES = AGENT_ROLES
     
-    def academic_analyzer_agent(self):
+    def __init__(self, llm=None, cache=None, config=None, backend=None):
+        # backend selects the LLM client when none is given: 'openai' or 'fake'
+        self.llm = llm or build_llm(cache, backend)
+        # Roles, goals and backstories come from config/agents.yaml
+        self.config = config or PromptConfig.shared()
+    
+    def build(self, role):
+        """Construct a fresh Agent for one of ROLES"""
+        return getattr(self, f'{role}_agent')()
+    
+    def _agent(self, role):
+        spec = self.config.agents()[role]
         return Agent(
-            role='Academic Performance Analyzer',
-            goal='Analyze student academic performance and provide insights',
-            backstory="""You are an experienced academic counselor with 15+ years of experience 
-            in analyzing student performance patterns. You specialize in understanding how different 
-            academic backgrounds translate to JEE preparation requirements.""",
+            role=spec['role'],
+            goal=spec['goal'],
+            backstory=spec['backstory'],
             verbose=True,
             allow_delegation=False,
             llm=self.llm
         )
     
+    def academic_analyzer_agent(self):
+        return self._agent('academic_analyzer')
+    
     def study_planner_agent(self):
-        return Agent(
-            role='IIT-JEE Study Strategist',
-            goal='Create comprehensive and personalized study roadmaps for IIT-JEE preparation',
-            backstory="""You are a top-tier JEE coaching expert who has helped thousands of students 
-            crack IIT-JEE. You understand the nuances of different preparation strategies based on 
-            student profiles and can create timeline-based study plans.""",
-            verbose=True,
-            allow_delegation=False,
-            llm=self.llm
-        )
+        return self._agent('study_planner')
     
     def resource_curator_agent(self):
-        return Agent(
-            role='Educational Resource Curator',
-            goal='Recommend best study materials and resources for JEE preparation',
-            backstory="""You are a JEE preparation specialist who has extensive knowledge of all 
-            available study materials, online platforms, coaching institutes, and books. You can 
-            recommend the most effective resources based on student needs.""",
-            verbose=True,
-            allow_delegation=False,
-            llm=self.llm
-        )
+        return self._agent('resource_curator')
     
     def timeline_optimizer_agent(self):
-        return Agent(
-            role='Timeline and Schedule Optimizer',
-            goal='Create realistic and achievable study schedules',
-            backstory="""You are a time management expert who specializes in creating balanced 
-            study schedules for competitive exam preparation. You understand how to optimize 
-            study time while maintaining student well-being.""",
-            verbose=True,
-            allow_delegation=False,
-            llm=self.llm
-        )
\ No newline at end of file
+        return self._agent('timeline_optimizer')
+
+
+class AgentSet:
+    """
+    One Agent per role, leased from an AgentPool for a single roadmap run.
+    Exposes the same *_agent() methods as EducationAgents so EducationTasks
+    and the Crew end up pointing at the very same objects.
+    """
+    def __init__(self, agents, llm, version=0):
+        self._agents = agents
+        self.llm = llm
+        # PromptConfig version the agents were built from
+        self.version = version
+    
+    def all(self):
+        return [self._agents[role] for role in EducationAgents.ROLES]
+    
+    def academic_analyzer_agent(self):
+        return self._agents['academic_analyzer']
+    
+    def study_planner_agent(self):
+        return self._agents['study_planner']
+    
+    def resource_curator_agent(self):
+        return self._agents['resource_curator']
+    
+    def timeline_optimizer_agent(self):
+        return self._agents['timeline_optimizer']
+
+
+class AgentPool:
+    """
+    Process-wide pool of AgentSets sharing a single LLM client.
+
+    crewai Agents are stateful while a crew runs (kickoff assigns the crew and
+    rebuilds the executor), so a set is leased to exactly one request at a time.
+    The pool grows to the peak number of concurrent requests and then only
+    hands out existing sets. Sets built from an older config/agents.yaml are
+    dropped once the file is reloaded.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, agents=None, max_idle=32):
+        self.agents = agents or EducationAgents()
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+        self.created = 0
+    
+    @classmethod
+    def shared(cls):
+        """Return the pool used by every EducationCrew in this process"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    def _acquire(self):
+        config = self.agents.config
+        config.agents()  # picks up edits to agents.yaml
+        with self._lock:
+            while self._idle:
+                agent_set = self._idle.pop()
+                if agent_set.version == config.version:
+                    return agent_set
+            self.created += 1
+        return AgentSet(
+            {role: self.agents.build(role) for role in EducationAgents.ROLES},
+            self.agents.llm,
+            config.version
+        )
+    
+    def _release(self, agent_set):
+        with self._lock:
+            if len(self._idle) < self.max_idle and agent_set.version == self.agents.config.version:
+                self._idle.append(agent_set)
+    
+    def _release_when_idle(self, agent_set, futures):
+        """Release agent_set once every future still using it has finished"""
+        pending = [future for future in futures if not future.done()]
+        if not pending:
+            self._release(agent_set)
+            return
+        remaining = [len(pending)]
+        lock = threading.Lock()
+        
+        def finished(_):
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self._release(agent_set)
+        
+        for future in pending:
+            future.add_done_callback(finished)
+    
+    @contextmanager
+    def lease(self, workers=None):
+        """
+        Borrow an AgentSet for the duration of one roadmap run.
+        
+        ``workers`` is a list the caller fills with the concurrent futures
+        running tasks on the set. A worker abandoned after a timeout keeps
+        using its Agents, so the set only goes back to the pool once all of
+        them have finished.
+        """
+        agent_set = self._acquire()
+        try:
+            yield agent_set
+        finally:
+            self._release_when_idle(agent_set, workers or ())
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""
+Study hours per subject for every day of the week, for many students at once.
+
+    python -m edu_agent.allocation students.csv -o hours.csv [--weekly]
+
+The input is the CSV or JSONL that edu_agent.batch reads. Each student gets
+seven rows of hours (Mathematics, Physics, Chemistry, Revision), or with
+--weekly one row of weekly totals.
+"""
+import argparse
+import csv
+import json
+import sys
+
+import numpy as np
+
+SUBJECTS = ('Mathematics', 'Physics', 'Chemistry')
+COLUMNS = SUBJECTS + ('Revision',)
+DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Study hours available each day, by stage: Class 9-10, Class 11-12 with
+# school on weekdays, and droppers preparing full time
+STAGES = ('junior', 'school', 'dropper')
+STAGE_HOURS = np.array([
+    [3, 3, 3, 3, 3, 5, 5],
+    [5, 5, 5, 5, 5, 9, 9],
+    [11, 11, 11, 11, 11, 11, 8],
+], dtype=np.float64)
+
+# Share of each day's hours kept for revision, growing towards the weekend
+REVISION_SHARE = np.array([0.1, 0.1, 0.1, 0.1, 0.15, 0.2, 0.35])
+
+# Relative weight of a subject's study time
+WEAK_WEIGHT = 1.3
+STRONG_WEIGHT = 0.85
+
+# Each day one subject, in turn, gets this much extra weight
+FOCUS_WEIGHT = 1.25
+FOCUS = np.where(
+    np.arange(len(DAYS))[:, None] % len(SUBJECTS) == np.arange(len(SUBJECTS)), FOCUS_WEIGHT, 1.0
+)
+
+# Hours are handed out in units of half an hour
+SLOTS_PER_HOUR = 2
+
+
+def stage(current_class):
+    """Row of STAGE_HOURS for a current_class value from the input form"""
+    current_class = current_class or 'Class 11'
+    if 'Dropper' in current_class:
+        return STAGES.index('dropper')
+    if current_class in ('Class 9', 'Class 10'):
+        return STAGES.index('junior')
+    return STAGES.index('school')
+
+
+def profile_arrays(profiles):
+    """
+    (weak, strong, hours) arrays for a sequence of student profiles: weak
+    and strong are (n, 3) booleans over SUBJECTS, hours is (n, 7) available
+    study hours per day. A profile's optional ``available_hours``, one
+    number or one per day, replaces the default for its class.
+    """
+    weak = np.array([
+        [subject in (profile.get('weak_subjects') or ()) for subject in SUBJECTS] for profile in profiles
+    ], dtype=bool).reshape(-1, len(SUBJECTS))
+    strong = np.array([
+        [subject in (profile.get('strong_subjects') or ()) for subject in SUBJECTS] for profile in profiles
+    ], dtype=bool).reshape(-1, len(SUBJECTS))
+    hours = STAGE_HOURS[[stage(profile.get('current_class')) for profile in profiles]].reshape(-1, len(DAYS))
+    for i, profile in enumerate(profiles):
+        if profile.get('available_hours') is not None:
+            hours[i] = profile['available_hours']
+    return weak, strong, hours
+
+
+def allocate(weak, strong, hours):
+    """
+    Daily hours as an (n, 7, 4) array over DAYS and COLUMNS.
+    
+    Each day's hours are split into revision and subject time; subject time
+    follows the subject weights, with the day's focus subject weighted up.
+    Hours are rounded to half hours with the largest remainder method, so
+    every day still adds up to the hours available.
+    """
+    weak = np.asarray(weak, dtype=bool)
+    strong = np.asarray(strong, dtype=bool)
+    hours = np.asarray(hours, dtype=np.float64)
+    
+    # A subject marked both weak and strong counts as weak
+    weights = np.where(weak, WEAK_WEIGHT, np.where(strong, STRONG_WEIGHT, 1.0))
+    daily_weights = weights[:, None, :] * FOCUS
+    shares = daily_weights / daily_weights.sum(axis=-1, keepdims=True)
+    
+    study = hours * (1 - REVISION_SHARE)
+    exact = np.concatenate([
+        study[..., None] * shares,
+        (hours * REVISION_SHARE)[..., None]
+    ], axis=-1) * SLOTS_PER_HOUR
+    
+    slots = np.floor(exact)
+    remainder = exact - slots
+    missing = np.rint(hours * SLOTS_PER_HOUR) - slots.sum(axis=-1)
+    # Rank of each column's remainder within its day, largest first
+    rank = np.argsort(np.argsort(-remainder, axis=-1, kind='stable'), axis=-1, kind='stable')
+    slots += rank < missing[..., None]
+    return slots / SLOTS_PER_HOUR
+
+
+def allocate_profiles(profiles):
+    """(n, 7, 4) daily hours for a sequence of student profiles"""
+    return allocate(*profile_arrays(profiles))
+
+
+def weekly_hours(daily):
+    """(n, 4) hours per week over COLUMNS"""
+    return daily.sum(axis=-2)
+
+
+def export_hours(records, out, weekly=False, chunk_size=10000):
+    """
+    Write hours for (student_id, student_data) pairs to ``out`` as CSV,
+    allocating ``chunk_size`` students per call; returns the students written
+    """
+    writer = csv.writer(out)
+    writer.writerow(['student_id'] + ([] if weekly else ['day']) + list(COLUMNS))
+    
+    written = 0
+    records = iter(records)
+    while True:
+        chunk = [record for _, record in zip(range(chunk_size), records)]
+        if not chunk:
+            return written
+        daily = allocate_profiles([student_data for _, student_data in chunk])
+        for (student_id, _), days in zip(chunk, daily):
+            if weekly:
+                writer.writerow([student_id] + weekly_hours(days).tolist())
+            else:
+                writer.writerows([student_id, day] + hours.tolist() for day, hours in zip(DAYS, days))
+        written += len(chunk)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export daily study hours for a batch of students")
+    parser.add_argument('input', help="CSV or JSONL file of student records")
+    parser.add_argument('-o', '--output', required=True, help="CSV file to write")
+    parser.add_argument('--weekly', action='store_true', help="one row of weekly totals per student")
+    args = parser.parse_args(argv)
+    
+    # Reads records exactly the way the roadmap batch does
+    from .batch import read_records
+    
+    with open(args.output, 'w', newline='', encoding='utf-8') as out:
+        written = export_hours(read_records(args.input), out, weekly=args.weekly)
+    print(json.dumps({'students': written}), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""
+Bulk roadmap generation for batches of students.
+
+    python -m edu_agent.batch students.csv -o roadmaps.jsonl --workers 4
+
+Input is CSV or JSONL with the same fields the Streamlit form collects. In
+CSV files the list fields (target_exams, strong_subjects, weak_subjects) are
+separated with semicolons. Each record may carry a ``student_id``; records
+without one are identified by their position in the file.
+
+Results are appended to the output JSONL as soon as each student finishes,
+and the output doubles as the checkpoint: rerunning the same command skips
+every student that already has a success or invalid line in it.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .metrics import MetricsRegistry, serve_metrics
+from .validation import validate_student_data
+
+LIST_FIELDS = ('target_exams', 'strong_subjects', 'weak_subjects')
+
+# Text fields and the value a missing or null one gets
+TEXT_DEFAULTS = {
+    'school_name': '',
+    'current_class': 'Class 11',
+    'preparation_status': 'Not started yet',
+}
+
+# One crew per worker process, built by the pool initializer
+_crew = None
+
+
+def read_rows(path):
+    """
+    Yield (student_id, row) pairs from a CSV or JSONL file, fields as read.
+    A JSONL line that is not a JSON object is passed on as its text, under
+    its position, for normalize_record to reject.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith('.csv'):
+            rows = csv.DictReader(f)
+        else:
+            rows = (line for line in f if line.strip())
+        
+        for position, row in enumerate(rows, 1):
+            if isinstance(row, str):
+                try:
+                    row = json.loads(row)
+                except ValueError:
+                    pass
+            if not isinstance(row, dict):
+                yield str(position), row
+                continue
+            yield str(row.pop('student_id', '') or position), row
+
+
+def read_records(path):
+    """
+    Yield (student_id, student_data) pairs from a CSV or JSONL file
+    """
+    for student_id, row in read_rows(path):
+        yield student_id, normalize_record(row)
+
+
+def normalize_record(row):
+    """
+    Coerce CSV strings and JSON nulls into the types produced by
+    StudentInputForm; raises ValueError for a record that is not an object
+    or a number field that does not parse
+    """
+    if not isinstance(row, dict):
+        raise ValueError(f"Record is not a JSON object: {str(row).strip()[:80]!r}")
+    data = dict(row)
+    for field, convert in (('percentage', float), ('age', int)):
+        value = data.get(field)
+        if not isinstance(value, (int, float)):
+            try:
+                data[field] = convert(value or 0)
+            except (TypeError, ValueError):
+                raise ValueError(f"{field} must be a number, got {value!r}") from None
+    for field in LIST_FIELDS:
+        value = data.get(field) or []
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(';') if item.strip()]
+        elif not isinstance(value, list):
+            value = [str(value)]
+        data[field] = value
+    for field, default in TEXT_DEFAULTS.items():
+        value = data.get(field)
+        data[field] = default if value is None or value == '' else str(value)
+    return data
+
+
+def completed_ids(output_path):
+    """
+    Student IDs that already have a final result in the output file
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # A line cut short by a crash; that student is generated again
+                continue
+            if result.get('status') in ('success', 'invalid'):
+                done.add(result['student_id'])
+    return done
+
+
+def _init_worker(parallel):
+    global _crew
+    from .crew import EducationCrew
+    _crew = EducationCrew(parallel=parallel)
+
+
+def _generate(student_id, student_data):
+    # Rerunning a file with edited profiles regenerates only the affected tasks
+    result = dict(_crew.create_study_roadmap(student_data, student_id=student_id), student_id=student_id)
+    # Roadmaps cross the process boundary and reach the file in compact form
+    for field in ('roadmap', 'partial_roadmap'):
+        if field in result:
+            result[field] = result[field].to_dict()
+    # The worker's metrics since its last student, for the parent's registry
+    return result, MetricsRegistry.shared().take()
+
+
+def run_batch(input_path, output_path, workers=4, max_pending=None, parallel=True):
+    """
+    Generate roadmaps for every pending student and return a status summary;
+    the workers' metrics are added to this process's shared MetricsRegistry
+    """
+    done = completed_ids(output_path)
+    max_pending = max_pending or workers * 2
+    summary = {'skipped': 0, 'invalid': 0, 'success': 0, 'error': 0}
+    
+    # Terminate a line left half-written by a crash before appending to it
+    if os.path.exists(output_path) and os.path.getsize(output_path):
+        with open(output_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                with open(output_path, 'a', encoding='utf-8') as out:
+                    out.write('\n')
+    
+    with open(output_path, 'a', encoding='utf-8') as out, ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(parallel,)
+    ) as pool:
+        def write(result):
+            out.write(json.dumps(result, default=str) + '\n')
+            out.flush()
+            os.fsync(out.fileno())
+            summary[result['status']] += 1
+        
+        def drain(pending, block_until):
+            while len(pending) > block_until:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    student_id = pending.pop(future)
+                    try:
+                        result, taken = future.result()
+                    except Exception as e:
+                        result = {'student_id': student_id, 'status': 'error', 'message': str(e)}
+                    else:
+                        MetricsRegistry.shared().merge(taken)
+                    write(result)
+        
+        pending = {}
+        try:
+            for student_id, row in read_rows(input_path):
+                if student_id in done:
+                    summary['skipped'] += 1
+                    continue
+                
+                # A malformed record is reported on its own line; the rest still run
+                try:
+                    student_data = normalize_record(row)
+                    errors = validate_student_data(student_data)
+                except Exception as e:
+                    errors = [str(e)]
+                if errors:
+                    write({'student_id': student_id, 'status': 'invalid', 'errors': errors})
+                    continue
+                
+                # Bound the number of queued students so huge inputs stream through
+                drain(pending, max_pending - 1)
+                pending[pool.submit(_generate, student_id, student_data)] = student_id
+        finally:
+            # Students already generated reach the file even if reading the input fails
+            drain(pending, 0)
+    
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate study roadmaps for a batch of students")
+    parser.add_argument('input', help="CSV or JSONL file of student records")
+    parser.add_argument('-o', '--output', required=True, help="JSONL file results are appended to")
+    parser.add_argument('-w', '--workers', type=int, default=4, help="worker processes")
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="students queued at once (default: 2 per worker)")
+    parser.add_argument('--sequential', action='store_true',
+                        help="run each student's tasks one at a time")
+    parser.add_argument('--metrics-port', type=int, default=os.environ.get('EDU_AGENT_METRICS_PORT') or None,
+                        help="serve /metrics on this port while the batch runs "
+                             "(default: EDU_AGENT_METRICS_PORT, off when unset)")
+    args = parser.parse_args(argv)
+    
+    if args.metrics_port:
+        serve_metrics(args.metrics_port, os.environ.get('EDU_AGENT_METRICS_HOST', '127.0.0.1'))
+    
+    summary = run_batch(
+        args.input, args.output,
+        workers=args.workers,
+        max_pending=args.max_pending,
+        parallel=not args.sequential
+    )
+    print(json.dumps(summary), file=sys.stderr)
+    return 1 if summary['error'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Precomputed roadmaps for a grid of representative student profiles.
+
+    python -m edu_agent.build_library --output library.sqlite --concurrency 8
+    python -m edu_agent.build_library --grid grid.json --count
+
+The input form only produces a small, discrete set of profiles, so the
+library is built offline once per grid and looked up by profile bucket at
+request time; EducationCrew serves a hit in milliseconds and spends at most
+one short LLM call on a personal note. The build writes every roadmap as
+soon as it is generated and skips profiles already in the library, so an
+interrupted build resumes where it stopped.
+
+``--grid`` takes a JSON object overriding any of the GRID dimensions, e.g.
+{"ages": [16, 17], "target_exams": [["JEE Main"]]}.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import sys
+
+from .roadmap_library import RoadmapLibrary
+
+SUBJECTS = ('Mathematics', 'Physics', 'Chemistry')
+
+# Values of each profile field the default grid covers. Subjects are one
+# strong and one weak subject at most, and exams the two common targets;
+# anything else is generated on demand as before.
+GRID = {
+    'ages': list(range(14, 20)),
+    'current_class': ["Class 9", "Class 10", "Class 11", "Class 12", "Dropper (12th Pass)"],
+    'preparation_status': [
+        "Not started yet",
+        "Just beginning",
+        "3-6 months preparation",
+        "6-12 months preparation",
+        "More than 1 year"
+    ],
+    'target_exams': [["JEE Main"], ["JEE Main", "JEE Advanced"]],
+    'subjects': [
+        [strong, weak]
+        for strong in [None, *SUBJECTS] for weak in [None, *SUBJECTS]
+        if strong is None or strong != weak
+    ]
+}
+
+
+def profile_grid(grid=None, percentage_band=5.0):
+    """
+    Yield one representative student profile per grid cell; the percentage
+    sits in the middle of each band the input form's 40-100 range spans
+    """
+    grid = dict(GRID, **(grid or {}))
+    percentages = []
+    low = 40.0
+    while low <= 100.0:
+        percentages.append(min(100.0, low + percentage_band / 2))
+        low += percentage_band
+    
+    for percentage, age, current_class, status, exams, (strong, weak) in itertools.product(
+        percentages, grid['ages'], grid['current_class'], grid['preparation_status'],
+        grid['target_exams'], grid['subjects']
+    ):
+        yield {
+            'percentage': percentage,
+            'school_name': '',
+            'age': age,
+            'current_class': current_class,
+            'preparation_status': status,
+            'target_exams': list(exams),
+            'strong_subjects': [strong] if strong else [],
+            'weak_subjects': [weak] if weak else []
+        }
+
+
+async def build_library(library, profiles, crew, concurrency=8, on_result=None):
+    """
+    Generate and store a roadmap for every profile not yet in the library,
+    ``concurrency`` at a time; returns a status summary
+    """
+    summary = {'skipped': 0, 'success': 0, 'error': 0}
+    pending = iter(profiles)
+    
+    async def worker():
+        for student_data in pending:
+            if student_data in library:
+                summary['skipped'] += 1
+                continue
+            result = await crew.acreate_study_roadmap(student_data)
+            if result['status'] == 'success':
+                library.put(student_data, result['roadmap'])
+            summary[result['status']] += 1
+            if on_result is not None:
+                on_result(student_data, result)
+    
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the precomputed roadmap library")
+    parser.add_argument('-o', '--output', help="library file (default: EDU_AGENT_ROADMAP_LIBRARY or .cache)")
+    parser.add_argument('--grid', help="JSON file overriding GRID dimensions")
+    parser.add_argument('--percentage-band', type=float, default=5.0)
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help="roadmaps generated at once")
+    parser.add_argument('--limit', type=int, default=None, help="build at most this many grid cells")
+    parser.add_argument('--count', action='store_true', help="print the grid size and exit")
+    args = parser.parse_args(argv)
+    
+    grid = None
+    if args.grid:
+        with open(args.grid, encoding='utf-8') as f:
+            grid = json.load(f)
+    profiles = profile_grid(grid, args.percentage_band)
+    if args.limit is not None:
+        profiles = itertools.islice(profiles, args.limit)
+    if args.count:
+        print(sum(1 for _ in profiles))
+        return 0
+    
+    from .crew import EducationCrew
+    
+    library = RoadmapLibrary(args.output, args.percentage_band)
+    # Every cell is a distinct bucket: nothing to cache or coalesce
+    crew = EducationCrew(roadmap_cache=False, library=False, coalesce=False,
+                         max_concurrent=args.concurrency, personal_note=False)
+    
+    def report(student_data, result):
+        print(f"{result['status']} {library.key(student_data)}", file=sys.stderr)
+    
+    # The agents print their reasoning; keep it out of the build log
+    with contextlib.redirect_stdout(io.StringIO()):
+        summary = asyncio.run(build_library(library, profiles, crew, args.concurrency, report))
+    print(json.dumps(dict(summary, entries=len(library))), file=sys.stderr)
+    return 1 if summary['error'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
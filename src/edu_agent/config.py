@@ -0,0 +1,185 @@
+import logging
+import os
+import string
+import threading
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+CONFIG_DIR = os.environ.get(
+    'EDU_AGENT_CONFIG_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'config')
+)
+
+# Keys of the student_data dict built by StudentInputForm.render
+STUDENT_FIELDS = (
+    'percentage', 'school_name', 'age', 'current_class',
+    'preparation_status', 'target_exams', 'strong_subjects', 'weak_subjects'
+)
+
+# Template placeholders: the student fields plus the shared one-line profile
+TEMPLATE_FIELDS = STUDENT_FIELDS + ('profile',)
+
+AGENT_ROLES = ('academic_analyzer', 'study_planner', 'resource_curator', 'timeline_optimizer')
+AGENT_KEYS = ('role', 'goal', 'backstory')
+
+TASK_NAMES = (
+    'analyze_academic_profile', 'create_study_roadmap',
+    'recommend_resources', 'optimize_study_schedule'
+)
+TASK_KEYS = ('description', 'expected_output')
+
+
+class ConfigError(ValueError):
+    """Raised when config/*.yaml is missing entries or uses unknown placeholders"""
+
+
+class PromptTemplate:
+    """
+    A prompt parsed once into literal chunks and placeholder fields, so
+    rendering is a join instead of re-parsing the format string per request
+    """
+    def __init__(self, text, name, allowed_fields=TEMPLATE_FIELDS):
+        self.text = text
+        self.name = name
+        try:
+            parsed = list(string.Formatter().parse(text))
+        except ValueError as e:
+            raise ConfigError(f"{name}: {e}") from None
+        
+        self._parts = []
+        for literal, field, spec, conversion in parsed:
+            if field is not None and field not in allowed_fields:
+                raise ConfigError(
+                    f"{name}: unknown placeholder {{{field}}}, expected one of {', '.join(allowed_fields)}"
+                )
+            self._parts.append((literal, field, spec or ''))
+        self.fields = tuple(sorted({field for _, field, _ in self._parts if field}))
+    
+    def render(self, values):
+        chunks = []
+        for literal, field, spec in self._parts:
+            chunks.append(literal)
+            if field is not None:
+                chunks.append(format(values[field], spec))
+        return ''.join(chunks)
+
+
+class PromptConfig:
+    """
+    Agent and task definitions loaded from config/agents.yaml and
+    config/tasks.yaml.
+
+    The files are parsed, validated and compiled once. Every access stats both
+    files and reloads only when a modification time has changed, so prompts
+    can be tuned on a running server without a redeploy and without parsing
+    YAML per request. A reload that fails validation is logged and the
+    previous definitions stay in use.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, config_dir=None):
+        config_dir = config_dir or CONFIG_DIR
+        self.agents_path = os.path.join(config_dir, 'agents.yaml')
+        self.tasks_path = os.path.join(config_dir, 'tasks.yaml')
+        # Bumped on every successful (re)load; AgentPool compares it to drop stale agents
+        self.version = 0
+        self._mtimes = None
+        self._agents = None
+        self._tasks = None
+        self._lock = threading.Lock()
+        self._refresh()
+    
+    @classmethod
+    def shared(cls):
+        """Return the configuration used by every crew in this process"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    def agents(self):
+        """role -> {'role', 'goal', 'backstory'}"""
+        self._refresh()
+        return self._agents
+    
+    def tasks(self):
+        """
+        task name -> {'description': PromptTemplate, 'expected_output': str,
+        'context': names of the tasks whose output it reads, 'inputs': the
+        student fields it reads}
+        """
+        self._refresh()
+        return self._tasks
+    
+    def _refresh(self):
+        mtimes = (os.stat(self.agents_path).st_mtime_ns, os.stat(self.tasks_path).st_mtime_ns)
+        if mtimes == self._mtimes:
+            return
+        
+        with self._lock:
+            if mtimes == self._mtimes:
+                return
+            try:
+                agents = self._load_agents()
+                tasks = self._load_tasks()
+            except (ConfigError, yaml.YAMLError) as e:
+                if self._mtimes is None:
+                    raise
+                logger.error("Keeping previous prompt configuration: %s", e)
+                self._mtimes = mtimes
+                return
+            
+            self._agents, self._tasks = agents, tasks
+            self._mtimes = mtimes
+            self.version += 1
+    
+    def _load(self, path, names, keys):
+        with open(path, encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+        for name in names:
+            entry = data.get(name)
+            if not isinstance(entry, dict):
+                raise ConfigError(f"{os.path.basename(path)}: missing entry '{name}'")
+            missing = [key for key in keys if not entry.get(key)]
+            if missing:
+                raise ConfigError(f"{os.path.basename(path)}: '{name}' is missing {', '.join(missing)}")
+        return data
+    
+    def _load_agents(self):
+        data = self._load(self.agents_path, AGENT_ROLES, AGENT_KEYS)
+        return {
+            role: {key: data[role][key].strip() for key in AGENT_KEYS}
+            for role in AGENT_ROLES
+        }
+    
+    def _load_tasks(self):
+        data = self._load(self.tasks_path, TASK_NAMES, TASK_KEYS)
+        tasks = {}
+        for name in TASK_NAMES:
+            context = tuple(data[name].get('context') or ())
+            unknown = [dep for dep in context if dep not in TASK_NAMES or dep == name]
+            if unknown:
+                raise ConfigError(f"tasks.yaml:{name}: invalid context {', '.join(unknown)}")
+            
+            inputs = tuple(data[name].get('inputs') or STUDENT_FIELDS)
+            unknown = [field for field in inputs if field not in STUDENT_FIELDS]
+            if unknown:
+                raise ConfigError(f"tasks.yaml:{name}: unknown inputs {', '.join(unknown)}")
+            description = PromptTemplate(data[name]['description'], f"tasks.yaml:{name}")
+            # A placeholder outside inputs would change the prompt without the
+            # task being regenerated
+            undeclared = [field for field in description.fields if field != 'profile' and field not in inputs]
+            if undeclared:
+                raise ConfigError(f"tasks.yaml:{name}: {', '.join(undeclared)} used but not in inputs")
+            
+            tasks[name] = {
+                'description': description,
+                'expected_output': data[name]['expected_output'].strip(),
+                'context': context,
+                'inputs': inputs
+            }
+        return tasks
\ No newline at end of file
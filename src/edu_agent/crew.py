@@ -1,51 +1,308 @@
-from crewai import Crew, Process
-from .agents import EducationAgents
-from .tasks import EducationTasks
+import asyncio
+import dataclasses
+import logging
+import os
+import time
+import weakref
+
+from .config import TASK_NAMES
+from .metrics import MetricsRegistry
+from .prompts import PromptAssembler
+from .roadmap_cache import RoadmapCache
+from .roadmap_library import PERSONAL_NOTE_PROMPT, RoadmapLibrary
+from .roadmap_parser import parse_roadmap
+from .scheduler import TaskFailed, TaskScheduler
+from .single_flight import SingleFlight
+from .task_store import TaskOutputStore
+
+logger = logging.getLogger(__name__)
 
 class EducationCrew:
-    def __init__(self):
-        self.agents = EducationAgents()
-        self.tasks = EducationTasks(self.agents)
+    # Section headings used when the task outputs are stitched into one roadmap
+    SECTIONS = (
+        'Academic Profile Analysis',
+        'Study Roadmap',
+        'Recommended Resources',
+        'Study Schedule'
+    )
+    
+    def __init__(self, pool=None, parallel=True, max_workers=16, roadmap_cache=None,
+                 max_concurrent=8, task_timeout=None, metrics=None, retries=3, coalesce=True,
+                 library=None, personal_note=True, task_store=None, schedule=None):
+        # Agents and the LLM client are built once per process and leased per
+        # run; crewai and langchain are only imported when they are first needed
+        self._pool = pool
+        # parallel=False runs the tasks one at a time in dependency order
+        self.parallel = parallel
+        # Per-task latency and token usage, exported by metrics.serve_metrics
+        self.metrics = MetricsRegistry.shared() if metrics is None else metrics
+        self.scheduler = TaskScheduler(max_workers=max_workers, metrics=self.metrics, retries=retries)
+        # Students in the same profile bucket share a roadmap; False disables it
+        self.roadmap_cache = RoadmapCache.shared() if roadmap_cache is None else roadmap_cache
+        # Roadmaps built offline for the profile grid; False disables it.
+        # personal_note adds one short LLM call to address a hit to the student
+        self.library = RoadmapLibrary.shared() if library is None else library
+        self.personal_note = personal_note
+        # Per-student task outputs reused when a profile is regenerated;
+        # False disables it
+        self.task_store = TaskOutputStore.shared() if task_store is None else task_store
+        # 'agent' has the timeline optimizer agent write the Study Schedule
+        # section; 'local' builds it with schedule_optimizer, without an LLM call
+        self.schedule = schedule or os.environ.get('EDU_AGENT_SCHEDULE', 'agent')
+        # Generations allowed to run at once per event loop, and seconds per task
+        self.max_concurrent = max_concurrent
+        self.task_timeout = task_timeout
+        self._semaphores = weakref.WeakKeyDictionary()
+        # Identical profiles submitted together share one generation
+        self._flights = SingleFlight() if coalesce else None
     
-    def create_study_roadmap(self, student_data):
+    @property
+    def pool(self):
+        if self._pool is None:
+            from .agents import AgentPool
+            self._pool = AgentPool.shared()
+        return self._pool
+    
+    def create_study_roadmap(self, student_data, on_event=None, student_id=None):
         """
-        Main function to create personalized study roadmap
+        Main function to create personalized study roadmap.
+        Blocking wrapper around acreate_study_roadmap; must not be called
+        from a running event loop.
         """
-        # Create tasks with student data
-        academic_analysis_task = self.tasks.analyze_academic_profile_task(student_data)
-        study_roadmap_task = self.tasks.create_study_roadmap_task(student_data)
-        resource_recommendation_task = self.tasks.recommend_resources_task(student_data)
-        schedule_optimization_task = self.tasks.optimize_study_schedule_task(student_data)
-        
-        # Create crew
-        crew = Crew(
-            agents=[
-                self.agents.academic_analyzer_agent(),
-                self.agents.study_planner_agent(),
-                self.agents.resource_curator_agent(),
-                self.agents.timeline_optimizer_agent()
-            ],
-            tasks=[
-                academic_analysis_task,
-                study_roadmap_task,
-                resource_recommendation_task,
-                schedule_optimization_task
-            ],
-            process=Process.sequential,
-            verbose=True
+        return asyncio.run(
+            self.acreate_study_roadmap(student_data, on_event=on_event, student_id=student_id)
         )
+    
+    async def acreate_study_roadmap(self, student_data, on_event=None, student_id=None):
+        """
+        Create a personalized study roadmap without blocking the event loop.
+        Cancelling the awaiting coroutine cancels the remaining tasks.
+        
+        ``on_event(section, event, payload)`` streams progress per roadmap
+        section from worker threads: 'start', 'token' with each generated
+        token, and 'done' with the section's full text. Cached roadmaps, and
+        requests attached to an identical generation already in flight, are
+        returned without events.
+        
+        With a ``student_id`` the crew remembers each task's output for that
+        student, and a later call reruns only the tasks whose inputs changed
+        and the tasks downstream of them; the others report their stored
+        output with a single 'done' event.
+        """
+        started_at = time.perf_counter()
+        if self.roadmap_cache:
+            cached = self.roadmap_cache.get(student_data)
+            if cached is not None:
+                self.metrics.observe_roadmap('cached', time.perf_counter() - started_at)
+                return cached
         
-        # Execute the crew
+        if self.library:
+            prebuilt = self.library.get(student_data)
+            if prebuilt is not None:
+                if self.personal_note:
+                    prebuilt = await self._add_personal_note(prebuilt, student_data)
+                self.metrics.observe_roadmap('library', time.perf_counter() - started_at)
+                return prebuilt
+        
+        if self._flights is None:
+            return await self._generate(student_data, on_event, started_at, student_id)
+        
+        key = self._flight_key(student_data)
+        while True:
+            flight, leader = self._flights.join(key)
+            if leader:
+                break
+            
+            self.metrics.inc('edu_agent_roadmap_coalesced_total')
+            self.metrics.inc('edu_agent_roadmap_waiters')
+            try:
+                # Shielded so a waiter going away does not cancel the flight
+                shared = await asyncio.shield(asyncio.wrap_future(flight))
+            except asyncio.CancelledError:
+                if flight.cancelled():
+                    continue  # the leader was cancelled; start or join a new flight
+                raise
+            finally:
+                self.metrics.inc('edu_agent_roadmap_waiters', -1)
+            
+            self.metrics.observe_roadmap('coalesced', time.perf_counter() - started_at)
+            return self._share(shared, student_data)
+        
+        try:
+            result = await self._generate(student_data, on_event, started_at, student_id)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                flight.set_exception(e)
+            else:
+                flight.cancel()
+            raise
+        else:
+            flight.set_result(result)
+        finally:
+            self._flights.land(key, flight)
+        return result
+    
+    async def _generate(self, student_data, on_event, started_at, student_id=None):
+        """Run the crew under the concurrency limit and cache the result"""
+        status = 'cancelled'
         try:
-            result = crew.kickoff()
-            return {
-                'status': 'success',
-                'roadmap': result,
-                'student_profile': student_data
-            }
+            async with self._semaphore():
+                result = await self._run_crew(student_data, on_event, student_id)
+            status = result['status']
+        finally:
+            self.metrics.observe_roadmap(status, time.perf_counter() - started_at)
+        
+        if self.roadmap_cache:
+            self.roadmap_cache.put(student_data, result)
+        return result
+    
+    async def _add_personal_note(self, result, student_data):
+        """Open a library roadmap's profile analysis with a note to the student"""
+        roadmap = result['roadmap']
+        prompts = PromptAssembler(student_data)
+        prompt = PERSONAL_NOTE_PROMPT.format(
+            profile=prompts.profile,
+            summary=prompts.summarize(roadmap.sections.get(self.SECTIONS[1], ''))
+        )
+        try:
+            note = await asyncio.to_thread(self.pool.agents.llm.invoke, prompt)
+        except Exception:
+            # The roadmap is complete without it
+            return result
+        
+        # Models set up for the agents may still answer in the ReAct frame
+        note = note.split('Final Answer:', 1)[-1].strip()
+        sections = dict(roadmap.sections)
+        sections[self.SECTIONS[0]] = f"{note}\n\n{sections.get(self.SECTIONS[0], '')}".strip()
+        return dict(result, roadmap=dataclasses.replace(roadmap, sections=sections))
+    
+    def _flight_key(self, student_data):
+        """Profiles that would get the same roadmap share a flight"""
+        band = self.roadmap_cache.percentage_band if self.roadmap_cache else None
+        return RoadmapCache.bucket_key(student_data, band)
+    
+    @staticmethod
+    def _share(result, student_data):
+        """Re-address the result generated for another student to this one"""
+        return dict(result, student_profile=student_data)
+    
+    def _semaphore(self):
+        """Concurrency limit for the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        return semaphore
+    
+    async def _run_crew(self, student_data, on_event=None, student_id=None):
+        """Run the four agent tasks for one student"""
+        from .tasks import EducationTasks
+        
+        # Executor futures of this run; the Agents stay leased until they finish
+        workers = []
+        with self.pool.lease(workers) as agents:
+            tasks = EducationTasks(agents)
+            
+            # Outputs stored for this student that are still up to date
+            fingerprints = tasks.fingerprints(student_data)
+            reused = self._reusable_outputs(student_id, fingerprints)
+            done = dict(reused)
+            if self.schedule == 'local':
+                # Known before the run, like a reused output
+                from .schedule_optimizer import schedule_markdown
+                done[TASK_NAMES.index('optimize_study_schedule')] = schedule_markdown(student_data)
+            
+            # Create tasks with student data, in config.TASK_NAMES order
+            prompts = tasks.prompts(student_data)
+            task_list = [
+                tasks.analyze_academic_profile_task(student_data),
+                tasks.create_study_roadmap_task(student_data),
+                tasks.recommend_resources_task(student_data),
+                tasks.optimize_study_schedule_task(student_data)
+            ]
+            
+            # Upstream outputs reach later tasks as bounded summaries
+            def build_context(index, upstream):
+                return prompts.context((self.SECTIONS[dep], output) for dep, output in upstream)
+            
+            # Execute the tasks
+            outputs = None
+            try:
+                outputs = await self.scheduler.arun(
+                    task_list,
+                    graph=tasks.graph(),
+                    build_context=build_context,
+                    parallel=self.parallel,
+                    timeout=self.task_timeout,
+                    on_event=self._section_events(on_event),
+                    names=TASK_NAMES,
+                    done=done,
+                    workers=workers
+                )
+                result = {
+                    'status': 'success',
+                    'roadmap': self._compose_roadmap(outputs, student_data),
+                    'student_profile': student_data
+                }
+            except Exception as e:
+                result = {
+                    'status': 'error',
+                    'message': f"Error generating roadmap: {str(e)}",
+                    'student_profile': student_data
+                }
+                # Keep whatever sections finished before the failure
+                if isinstance(e, TaskFailed) and any(e.outputs):
+                    outputs = e.outputs
+                    result['partial_roadmap'] = self._compose_roadmap(e.outputs, student_data)
+            
+            if outputs is not None:
+                self._remember_outputs(student_id, fingerprints, outputs, done)
+            return result
+    
+    def _reusable_outputs(self, student_id, fingerprints):
+        """Task index -> stored output, for tasks whose fingerprint is unchanged"""
+        if student_id is None or not self.task_store:
+            return {}
+        try:
+            stored = self.task_store.load(student_id)
+        except Exception as e:
+            # Every task simply runs again
+            logger.error("Could not load stored task outputs: %s", e)
+            return {}
+        reused = {}
+        for i, name in enumerate(TASK_NAMES):
+            if name in stored and stored[name][0] == fingerprints[i]:
+                reused[i] = stored[name][1]
+                self.metrics.inc('edu_agent_tasks_reused_total', task=name)
+        return reused
+    
+    def _remember_outputs(self, student_id, fingerprints, outputs, reused):
+        """
+        Store the outputs of the agent tasks that ran for this student; a
+        failure to store them only costs the reuse on the next run
+        """
+        if student_id is None or not self.task_store:
+            return
+        try:
+            self.task_store.save(student_id, {
+                name: (fingerprints[i], outputs[i])
+                for i, name in enumerate(TASK_NAMES)
+                if outputs[i] is not None and i not in reused
+            })
         except Exception as e:
-            return {
-                'status': 'error',
-                'message': f"Error generating roadmap: {str(e)}",
-                'student_profile': student_data
-            }
\ No newline at end of file
+            logger.error("Could not store task outputs: %s", e)
+    
+    @classmethod
+    def _section_events(cls, on_event):
+        """Translate scheduler task indices into section titles"""
+        if on_event is None:
+            return None
+        return lambda index, event, payload: on_event(cls.SECTIONS[index], event, payload)
+    
+    @classmethod
+    def _compose_roadmap(cls, outputs, student_data):
+        """Parse the per-task outputs into one structured Roadmap"""
+        sections = {
+            title: output for title, output in zip(cls.SECTIONS, outputs) if output is not None
+        }
+        return parse_roadmap(sections, student_data)
\ No newline at end of file
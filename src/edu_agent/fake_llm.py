@@ -0,0 +1,144 @@
+import hashlib
+import math
+import os
+import random
+import threading
+import time
+
+from langchain.llms.base import LLM
+from langchain.pydantic_v1 import PrivateAttr
+from langchain.schema import Generation, LLMResult
+
+from .prompts import estimate_tokens
+
+# Frame crewai's ReAct parser expects from a model that is done thinking
+RESPONSE_FRAME = "Thought: I now know the final answer\nFinal Answer: {answer}"
+
+# Words the filler answers are drawn from
+VOCABULARY = (
+    'revise', 'practice', 'chapter', 'mock', 'test', 'concepts', 'formulas', 'weekly',
+    'target', 'syllabus', 'notes', 'problems', 'previous', 'papers', 'schedule', 'focus',
+    'strengthen', 'review', 'daily', 'hours', 'topics', 'physics', 'chemistry', 'mathematics',
+    'biology', 'numericals', 'theory', 'analysis', 'accuracy', 'speed', 'milestone', 'phase'
+)
+
+
+class FakeLLMError(RuntimeError):
+    """Failure injected by FakeLLM"""
+
+
+class FakeLLM(LLM):
+    """
+    Offline stand-in for the OpenAI client, for load tests and CI.
+    
+    Answers are deterministic for a given seed and prompt: either the text of
+    the first ``responses`` entry whose key occurs in the prompt, or filler of
+    about ``completion_tokens`` tokens. Each call sleeps for a log-normal
+    latency around ``latency`` seconds, streaming its tokens over that time,
+    and fails with FakeLLMError with probability ``failure_rate``. Repeated
+    calls with the same prompt draw fresh latencies and failures, so retries
+    can succeed, but the sequence is reproducible from the seed.
+    """
+    responses: dict = {}
+    completion_tokens: int = 200
+    latency: float = 0.5
+    latency_sigma: float = 0.25
+    failure_rate: float = 0.0
+    seed: int = 0
+    
+    _calls = PrivateAttr(default_factory=dict)
+    _lock = PrivateAttr(default_factory=threading.Lock)
+    
+    @classmethod
+    def from_env(cls, **kwargs):
+        """
+        Build from EDU_AGENT_FAKE_LATENCY, EDU_AGENT_FAKE_LATENCY_SIGMA,
+        EDU_AGENT_FAKE_TOKENS, EDU_AGENT_FAKE_FAILURE_RATE and
+        EDU_AGENT_FAKE_SEED; explicit keyword arguments take precedence
+        """
+        env = {
+            'latency': ('EDU_AGENT_FAKE_LATENCY', float),
+            'latency_sigma': ('EDU_AGENT_FAKE_LATENCY_SIGMA', float),
+            'completion_tokens': ('EDU_AGENT_FAKE_TOKENS', int),
+            'failure_rate': ('EDU_AGENT_FAKE_FAILURE_RATE', float),
+            'seed': ('EDU_AGENT_FAKE_SEED', int),
+        }
+        for field, (variable, parse) in env.items():
+            if field not in kwargs and os.environ.get(variable):
+                kwargs[field] = parse(os.environ[variable])
+        return cls(**kwargs)
+    
+    @property
+    def _llm_type(self):
+        return 'edu_agent_fake'
+    
+    @property
+    def _identifying_params(self):
+        return {
+            'responses': sorted(self.responses.items()),
+            'completion_tokens': self.completion_tokens,
+            'seed': self.seed,
+        }
+    
+    def _rng(self, prompt):
+        """Random source for the next call with this prompt"""
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        with self._lock:
+            attempt = self._calls.get(digest, 0)
+            self._calls[digest] = attempt + 1
+        return random.Random(f"{self.seed}:{digest}:{attempt}")
+    
+    def answer(self, prompt):
+        """The deterministic answer to ``prompt``, without the ReAct frame"""
+        for key, text in self.responses.items():
+            if key in prompt:
+                return text
+        
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode('utf-8')).digest()
+        rng = random.Random(digest)
+        words = [rng.choice(VOCABULARY) for _ in range(self.completion_tokens)]
+        # Break the filler into short bullet lines like a real plan
+        lines = [' '.join(words[i:i + 12]) for i in range(0, len(words), 12)]
+        return '\n'.join(f"- {line}" for line in lines)
+    
+    def _call(self, prompt, stop=None, run_manager=None, **kwargs):
+        rng = self._rng(prompt)
+        delay = 0.0
+        if self.latency > 0:
+            delay = rng.lognormvariate(math.log(self.latency), self.latency_sigma)
+        
+        if rng.random() < self.failure_rate:
+            time.sleep(delay)
+            raise FakeLLMError("Injected LLM failure")
+        
+        text = RESPONSE_FRAME.format(answer=self.answer(prompt))
+        if run_manager is None:
+            time.sleep(delay)
+            return text
+        
+        # Stream word by word, spreading the latency over the tokens
+        tokens = [token + ' ' for token in text.split(' ')]
+        tokens[-1] = tokens[-1][:-1]
+        pause = delay / len(tokens)
+        for token in tokens:
+            time.sleep(pause)
+            run_manager.on_llm_new_token(token)
+        return text
+    
+    def _generate(self, prompts, stop=None, run_manager=None, **kwargs):
+        generations = []
+        prompt_tokens = completion_tokens = 0
+        for prompt in prompts:
+            text = self._call(prompt, stop=stop, run_manager=run_manager, **kwargs)
+            generations.append([Generation(text=text)])
+            prompt_tokens += estimate_tokens(prompt)
+            completion_tokens += estimate_tokens(text)
+        
+        return LLMResult(
+            generations=generations,
+            llm_output={'token_usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+            }}
+        )
\ No newline at end of file
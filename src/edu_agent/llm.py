@@ -0,0 +1,127 @@
+import os
+
+from langchain.callbacks.base import BaseCallbackHandler
+from langchain.llms import OpenAI
+
+from .llm_cache import PromptCache
+from .metrics import current_task_stats
+from .prompts import estimate_tokens
+from .rate_limit import RateLimiter, backoff_delay
+from .streaming import emit_token
+
+class TokenStreamHandler(BaseCallbackHandler):
+    """
+    Forward streamed LLM tokens to the sink bound to the running task.
+
+    One handler is attached to the shared LLM client. The LLM is reused by
+    every concurrent run, so tokens are routed through a context variable
+    that the scheduler binds around each Task.execute call rather than
+    through per-request handler instances.
+    """
+    def on_llm_new_token(self, token, **kwargs):
+        emit_token(token)
+
+
+class UsageHandler(BaseCallbackHandler):
+    """
+    Add prompt and completion tokens of every LLM call to the running task's
+    TaskStats. Provider-reported usage is used when the response carries it
+    (it does not when streaming); otherwise both sides are estimated.
+    """
+    def __init__(self):
+        self._estimates = {}
+    
+    def on_llm_start(self, serialized, prompts, run_id=None, **kwargs):
+        stats = current_task_stats()
+        if stats is not None:
+            stats.llm_calls += 1
+            self._estimates[run_id] = sum(estimate_tokens(prompt) for prompt in prompts)
+    
+    def on_llm_end(self, response, run_id=None, **kwargs):
+        estimated_prompt = self._estimates.pop(run_id, 0)
+        stats = current_task_stats()
+        if stats is None:
+            return
+        
+        usage = (response.llm_output or {}).get('token_usage') or {}
+        if usage.get('prompt_tokens'):
+            stats.prompt_tokens += usage['prompt_tokens']
+            stats.completion_tokens += usage.get('completion_tokens', 0)
+        else:
+            stats.prompt_tokens += estimated_prompt
+            stats.completion_tokens += sum(
+                estimate_tokens(generation.text)
+                for generations in response.generations for generation in generations
+            )
+    
+    def on_llm_error(self, error, run_id=None, **kwargs):
+        self._estimates.pop(run_id, None)
+
+
+class RateLimitHandler(BaseCallbackHandler):
+    """
+    Make each LLM call wait for its share of the RateLimiter budget. Calls
+    answered from the prompt cache never reach the handler. The reservation
+    is settled against the provider-reported usage, or, for streamed
+    responses that carry none, against estimates of the prompt and the
+    generated text.
+    """
+    def __init__(self, limiter=None):
+        self.limiter = limiter or RateLimiter.shared()
+        self._reserved = {}
+    
+    def on_llm_start(self, serialized, prompts, run_id=None, **kwargs):
+        prompt_tokens = sum(estimate_tokens(prompt) for prompt in prompts)
+        tokens = prompt_tokens + self.limiter.completion_tokens * len(prompts)
+        self.limiter.acquire(tokens)
+        self._reserved[run_id] = (tokens, prompt_tokens)
+    
+    def on_llm_end(self, response, run_id=None, **kwargs):
+        reserved, prompt_tokens = self._reserved.pop(run_id, (0, 0))
+        usage = (response.llm_output or {}).get('token_usage') or {}
+        if usage.get('total_tokens'):
+            self.limiter.settle(reserved, usage['total_tokens'])
+        elif reserved:
+            self.limiter.settle(reserved, prompt_tokens + sum(
+                estimate_tokens(generation.text)
+                for generations in response.generations for generation in generations
+            ))
+    
+    def on_llm_error(self, error, run_id=None, **kwargs):
+        self._reserved.pop(run_id, None)
+        if type(error).__name__ == 'RateLimitError':
+            # Honour the provider's Retry-After when it sends one
+            headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+            try:
+                seconds = float(headers.get('retry-after'))
+            except (TypeError, ValueError):
+                seconds = 1.0 + backoff_delay(0)
+            self.limiter.pause(seconds)
+
+
+def build_llm(cache=None, backend=None):
+    """
+    LLM client shared by every agent. Responses are cached on disk unless
+    cache=False is passed, held to the process-wide RateLimiter budget,
+    streamed token by token to whichever task is listening, and metered
+    into that task's usage stats.
+    
+    ``backend`` is 'openai' or 'fake', the offline FakeLLM used for load
+    tests and CI; it defaults to the EDU_AGENT_LLM environment variable.
+    """
+    backend = backend or os.environ.get('EDU_AGENT_LLM', 'openai')
+    options = dict(
+        cache=PromptCache() if cache is None else cache,
+        callbacks=[RateLimitHandler(), TokenStreamHandler(), UsageHandler()]
+    )
+    if backend == 'fake':
+        from .fake_llm import FakeLLM
+        return FakeLLM.from_env(**options)
+    if backend != 'openai':
+        raise ValueError(f"Unknown LLM backend: {backend}")
+    
+    return OpenAI(
+        temperature = 0.7,
+        streaming=True,
+        **options
+    )
\ No newline at end of file
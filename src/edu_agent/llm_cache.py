@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from langchain.schema import BaseCache, Generation
+
+from .metrics import current_task_stats
+
+DEFAULT_CACHE_PATH = os.path.join('.cache', 'edu_agent', 'llm_cache.sqlite')
+
+class PromptCache(BaseCache):
+    """
+    Content-addressed LLM response cache stored in SQLite.
+
+    Plugged into langchain through the LLM's ``cache`` field, so every
+    completion requested by the crew agents goes through lookup/update. The
+    key hashes langchain's llm_string (model name, temperature, stop words and
+    the other invocation parameters) together with the rendered prompt.
+    Entries older than ``max_age`` seconds are dropped and the least recently
+    used entries are evicted once the stored responses exceed ``max_bytes``.
+    """
+    def __init__(self, path=None, max_bytes=64 * 1024 * 1024, max_age=7 * 24 * 3600):
+        self.path = path or os.environ.get('EDU_AGENT_LLM_CACHE', DEFAULT_CACHE_PATH)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(prompt, llm_string):
+        """
+        Hash the LLM configuration and the rendered prompt into a cache key
+        """
+        digest = hashlib.sha256()
+        digest.update(llm_string.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(prompt.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def lookup(self, prompt, llm_string):
+        key = self.make_key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self.evictions += 1
+                self.misses += 1
+                return None
+            
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        
+        stats = current_task_stats()
+        if stats is not None:
+            stats.cache_hits += 1
+        
+        return [Generation(**generation) for generation in json.loads(row[0])]
+    
+    def update(self, prompt, llm_string, return_val):
+        key = self.make_key(prompt, llm_string)
+        value = json.dumps([
+            {'text': generation.text, 'generation_info': generation.generation_info}
+            for generation in return_val
+        ])
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+    
+    def _evict(self, now):
+        """Drop expired entries, then least recently used ones over the size budget"""
+        expired = self._conn.execute(
+            "DELETE FROM responses WHERE created < ?", (now - self.max_age,)
+        ).rowcount
+        self.evictions += expired
+        
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+    
+    def clear(self, **kwargs):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+    
+    def stats(self):
+        """
+        Hit/miss counters for this process plus the current store size
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': size
+        }
\ No newline at end of file
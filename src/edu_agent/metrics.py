@@ -0,0 +1,254 @@
+import contextvars
+import json
+import os
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Latency buckets in seconds, sized for LLM round-trips
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+METRICS = {
+    'edu_agent_task_duration_seconds': ('histogram', "Wall time of one agent task"),
+    'edu_agent_task_queue_seconds': ('histogram', "Time a ready task waited for a worker thread"),
+    'edu_agent_task_runs_total': ('counter', "Agent tasks finished, by status"),
+    'edu_agent_task_prompt_tokens_total': ('counter', "Prompt tokens sent by agent tasks"),
+    'edu_agent_task_completion_tokens_total': ('counter', "Completion tokens received by agent tasks"),
+    'edu_agent_task_llm_calls_total': ('counter', "LLM calls made by agent tasks"),
+    'edu_agent_task_llm_cache_hits_total': ('counter', "LLM calls answered from the prompt cache"),
+    'edu_agent_task_retries_total': ('counter', "Retried LLM attempts of agent tasks"),
+    'edu_agent_roadmaps_total': ('counter', "Roadmap requests, by outcome"),
+    'edu_agent_roadmap_duration_seconds': ('histogram', "End-to-end roadmap generation time"),
+    'edu_agent_roadmap_coalesced_total': ('counter', "Roadmap requests attached to an identical in-flight generation"),
+    'edu_agent_roadmap_waiters': ('gauge', "Requests currently waiting on an in-flight generation"),
+    'edu_agent_tasks_reused_total': ('counter', "Agent tasks answered with a stored output instead of a run"),
+}
+
+# Usage of the task executing in the current thread
+_task_stats = contextvars.ContextVar('edu_agent_task_stats', default=None)
+
+
+class TaskStats:
+    """Counters filled in by LLM callbacks and the prompt cache while a task runs"""
+    __slots__ = ('prompt_tokens', 'completion_tokens', 'llm_calls', 'cache_hits', 'retries')
+    
+    def __init__(self):
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.llm_calls = 0
+        self.cache_hits = 0
+        self.retries = 0
+
+
+@contextmanager
+def bind_task_stats(stats):
+    """
+    Attribute LLM usage in this context to ``stats``
+    """
+    reset_token = _task_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _task_stats.reset(reset_token)
+
+
+def current_task_stats():
+    """
+    TaskStats of the running task, or None outside a scheduled task
+    """
+    return _task_stats.get()
+
+
+class MetricsRegistry:
+    """
+    In-process registry of crew metrics.
+
+    Counters, gauges (counters moved both ways with inc) and histograms are
+    keyed by metric name and label values and can be read as a JSON-friendly
+    snapshot or in the Prometheus text exposition format.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self):
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls):
+        """Return the registry every EducationCrew in this process reports to"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+    
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'buckets': [0] * len(BUCKETS), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(BUCKETS):
+                if value <= bound:
+                    histogram['buckets'][i] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+    
+    def observe_task(self, task, queue_time, wall_time, stats, status):
+        """
+        Record one finished agent task
+        """
+        self.observe('edu_agent_task_queue_seconds', queue_time, task=task)
+        self.observe('edu_agent_task_duration_seconds', wall_time, task=task)
+        self.inc('edu_agent_task_runs_total', task=task, status=status)
+        self.inc('edu_agent_task_prompt_tokens_total', stats.prompt_tokens, task=task)
+        self.inc('edu_agent_task_completion_tokens_total', stats.completion_tokens, task=task)
+        self.inc('edu_agent_task_llm_calls_total', stats.llm_calls, task=task)
+        self.inc('edu_agent_task_llm_cache_hits_total', stats.cache_hits, task=task)
+        self.inc('edu_agent_task_retries_total', stats.retries, task=task)
+    
+    def observe_roadmap(self, status, seconds):
+        """
+        Record one roadmap request; status is success, error, cached, library,
+        coalesced or cancelled
+        """
+        self.inc('edu_agent_roadmaps_total', status=status)
+        self.observe('edu_agent_roadmap_duration_seconds', seconds, status=status)
+    
+    def take(self):
+        """
+        Hand over everything recorded so far and start again from zero, for
+        merge() into the registry of another process
+        """
+        with self._lock:
+            taken = (self._counters, self._histograms)
+            self._counters, self._histograms = {}, {}
+        return taken
+    
+    def merge(self, taken):
+        """
+        Add counters and histograms returned by take()
+        """
+        counters, histograms = taken
+        with self._lock:
+            for key, value in counters.items():
+                self._counters[key] = self._counters.get(key, 0) + value
+            for key, h in histograms.items():
+                mine = self._histograms.setdefault(key, {'buckets': [0] * len(BUCKETS), 'sum': 0.0, 'count': 0})
+                mine['buckets'] = [a + b for a, b in zip(mine['buckets'], h['buckets'])]
+                mine['sum'] += h['sum']
+                mine['count'] += h['count']
+    
+    def snapshot(self):
+        """
+        Current values as plain data, suitable for json.dumps
+        """
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {
+                    'name': name,
+                    'labels': dict(labels),
+                    'count': h['count'],
+                    'sum': h['sum'],
+                    'buckets': dict(zip(map(str, BUCKETS), h['buckets']))
+                }
+                for (name, labels), h in sorted(self._histograms.items())
+            ]
+        return {'counters': counters, 'histograms': histograms}
+    
+    def to_prometheus(self):
+        """
+        Prometheus text exposition format (version 0.0.4)
+        """
+        def render_labels(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ''
+            return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+        
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((key, dict(h, buckets=list(h['buckets']))) for key, h in self._histograms.items())
+        
+        lines = []
+        described = set()
+        
+        def describe(name):
+            if name not in described:
+                kind, help_text = METRICS.get(name, ('untyped', name))
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                described.add(name)
+        
+        for (name, labels), value in counters:
+            describe(name)
+            lines.append(f"{name}{render_labels(labels)} {value}")
+        
+        for (name, labels), h in histograms:
+            describe(name)
+            for bound, count in zip(BUCKETS, h['buckets']):
+                lines.append(f"{name}_bucket{render_labels(labels, [('le', bound)])} {count}")
+            lines.append(f"{name}_bucket{render_labels(labels, [('le', '+Inf')])} {h['count']}")
+            lines.append(f"{name}_sum{render_labels(labels)} {h['sum']}")
+            lines.append(f"{name}_count{render_labels(labels)} {h['count']}")
+        
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def serve_metrics(port=9464, host='127.0.0.1', registry=None):
+    """
+    Serve /metrics (Prometheus text) and /metrics.json from a daemon thread;
+    returns the server so callers can shut it down
+    """
+    registry = registry or MetricsRegistry.shared()
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/metrics':
+                body = registry.to_prometheus().encode('utf-8')
+                content_type = 'text/plain; version=0.0.4; charset=utf-8'
+            elif self.path == '/metrics.json':
+                body = json.dumps(registry.snapshot()).encode('utf-8')
+                content_type = 'application/json'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name='edu-agent-metrics', daemon=True).start()
+    return server
+
+
+def serve_metrics_from_env(registry=None):
+    """
+    Start serve_metrics on EDU_AGENT_METRICS_PORT, bound to
+    EDU_AGENT_METRICS_HOST (127.0.0.1 by default); returns the server, or
+    None when no port is set
+    """
+    port = os.environ.get('EDU_AGENT_METRICS_PORT')
+    if not port:
+        return None
+    return serve_metrics(int(port), os.environ.get('EDU_AGENT_METRICS_HOST', '127.0.0.1'), registry)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import json
+from dataclasses import astuple, dataclass, field
+
+# Bumped whenever the compact form changes shape
+FORMAT_VERSION = 1
+
+
+@dataclass(slots=True)
+class Phase:
+    name: str
+    duration: str = ''
+    focus: str = ''
+    activities: tuple = ()
+
+
+@dataclass(slots=True)
+class Milestone:
+    month: str
+    target: str
+    test: str = ''
+
+
+@dataclass(slots=True)
+class ScheduleBlock:
+    time: str
+    activity: str
+    subject: str = ''
+
+
+@dataclass(slots=True)
+class Resource:
+    subject: str
+    title: str
+    # book, online, video, app or practice
+    kind: str = 'book'
+
+
+@dataclass(slots=True)
+class Roadmap:
+    """
+    A generated study roadmap, parsed once from the agents' output.
+    
+    ``sections`` keeps each section's markdown as generated, in order; the
+    other fields are the parts the roadmap view draws from. The compact form
+    stores every record as a positional list and is what caches, job results
+    and batch output hold.
+    """
+    sections: dict = field(default_factory=dict)
+    phases: list = field(default_factory=list)
+    milestones: list = field(default_factory=list)
+    schedule: list = field(default_factory=list)
+    resources: list = field(default_factory=list)
+    
+    def markdown(self):
+        """The whole roadmap as one markdown document"""
+        return "\n\n".join(f"## {title}\n\n{text}" for title, text in self.sections.items())
+    
+    def resources_by_subject(self, kind='book'):
+        grouped = {}
+        for resource in self.resources:
+            if resource.kind == kind:
+                grouped.setdefault(resource.subject, []).append(resource.title)
+        return grouped
+    
+    def to_dict(self):
+        return {
+            'v': FORMAT_VERSION,
+            'sections': self.sections,
+            'phases': [[p.name, p.duration, p.focus, list(p.activities)] for p in self.phases],
+            'milestones': [list(astuple(m)) for m in self.milestones],
+            'schedule': [list(astuple(b)) for b in self.schedule],
+            'resources': [list(astuple(r)) for r in self.resources]
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('v') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported roadmap format: {data.get('v')!r}")
+        return cls(
+            sections=dict(data['sections']),
+            phases=[Phase(name, duration, focus, tuple(activities))
+                    for name, duration, focus, activities in data['phases']],
+            milestones=[Milestone(*m) for m in data['milestones']],
+            schedule=[ScheduleBlock(*b) for b in data['schedule']],
+            resources=[Resource(*r) for r in data['resources']]
+        )
+    
+    def to_json(self):
+        return json.dumps(self.to_dict(), separators=(',', ':'), ensure_ascii=False)
+    
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
\ No newline at end of file
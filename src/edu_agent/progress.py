@@ -0,0 +1,266 @@
+import datetime
+import json
+import os
+import threading
+
+import numpy as np
+
+DEFAULT_PROGRESS_PATH = os.path.join('.cache', 'edu_agent', 'progress')
+
+SUBJECTS = ('Mathematics', 'Physics', 'Chemistry')
+
+# One little-endian file per column; a record is the same row of every file
+COLUMNS = {
+    'student': np.dtype('<u4'),
+    'cohort': np.dtype('<u2'),
+    'subject': np.dtype('u1'),
+    'day': np.dtype('<i4'),
+    'score': np.dtype('<f4'),
+}
+
+EPOCH = datetime.date(1970, 1, 1)
+
+
+def to_day(date):
+    """Days since 1970-01-01 for a date, the day column's unit"""
+    return (date - EPOCH).days
+
+
+class ProgressStore:
+    """
+    Append-only columnar store of mock test scores.
+    
+    Each record is a student, a cohort (the student's class), a subject, a
+    day and a score in percent. Students and cohorts are dictionary-encoded
+    in keys.json, and each column is a raw array file that only ever grows,
+    so adding scores is a few appends and reading them is one np.fromfile
+    per column. A write cut short by a crash leaves the columns at different
+    lengths; readers use the rows every column has, and the next append first
+    cuts every column back to that count, so only the torn records are lost.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, path=None):
+        self.path = path or os.environ.get('EDU_AGENT_PROGRESS_STORE', DEFAULT_PROGRESS_PATH)
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._cache = None
+        
+        keys_path = os.path.join(self.path, 'keys.json')
+        keys = {'students': [], 'cohorts': []}
+        if os.path.exists(keys_path):
+            with open(keys_path, encoding='utf-8') as f:
+                keys = json.load(f)
+        self._keys = keys
+        self._codes = {kind: {key: i for i, key in enumerate(values)} for kind, values in keys.items()}
+    
+    @classmethod
+    def shared(cls):
+        """
+        Store for the whole process, at EDU_AGENT_PROGRESS_STORE or the
+        default directory under .cache
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    def _file(self, column):
+        return os.path.join(self.path, f"{column}.{COLUMNS[column].str.lstrip('<|')}")
+    
+    def _encode(self, kind, values):
+        """Codes for student IDs or cohort names, assigning new ones as needed"""
+        codes = self._codes[kind]
+        added = False
+        for value in values:
+            if value not in codes:
+                codes[value] = len(self._keys[kind])
+                self._keys[kind].append(value)
+                added = True
+        if added:
+            # Keys are written before the rows that use them
+            keys_path = os.path.join(self.path, 'keys.json')
+            with open(keys_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(self._keys, f)
+            os.replace(keys_path + '.tmp', keys_path)
+        return np.array([codes[value] for value in values])
+    
+    def append(self, student_ids, subjects, scores, days=None, cohorts=None):
+        """
+        Record one score per element of the equally long sequences; ``days``
+        default to today and ``cohorts`` to 'All students'
+        """
+        student_ids = [str(student_id) for student_id in student_ids]
+        count = len(student_ids)
+        if days is None:
+            days = np.full(count, to_day(datetime.date.today()))
+        if cohorts is None:
+            cohorts = ['All students'] * count
+        
+        with self._lock:
+            rows = {
+                'student': self._encode('students', student_ids),
+                'cohort': self._encode('cohorts', [str(cohort) for cohort in cohorts]),
+                'subject': np.array([SUBJECTS.index(subject) for subject in subjects]),
+                'day': np.asarray(days),
+                'score': np.clip(np.asarray(scores, dtype=np.float64), 0, 100),
+            }
+            complete = self._complete_rows()
+            for column, dtype in COLUMNS.items():
+                with open(self._file(column), 'ab') as f:
+                    # Drop whatever a torn append left past the last complete row
+                    f.truncate(complete * dtype.itemsize)
+                    rows[column].astype(dtype).tofile(f)
+    
+    def record(self, student_id, subject, score, date=None, cohort='All students'):
+        """Record a single mock test score"""
+        day = to_day(date or datetime.date.today())
+        self.append([student_id], [subject], [score], [day], [cohort])
+    
+    def _complete_rows(self):
+        """Number of records every column file holds in full"""
+        return min(
+            os.path.getsize(self._file(column)) // dtype.itemsize if os.path.exists(self._file(column)) else 0
+            for column, dtype in COLUMNS.items()
+        )
+    
+    def columns(self):
+        """
+        column -> array over every complete record, reread only after appends
+        """
+        with self._lock:
+            rows = self._complete_rows()
+            if self._cache is None or self._cache[0] != rows:
+                self._cache = (rows, {
+                    column: np.fromfile(self._file(column), dtype=dtype, count=rows) if rows
+                    else np.empty(0, dtype=dtype)
+                    for column, dtype in COLUMNS.items()
+                })
+            return self._cache[1]
+    
+    def student_code(self, student_id):
+        return self._codes['students'].get(str(student_id))
+    
+    def cohort_code(self, cohort):
+        return self._codes['cohorts'].get(str(cohort))
+    
+    def cohorts(self):
+        return list(self._keys['cohorts'])
+
+
+def fit_groups(groups, days, scores, group_count):
+    """
+    Least-squares line of score against day for every group at once:
+    (tests, slope in points per day, intercept, last day, last score) arrays
+    indexed by group
+    """
+    x = (days - days.min()).astype(np.float64) if len(days) else days.astype(np.float64)
+    y = scores.astype(np.float64)
+    n = np.bincount(groups, minlength=group_count).astype(np.float64)
+    sx = np.bincount(groups, x, group_count)
+    sy = np.bincount(groups, y, group_count)
+    sxx = np.bincount(groups, x * x, group_count)
+    sxy = np.bincount(groups, x * y, group_count)
+    
+    denominator = n * sxx - sx * sx
+    slope = np.divide(n * sxy - sx * sy, denominator, out=np.zeros(group_count), where=denominator > 0)
+    intercept = np.divide(sy - slope * sx, n, out=np.zeros(group_count), where=n > 0)
+    
+    # Last test of each group: sort on one (group, day) key and take the end
+    # of every group's run
+    span = int(x.max()) + 1 if len(x) else 1
+    order = np.argsort(groups * span + x.astype(np.int64), kind='stable')
+    sorted_groups = groups[order]
+    ends = order[np.r_[sorted_groups[1:] != sorted_groups[:-1], bool(len(order))]]
+    last_day = np.zeros(group_count, dtype=np.int64)
+    last_score = np.full(group_count, np.nan)
+    last_day[groups[ends]] = days[ends]
+    last_score[groups[ends]] = y[ends]
+    return n.astype(np.int64), slope, intercept, last_day, last_score
+
+
+def moving_average(values, window=3):
+    """Trailing mean over up to ``window`` values"""
+    values = np.asarray(values, dtype=np.float64)
+    sums = np.cumsum(np.r_[0.0, values])
+    counts = np.minimum(np.arange(1, len(values) + 1), window)
+    return (sums[1:] - sums[np.arange(1, len(values) + 1) - counts]) / counts
+
+
+def cohort_summary(store, cohort=None, horizon=30):
+    """
+    How a cohort is doing per subject: students with scores, their mean
+    latest score, mean trend in points per week, the share improving and
+    the mean score projected ``horizon`` days past each student's last test
+    """
+    columns = store.columns()
+    mask = slice(None)
+    if cohort is not None:
+        code = store.cohort_code(cohort)
+        if code is None:
+            return {}
+        mask = columns['cohort'] == code
+    
+    students = columns['student'][mask].astype(np.int64)
+    subjects = columns['subject'][mask].astype(np.int64)
+    if not len(students):
+        return {}
+    groups = students * len(SUBJECTS) + subjects
+    count, slope, _, _, last_score = fit_groups(
+        groups, columns['day'][mask].astype(np.int64), columns['score'][mask],
+        (students.max() + 1) * len(SUBJECTS)
+    )
+    
+    count = count.reshape(-1, len(SUBJECTS))
+    slope = slope.reshape(-1, len(SUBJECTS))
+    last_score = last_score.reshape(-1, len(SUBJECTS))
+    projected = np.clip(last_score + slope * horizon, 0, 100)
+    
+    summary = {}
+    for i, subject in enumerate(SUBJECTS):
+        tested = count[:, i] > 0
+        trending = count[:, i] > 1
+        if not tested.any():
+            continue
+        summary[subject] = {
+            'students': int(tested.sum()),
+            'mean_score': float(last_score[tested, i].mean()),
+            'weekly_trend': float(slope[trending, i].mean() * 7) if trending.any() else 0.0,
+            'improving': float((slope[trending, i] > 0).mean()) if trending.any() else 0.0,
+            'projected_score': float(projected[tested, i].mean()),
+        }
+    return summary
+
+
+def student_progress(store, student_id, window=3, horizon=30):
+    """
+    Per subject, a student's tests in date order with their moving average
+    and the fitted trend projected ``horizon`` days ahead
+    """
+    code = store.student_code(student_id)
+    if code is None:
+        return {}
+    columns = store.columns()
+    mine = np.flatnonzero(columns['student'] == code)
+    
+    progress = {}
+    for i, subject in enumerate(SUBJECTS):
+        rows = mine[columns['subject'][mine] == i]
+        if not len(rows):
+            continue
+        rows = rows[np.argsort(columns['day'][rows], kind='stable')]
+        days = columns['day'][rows].astype(np.int64)
+        scores = columns['score'][rows].astype(np.float64)
+        _, slope, intercept, _, _ = fit_groups(np.zeros(len(rows), dtype=np.int64), days, scores, 1)
+        future = np.array([days[-1], days[-1] + horizon])
+        progress[subject] = {
+            'dates': [EPOCH + datetime.timedelta(days=int(day)) for day in days],
+            'scores': scores.tolist(),
+            'moving_average': moving_average(scores, window).tolist(),
+            'projection_dates': [EPOCH + datetime.timedelta(days=int(day)) for day in future],
+            'projection': np.clip(intercept[0] + slope[0] * (future - days.min()), 0, 100).tolist(),
+            'weekly_trend': float(slope[0] * 7),
+        }
+    return progress
\ No newline at end of file
@@ -0,0 +1,127 @@
+import re
+
+from .config import STUDENT_FIELDS
+
+# Upper bound, in tokens, for each upstream output handed to a later task
+SUMMARY_TOKENS = 120
+
+_tokenizer = None
+
+
+def estimate_tokens(text):
+    """
+    Prompt tokens for ``text``: exact with tiktoken when it is installed,
+    otherwise the usual four-characters-per-token approximation
+    """
+    global _tokenizer
+    if _tokenizer is None:
+        try:
+            import tiktoken
+            _tokenizer = tiktoken.get_encoding('cl100k_base').encode
+        except Exception:
+            # Not installed, or the encoding cannot be fetched while offline
+            _tokenizer = False
+    if _tokenizer:
+        return len(_tokenizer(text))
+    return (len(text) + 3) // 4
+
+
+class PromptAssembler:
+    """
+    Builds the pieces shared by the four task prompts of one roadmap.
+
+    The student profile is rendered into a single compact line that every
+    task template embeds through ``{profile}``, instead of each task spelling
+    out its own multi-line profile block; each task sees only the fields it
+    declares as its ``inputs``. Outputs of upstream tasks are passed
+    on as extractive summaries capped at SUMMARY_TOKENS each rather than in
+    full, which keeps the later prompts from growing with the earlier answers.
+    """
+    def __init__(self, student_data, summary_tokens=SUMMARY_TOKENS):
+        self.student_data = student_data
+        self.summary_tokens = summary_tokens
+        self.profile = self.profile_context(student_data)
+        self.values = self.template_values(student_data)
+        self.values['profile'] = self.profile
+        self._task_values = {}
+    
+    @staticmethod
+    def template_values(student_data):
+        """
+        Placeholder values for a student; list fields are joined for the prompt
+        """
+        values = {}
+        for field in STUDENT_FIELDS:
+            value = student_data.get(field, '')
+            if isinstance(value, (list, tuple)):
+                value = ', '.join(value) if value else 'None'
+            values[field] = value
+        return values
+    
+    def values_for(self, fields):
+        """
+        Template values for a task reading only ``fields`` of the profile
+        """
+        fields = tuple(fields)
+        values = self._task_values.get(fields)
+        if values is None:
+            values = dict(self.values, profile=self.profile_context(self.student_data, fields))
+            self._task_values[fields] = values
+        return values
+    
+    @staticmethod
+    def profile_context(student_data, fields=STUDENT_FIELDS):
+        """
+        One-line profile of ``fields``, e.g. "82.5%, age 16, Class 11, Just
+        beginning; targets JEE Main/JEE Advanced; strong Mathematics; weak
+        Chemistry; school DPS"
+        """
+        basics = [
+            template.format(student_data.get(field, default))
+            for field, template, default in (
+                ('percentage', '{}%', None),
+                ('age', 'age {}', None),
+                ('current_class', '{}', 'Class 11'),
+                ('preparation_status', '{}', 'Not started yet')
+            )
+            if field in fields
+        ]
+        parts = [', '.join(basics)] if basics else []
+        for label, field in (('targets', 'target_exams'), ('strong', 'strong_subjects'), ('weak', 'weak_subjects')):
+            if field in fields and student_data.get(field):
+                parts.append(f"{label} {'/'.join(student_data[field])}")
+        if 'school_name' in fields and student_data.get('school_name'):
+            parts.append(f"school {student_data['school_name']}")
+        return '; '.join(parts)
+    
+    def summarize(self, text, max_tokens=None):
+        """
+        Keep headings and the first sentence of every paragraph or bullet,
+        in order, until the token budget is spent
+        """
+        max_tokens = max_tokens or self.summary_tokens
+        if estimate_tokens(text) <= max_tokens:
+            return text.strip()
+        
+        kept = []
+        used = 0
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith('#'):
+                line = re.split(r'(?<=[.!?])\s', line, maxsplit=1)[0]
+            cost = estimate_tokens(line) + 1
+            if used + cost > max_tokens:
+                break
+            kept.append(line)
+            used += cost
+        return '\n'.join(kept)
+    
+    def context(self, sections):
+        """
+        Bounded context for a task from (title, output) pairs of its upstream tasks
+        """
+        return '\n\n'.join(
+            f"{title} (summary):\n{self.summarize(output)}" for title, output in sections
+        )
\ No newline at end of file
@@ -0,0 +1,126 @@
+import os
+import random
+import threading
+import time
+
+# Exceptions worth retrying, by class name so the provider SDK need not be
+# imported: openai's rate limit, timeout, connection and 5xx errors and the
+# failures injected by FakeLLM
+RETRYABLE_ERRORS = {
+    'RateLimitError', 'APITimeoutError', 'APIConnectionError', 'InternalServerError',
+    'ServiceUnavailableError', 'Timeout', 'FakeLLMError'
+}
+
+
+def is_retryable(error):
+    """
+    Whether ``error``, or an exception it was raised from, is transient
+    """
+    while error is not None:
+        if type(error).__name__ in RETRYABLE_ERRORS:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def backoff_delay(attempt, base=1.0, cap=30.0):
+    """
+    Seconds to wait before retry ``attempt`` (0-based): exponential with
+    full jitter, so clients that failed together do not retry together
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class _Bucket:
+    """Token bucket refilled continuously at ``per_minute``"""
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = time.monotonic()
+    
+    def refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def wait_time(self, amount):
+        # Requests larger than the whole bucket wait for a full bucket
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.level) / self.rate)
+
+
+class RateLimiter:
+    """
+    Process-wide client-side budget for LLM calls.
+    
+    Every call takes one request from the requests-per-minute bucket and its
+    estimated prompt plus completion tokens from the tokens-per-minute bucket,
+    blocking the calling worker thread until both have enough. A rate limit
+    reported by the provider pauses all callers until its Retry-After, so a
+    burst of failures turns into one wait instead of a storm of retries.
+    A budget of None is unlimited.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None, completion_tokens=256):
+        self.requests = _Bucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = _Bucket(tokens_per_minute) if tokens_per_minute else None
+        # Tokens reserved for each completion before its real size is known
+        self.completion_tokens = completion_tokens
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls):
+        """
+        Limiter for the whole process, budgeted by EDU_AGENT_LLM_RPM and
+        EDU_AGENT_LLM_TPM (unlimited when unset)
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    rpm = os.environ.get('EDU_AGENT_LLM_RPM')
+                    tpm = os.environ.get('EDU_AGENT_LLM_TPM')
+                    cls._shared = cls(int(rpm) if rpm else None, int(tpm) if tpm else None)
+        return cls._shared
+    
+    def acquire(self, tokens=0):
+        """
+        Block until one request and ``tokens`` tokens fit in the budget
+        """
+        if self.requests is None and self.tokens is None and not self._paused_until:
+            return
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+                    if bucket is not None:
+                        bucket.refill(now)
+                        wait = max(wait, bucket.wait_time(amount))
+                
+                if wait <= 0:
+                    if self.requests is not None:
+                        self.requests.level -= 1
+                    if self.tokens is not None:
+                        self.tokens.level -= tokens
+                    return
+            
+            time.sleep(wait)
+    
+    def settle(self, reserved, used):
+        """
+        Correct the token bucket once a call's real usage is known
+        """
+        if self.tokens is not None and used != reserved:
+            with self._lock:
+                self.tokens.level = min(self.tokens.capacity, self.tokens.level + reserved - used)
+    
+    def pause(self, seconds):
+        """
+        Hold every caller for ``seconds``, after the provider pushed back
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
\ No newline at end of file
@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+
+class RoadmapCache:
+    """
+    LRU cache of generated roadmaps keyed on a coarse profile bucket.
+
+    The input form only produces a handful of distinct profiles (percentage in
+    0.5 steps, six ages, five classes, preparation status and subject
+    multiselects), so students whose bucket key matches are served the
+    roadmap generated for the first of them. The school name is free text and
+    is left out of the key; no prompt reads it, so the roadmap is served as
+    generated with only the student profile replaced.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, max_entries=1024, percentage_band=5.0):
+        self.max_entries = max_entries
+        self.percentage_band = percentage_band
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls):
+        """Return the roadmap cache used by every EducationCrew in this process"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    @staticmethod
+    def bucket_key(student_data, percentage_band=5.0):
+        """
+        Canonical, hashable key for a student profile; percentage_band=None
+        keeps the exact percentage
+        """
+        percentage = float(student_data.get('percentage', 0))
+        if percentage_band:
+            percentage = round(percentage // percentage_band * percentage_band, 2)
+        return (
+            percentage,
+            int(student_data.get('age', 0)),
+            student_data.get('current_class', ''),
+            student_data.get('preparation_status', ''),
+            tuple(sorted(student_data.get('strong_subjects') or [])),
+            tuple(sorted(student_data.get('weak_subjects') or [])),
+            tuple(sorted(student_data.get('target_exams') or []))
+        )
+    
+    def key(self, student_data):
+        return self.bucket_key(student_data, self.percentage_band)
+    
+    def get(self, student_data):
+        """
+        Return the cached result for this student's bucket, or None
+        """
+        key = self.key(student_data)
+        with self._lock:
+            roadmap = self._entries.get(key)
+            if roadmap is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        
+        return {'status': 'success', 'roadmap': roadmap, 'student_profile': student_data}
+    
+    def put(self, student_data, result):
+        """
+        Store a successful crew result under the student's bucket
+        """
+        if result.get('status') != 'success':
+            return
+        
+        key = self.key(student_data)
+        with self._lock:
+            self._entries[key] = result['roadmap']
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries)
+        }
\ No newline at end of file
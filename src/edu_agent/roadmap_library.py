@@ -0,0 +1,118 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .models import Roadmap
+from .roadmap_cache import RoadmapCache
+
+DEFAULT_LIBRARY_PATH = os.path.join('.cache', 'edu_agent', 'roadmap_library.sqlite')
+
+# Asked of the LLM for each library hit, so the served roadmap still speaks
+# to the one student
+PERSONAL_NOTE_PROMPT = (
+    "In two or three sentences, address this JEE aspirant directly and say how "
+    "the study roadmap below fits their profile. Student: {profile}\n\n"
+    "Roadmap summary:\n{summary}\n\nNote:"
+)
+
+
+class RoadmapLibrary:
+    """
+    Read-mostly SQLite store of roadmaps keyed on the RoadmapCache profile
+    bucket, filled offline by edu_agent.build_library. Roadmaps are served
+    as generated; EducationCrew addresses them to the student with a note.
+    
+    The percentage band is fixed when the library is created and stored with
+    it, so lookups always bucket students the way the build did.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, path=None, percentage_band=5.0):
+        self.path = path or os.environ.get('EDU_AGENT_ROADMAP_LIBRARY', DEFAULT_LIBRARY_PATH)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS roadmaps (
+                key TEXT PRIMARY KEY,
+                roadmap TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.execute(
+            "INSERT OR IGNORE INTO meta (name, value) VALUES ('percentage_band', ?)",
+            (json.dumps(percentage_band),)
+        )
+        self._conn.commit()
+        self.percentage_band = json.loads(self._conn.execute(
+            "SELECT value FROM meta WHERE name = 'percentage_band'"
+        ).fetchone()[0])
+    
+    @classmethod
+    def shared(cls):
+        """
+        Library for the whole process, at EDU_AGENT_ROADMAP_LIBRARY or the
+        default path under .cache
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    def key(self, student_data):
+        return json.dumps(RoadmapCache.bucket_key(student_data, self.percentage_band))
+    
+    def get(self, student_data):
+        """
+        Return the library result for this student's bucket, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT roadmap FROM roadmaps WHERE key = ?", (self.key(student_data),)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        
+        return {'status': 'success', 'roadmap': Roadmap.from_json(row[0]), 'student_profile': student_data}
+    
+    def put(self, student_data, roadmap):
+        """
+        Store the roadmap generated for ``student_data`` under its bucket
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO roadmaps (key, roadmap, created) VALUES (?, ?, ?)",
+                (self.key(student_data), roadmap.to_json(), time.time())
+            )
+            self._conn.commit()
+    
+    def __contains__(self, student_data):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM roadmaps WHERE key = ?", (self.key(student_data),)
+            ).fetchone() is not None
+    
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM roadmaps").fetchone()[0]
+    
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self)
+        }
\ No newline at end of file
@@ -0,0 +1,238 @@
+import re
+
+from .models import Milestone, Phase, Resource, Roadmap, ScheduleBlock
+
+# Cap on parsed records of each kind; anything past it is noise for the view
+MAX_ITEMS = 16
+
+SUBJECTS = ('Mathematics', 'Physics', 'Chemistry', 'Biology')
+
+# Heading keywords that mark a list of resources other than books
+RESOURCE_KINDS = (
+    ('online', ('online', 'platform', 'course', 'website')),
+    ('video', ('youtube', 'video', 'channel')),
+    ('app', ('app',)),
+    ('practice', ('question bank', 'previous year', 'mock', 'test series')),
+)
+
+# Used for whatever the agents' text does not yield
+DEFAULT_PHASES = (
+    Phase("Foundation Building", "2-3 months", "Strengthen basic concepts in PCM", (
+        "Complete NCERT thoroughly",
+        "Solve basic numerical problems",
+        "Clear conceptual doubts"
+    )),
+    Phase("Concept Development", "4-6 months", "Advanced problem solving", (
+        "Reference book problem solving",
+        "Topic-wise test series",
+        "Formula consolidation"
+    )),
+    Phase("Practice & Revision", "3-4 months", "Mock tests and revision", (
+        "Full-length mock tests",
+        "Previous year papers",
+        "Weak area improvement"
+    ))
+)
+
+DEFAULT_MILESTONES = (
+    Milestone("Month 1", "Complete NCERT (50%)", "Basic Concept Test"),
+    Milestone("Month 2", "Complete NCERT (100%)", "NCERT Based Test"),
+    Milestone("Month 3", "Reference Books (25%)", "Mixed Topic Test"),
+    Milestone("Month 4", "Reference Books (50%)", "Advanced Problems Test"),
+    Milestone("Month 5", "Reference Books (75%)", "Full Syllabus Test 1"),
+    Milestone("Month 6", "Reference Books (100%)", "Full Syllabus Test 2")
+)
+
+DEFAULT_BOOKS = {
+    "Mathematics": (
+        "NCERT Mathematics (Class 11 & 12)",
+        "R.D. Sharma",
+        "Cengage Mathematics",
+        "Arihant Problem Book"
+    ),
+    "Physics": (
+        "NCERT Physics (Class 11 & 12)",
+        "H.C. Verma (Concepts of Physics)",
+        "D.C. Pandey (Arihant)",
+        "Resnick Halliday Krane"
+    ),
+    "Chemistry": (
+        "NCERT Chemistry (Class 11 & 12)",
+        "O.P. Tandon",
+        "Morrison & Boyd (Organic)",
+        "J.D. Lee (Inorganic)"
+    )
+}
+
+_HEADING = re.compile(r'^\s*(#{1,6})\s*(.+?)\s*#*\s*$')
+_BULLET = re.compile(r'^\s*(?:[-*•+]|\d+[.)])\s+(.+)$')
+_PHASE = re.compile(
+    r'^(?:Phase|Stage)\s*(\d+)\s*(?:\(([^)]*)\))?\s*[:.\-–]\s*(.+?)\s*(?:\(([^)]*)\))?$', re.I
+)
+_MILESTONE = re.compile(r'^(Months?\s*\d+(?:\s*[-–]\s*\d+)?)\s*[:\-–]\s*(.+)$', re.I)
+_TIME = r'\d{1,2}(?::\d{2})?\s*(?:[AaPp]\.?[Mm]\.?)?'
+_SCHEDULE = re.compile(rf'^({_TIME}\s*(?:[-–]|to)\s*{_TIME})\s*[:\-–|]?\s*(.+)$')
+
+
+def split_sections(markdown):
+    """
+    ``## Title`` sections of a markdown document as {title: body}
+    """
+    sections = {}
+    title, lines = None, []
+    for line in markdown.splitlines():
+        if line.startswith('## '):
+            if title is not None:
+                sections[title] = '\n'.join(lines).strip()
+            title, lines = line[3:].strip(), []
+        elif title is not None:
+            lines.append(line)
+    if title is not None:
+        sections[title] = '\n'.join(lines).strip()
+    return sections
+
+
+def _plain(text):
+    """Text without markdown emphasis and surrounding punctuation"""
+    return re.sub(r'[*_`]+', '', text).strip(' :-–')
+
+
+def _lines(text):
+    """(kind, content) per non-blank line: 'heading', 'bullet' or 'text'"""
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        match = _HEADING.match(line)
+        if match:
+            yield 'heading', _plain(match.group(2))
+            continue
+        match = _BULLET.match(line)
+        if match:
+            yield 'bullet', _plain(match.group(1))
+        else:
+            yield 'text', _plain(line)
+
+
+def parse_phases(text):
+    phases, current = [], None
+    for kind, content in _lines(text):
+        match = _PHASE.match(content)
+        if match:
+            current = Phase(match.group(3).strip(), (match.group(2) or match.group(4) or '').strip())
+            phases.append(current)
+            if len(phases) == MAX_ITEMS:
+                break
+        elif kind == 'heading':
+            # Bullets under any other heading are not the phase's activities
+            current = None
+        elif current is not None and kind == 'bullet':
+            if re.match(r'focus\s*:', content, re.I):
+                current.focus = content.split(':', 1)[1].strip()
+            elif len(current.activities) < MAX_ITEMS:
+                current.activities += (content,)
+    return phases
+
+
+def parse_milestones(text):
+    milestones = []
+    for _, content in _lines(text):
+        match = _MILESTONE.match(content)
+        if not match:
+            continue
+        target, test = match.group(2).strip(), ''
+        # "target - Test: name" or "target | name"
+        parts = re.split(r'\s+[-–|]\s+|;\s*', target)
+        if len(parts) > 1 and 'test' in parts[-1].lower():
+            target = ' - '.join(parts[:-1])
+            test = re.sub(r'^test\s*:\s*', '', parts[-1], flags=re.I)
+        milestones.append(Milestone(match.group(1), target, test))
+        if len(milestones) == MAX_ITEMS:
+            break
+    return milestones
+
+
+def parse_schedule(text):
+    blocks = []
+    for _, content in _lines(text):
+        match = _SCHEDULE.match(content)
+        if not match:
+            continue
+        time_range, rest = match.group(1).strip(), match.group(2).strip()
+        subject = ''
+        inner = re.match(r'^(.+?)\s*\(([^)]+)\)$', rest)
+        if inner:
+            rest, subject = inner.group(1), inner.group(2)
+        elif ' - ' in rest:
+            rest, subject = rest.split(' - ', 1)
+        # Only the first day of a listing that repeats the same times
+        if any(block.time == time_range for block in blocks):
+            break
+        blocks.append(ScheduleBlock(time_range, rest.strip(), subject.strip()))
+        if len(blocks) == MAX_ITEMS:
+            break
+    return blocks
+
+
+def parse_resources(text, subject='General'):
+    """
+    Bulleted titles under subject or resource-type headings; bullets before
+    the first such heading count as general books unless ``subject`` is None
+    """
+    resources = []
+    kind = 'book'
+    for line_kind, content in _lines(text):
+        if line_kind != 'bullet':
+            lowered = content.lower()
+            named = [s for s in SUBJECTS if s.lower() in lowered]
+            other = [k for k, words in RESOURCE_KINDS if any(word in lowered for word in words)]
+            if named or other:
+                subject = named[0] if named else 'General'
+                kind = other[0] if other else 'book'
+            elif line_kind == 'heading':
+                # Bullets under unrelated headings are not resources
+                subject = None
+            continue
+        if subject is None:
+            continue
+        # Keep the title, not the reason given after it
+        title = re.split(r'\s+[-–]\s+|:\s+', content, maxsplit=1)[0].strip()
+        if title:
+            resources.append(Resource(subject, title, kind))
+        if len(resources) == MAX_ITEMS * 4:
+            break
+    return resources
+
+
+def _source(sections, title):
+    """A section's text, or the whole roadmap when there is no such section"""
+    if title in sections:
+        return sections[title]
+    return '\n\n'.join(f"## {name}\n\n{text}" for name, text in sections.items())
+
+
+def default_schedule(student_data):
+    """The local optimizer's timetable for a weekday"""
+    # Imported here so parsing a roadmap does not load numpy
+    from .schedule_optimizer import optimize_day
+    return optimize_day(student_data)
+
+
+def parse_roadmap(sections, student_data):
+    """
+    Build a Roadmap from the agents' per-section markdown, falling back to
+    the standard plan for any part the text does not yield
+    """
+    plan = _source(sections, 'Study Roadmap')
+    resources = parse_resources(
+        _source(sections, 'Recommended Resources'),
+        'General' if 'Recommended Resources' in sections else None
+    )
+    if not any(resource.kind == 'book' for resource in resources):
+        resources += [Resource(subject, title) for subject, titles in DEFAULT_BOOKS.items() for title in titles]
+    return Roadmap(
+        sections=dict(sections),
+        phases=parse_phases(plan) or list(DEFAULT_PHASES),
+        milestones=parse_milestones(plan) or list(DEFAULT_MILESTONES),
+        schedule=parse_schedule(_source(sections, 'Study Schedule')) or default_schedule(student_data),
+        resources=resources
+    )
\ No newline at end of file
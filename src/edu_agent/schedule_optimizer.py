@@ -0,0 +1,320 @@
+from .allocation import COLUMNS, DAYS, STAGES, SUBJECTS, allocate_profiles, stage
+from .models import ScheduleBlock
+
+# The day is planned in half-hour slots from 6:00 AM to 11:00 PM
+SLOT_MINUTES = 30
+DAY_START = 6 * 60
+DAY_END = 23 * 60
+SLOTS = (DAY_END - DAY_START) // SLOT_MINUTES
+
+# Fixed blocks as (start, end, activity, subject), in minutes from midnight
+SCHOOL_DAY = (
+    (7 * 60, 8 * 60, "Get Ready for School", "Preparation"),
+    (8 * 60, 14 * 60, "School Hours", "Attend Classes"),
+    (14 * 60, 15 * 60, "Lunch & Rest", "Break"),
+    (20 * 60, 21 * 60, "Dinner & Family Time", "Break"),
+)
+HOME_DAY = (
+    (7 * 60, 8 * 60, "Exercise & Breakfast", "Health"),
+    (13 * 60 + 30, 14 * 60 + 30, "Lunch & Rest", "Break"),
+    (20 * 60, 21 * 60, "Dinner & Family Time", "Break"),
+)
+WEEKEND = ('Saturday', 'Sunday')
+
+# Longest sitting in slots; JEE Advanced papers reward long problem-solving
+# sessions, so its aspirants get three hours instead of two
+MAX_SESSION = 4
+MAX_ADVANCED_SESSION = 6
+MAX_REVISION = 2
+HOMEWORK_SLOTS = 2
+
+# Exams sat against the clock; their revision turns into timed practice
+SPEED_EXAMS = ('BITSAT', 'VITEEE', 'COMEDK')
+
+# Value of a slot of each kind of session, scaled by how alert a student is
+# at that time of day
+WEAK_WEIGHT = 1.5
+STRONG_WEIGHT = 0.8
+REVISION_WEIGHT = 0.4
+HOMEWORK_WEIGHT = 0.3
+# Per slot of revision that opens or closes the study day
+EDGE_BONUS = 0.8
+# Per pair of back-to-back sessions of the same kind
+REPEAT_PENALTY = 0.5
+# Rounds of local search after the greedy placement
+MAX_ROUNDS = 20
+
+
+def _alertness(minute):
+    hour = minute / 60
+    if hour < 12:
+        return 1.0
+    if hour < 15:
+        return 0.7
+    if hour < 19:
+        return 0.9
+    if hour < 21:
+        return 0.8
+    return 0.6
+
+
+ALERTNESS = [_alertness(DAY_START + slot * SLOT_MINUTES) for slot in range(SLOTS)]
+
+
+def format_range(start, end):
+    """'6:00 - 7:00 AM' or '8:00 AM - 2:00 PM' for minutes from midnight"""
+    def clock(minute):
+        hour, minute = divmod(minute, 60)
+        return f"{(hour - 1) % 12 + 1}:{minute:02d}", 'AM' if hour < 12 else 'PM'
+    
+    (first, first_half), (last, last_half) = clock(start), clock(end)
+    if first_half == last_half:
+        return f"{first} - {last} {last_half}"
+    return f"{first} {first_half} - {last} {last_half}"
+
+
+class DayPlan:
+    """
+    One day's timetable: fixed blocks, then study sessions placed around
+    them.
+    
+    A session is a sitting on one kind of work: a subject, 'Revision' or
+    'Homework'. Two sessions never touch, so every sitting is followed by
+    at least a half-hour break. ``place`` is the greedy pass: revision
+    opens and closes the day, then every gap is filled from its start with
+    the most valuable work still owed. ``improve`` is the local search: it
+    moves single sessions and swaps the work of equally long ones while
+    that raises the plan's value.
+    """
+    def __init__(self, fixed, weights):
+        self.fixed = fixed
+        self.weights = weights
+        self.free = [True] * SLOTS
+        for start, end, _, _ in fixed:
+            for slot in range(max(0, (start - DAY_START) // SLOT_MINUTES),
+                              min(SLOTS, (end - DAY_START) // SLOT_MINUTES)):
+                self.free[slot] = False
+        open_slots = [slot for slot in range(SLOTS) if self.free[slot]]
+        self.first = open_slots[0] if open_slots else 0
+        self.last = open_slots[-1] if open_slots else 0
+        # (kind, start, slots) of every placed session
+        self.sessions = []
+        # kind -> slots that did not fit
+        self.unplaced = {}
+    
+    def _value(self, kind, start, slots):
+        value = self.weights[kind] * sum(ALERTNESS[start:start + slots])
+        if kind == 'Revision' and (start == self.first or start + slots - 1 == self.last):
+            value += EDGE_BONUS * slots
+        return value
+    
+    def value(self):
+        """Alertness-weighted worth of the placed sessions"""
+        total = sum(self._value(*session) for session in self.sessions)
+        ordered = sorted(self.sessions, key=lambda session: session[1])
+        repeats = sum(a[0] == b[0] for a, b in zip(ordered, ordered[1:]))
+        return total - REPEAT_PENALTY * repeats
+    
+    def _fits(self, start, slots, sessions):
+        if start < 0 or start + slots > SLOTS:
+            return False
+        if not all(self.free[start:start + slots]):
+            return False
+        # Keep a break on either side
+        for _, other, length in sessions:
+            if other <= start + slots and start <= other + length:
+                return False
+        return True
+    
+    def _starts(self, slots, sessions):
+        return [start for start in range(SLOTS - slots + 1) if self._fits(start, slots, sessions)]
+    
+    def _room(self, start):
+        """Longest session that could start at ``start``"""
+        slots = 0
+        while self._fits(start, slots + 1, self.sessions):
+            slots += 1
+        return slots
+    
+    def place(self, demand, longest):
+        """
+        Schedule ``demand`` (kind -> slots) in sittings of at most
+        ``longest[kind]`` slots; what finds no room is left in ``unplaced``
+        """
+        demand = {kind: slots for kind, slots in demand.items() if slots > 0}
+        
+        # Revision first thing in the morning and last thing at night
+        for edge in (self.first, self.last):
+            slots = min(demand.get('Revision', 0), longest['Revision'])
+            if edge == self.last:
+                while slots and not self._fits(edge - slots + 1, slots, self.sessions):
+                    slots -= 1
+                edge -= slots - 1
+            else:
+                slots = min(slots, self._room(edge))
+            if slots:
+                self.sessions.append(('Revision', edge, slots))
+                demand['Revision'] -= slots
+        
+        # School homework is due tomorrow whatever else gives way; it takes
+        # the latest sitting that fits, leaving the alert hours for JEE work
+        slots = demand.pop('Homework', 0)
+        starts = self._starts(slots, self.sessions) if slots else []
+        if starts:
+            self.sessions.append(('Homework', starts[-1], slots))
+        elif slots:
+            demand['Homework'] = slots
+        
+        previous = None
+        for start in range(SLOTS):
+            room = self._room(start)
+            owed = [kind for kind, slots in demand.items() if slots > 0]
+            if not room or not owed:
+                continue
+            # Alternate subjects where possible
+            kind = max(owed, key=lambda kind: (kind != previous, self.weights[kind], demand[kind]))
+            slots = min(demand[kind], longest[kind], room)
+            self.sessions.append((kind, start, slots))
+            demand[kind] -= slots
+            previous = kind
+        self.unplaced = {kind: slots for kind, slots in demand.items() if slots > 0}
+        return self
+    
+    def improve(self):
+        best = self.value()
+        for _ in range(MAX_ROUNDS):
+            improved = False
+            # Move one session to a better start
+            for i in range(len(self.sessions)):
+                kind, start, slots = self.sessions[i]
+                others = self.sessions[:i] + self.sessions[i + 1:]
+                for candidate in self._starts(slots, others):
+                    trial = list(self.sessions)
+                    trial[i] = (kind, candidate, slots)
+                    value = self._evaluate(trial)
+                    if value > best + 1e-9:
+                        self.sessions, best, improved = trial, value, True
+                        break
+            # Swap what two equally long sessions study
+            for i in range(len(self.sessions)):
+                for j in range(i + 1, len(self.sessions)):
+                    a, b = self.sessions[i], self.sessions[j]
+                    if a[0] == b[0] or a[2] != b[2]:
+                        continue
+                    trial = list(self.sessions)
+                    trial[i], trial[j] = (b[0], a[1], a[2]), (a[0], b[1], b[2])
+                    value = self._evaluate(trial)
+                    if value > best + 1e-9:
+                        self.sessions, best, improved = trial, value, True
+            if not improved:
+                break
+        return self
+    
+    def _evaluate(self, sessions):
+        kept, self.sessions = self.sessions, sessions
+        try:
+            return self.value()
+        finally:
+            self.sessions = kept
+    
+    def blocks(self, revision_activity=None):
+        """The timetable as ScheduleBlocks in time order"""
+        # (start, end, activity, subject, is a study session)
+        items = [(start, end, activity, subject, False) for start, end, activity, subject in self.fixed]
+        number = 0
+        for kind, start, slots in sorted(self.sessions, key=lambda session: session[1]):
+            begin = DAY_START + start * SLOT_MINUTES
+            if kind in SUBJECTS:
+                number += 1
+                label = f"Study Session {number}", kind
+            else:
+                label = _label(kind, begin, revision_activity)
+            items.append((begin, begin + slots * SLOT_MINUTES) + label + (True,))
+        items.sort()
+        
+        # Short gaps next to a sitting are breaks, the rest free time; the
+        # day starts with the first block and ends with the last
+        blocks = []
+        for current, following in zip(items, items[1:] + [None]):
+            blocks.append(ScheduleBlock(format_range(current[0], current[1]), current[2], current[3]))
+            if following is None or following[0] <= current[1]:
+                continue
+            if (current[4] or following[4]) and following[0] - current[1] <= 2 * SLOT_MINUTES:
+                activity, subject = "Break", "Rest"
+            else:
+                activity, subject = "Free Time", "Recreation"
+            blocks.append(ScheduleBlock(format_range(current[1], following[0]), activity, subject))
+        return blocks
+
+
+def _label(kind, begin, revision_activity):
+    """Activity and subject of a revision or homework sitting"""
+    if kind == 'Homework':
+        return "School Homework", "School Work"
+    if begin < 12 * 60:
+        return "Morning Revision", "Previous day topics"
+    return revision_activity or ("Revision & Notes", "Day's Summary")
+
+
+def plan_day(student_data, day='Monday', hours=None):
+    """
+    DayPlan for one day of the week; ``hours`` is that day's row of
+    allocation.allocate_profiles, computed when not given
+    """
+    if hours is None:
+        hours = allocate_profiles([student_data])[0][DAYS.index(day)]
+    exams = student_data.get('target_exams') or ()
+    weak = student_data.get('weak_subjects') or ()
+    strong = student_data.get('strong_subjects') or ()
+    at_school = day not in WEEKEND and STAGES[stage(student_data.get('current_class'))] != 'dropper'
+    
+    slots_per_hour = 60 // SLOT_MINUTES
+    demand = {column: round(column_hours * slots_per_hour) for column, column_hours in zip(COLUMNS, hours)}
+    demand['Homework'] = HOMEWORK_SLOTS if at_school else 0
+    
+    session = MAX_ADVANCED_SESSION if 'JEE Advanced' in exams else MAX_SESSION
+    longest = {subject: session for subject in SUBJECTS}
+    longest.update(Revision=MAX_REVISION, Homework=HOMEWORK_SLOTS)
+    
+    weights = {'Revision': REVISION_WEIGHT, 'Homework': HOMEWORK_WEIGHT}
+    for subject in SUBJECTS:
+        weights[subject] = WEAK_WEIGHT if subject in weak else STRONG_WEIGHT if subject in strong else 1.0
+    return DayPlan(SCHOOL_DAY if at_school else HOME_DAY, weights).place(demand, longest).improve()
+
+
+def _revision_activity(student_data):
+    if any(exam in SPEED_EXAMS for exam in student_data.get('target_exams') or ()):
+        return "Timed Practice", "Speed tests"
+    return None
+
+
+def optimize_day(student_data, day='Monday'):
+    """A student's timetable for one day of the week, as ScheduleBlocks"""
+    return plan_day(student_data, day).blocks(_revision_activity(student_data))
+
+
+def optimize_week(student_data):
+    """day -> ScheduleBlocks for every day of the week"""
+    hours = allocate_profiles([student_data])[0]
+    revision_activity = _revision_activity(student_data)
+    return {
+        day: plan_day(student_data, day, day_hours).blocks(revision_activity)
+        for day, day_hours in zip(DAYS, hours)
+    }
+
+
+def schedule_markdown(student_data):
+    """
+    The Study Schedule section the timeline optimizer agent would write:
+    Monday's timetable as "- time: activity (subject)" bullets, then the
+    study hours of every day
+    """
+    week = allocate_profiles([student_data])[0]
+    blocks = plan_day(student_data, DAYS[0], week[0]).blocks(_revision_activity(student_data))
+    lines = ["### Daily Schedule", ""]
+    lines += [f"- {block.time}: {block.activity} ({block.subject})" for block in blocks]
+    lines += ["", "### Weekly Plan", ""]
+    for day, day_hours in zip(DAYS, week):
+        hours = ', '.join(f"{column} {h:g}h" for column, h in zip(COLUMNS, day_hours) if h)
+        lines.append(f"- {day}: {hours}")
+    return '\n'.join(lines)
\ No newline at end of file
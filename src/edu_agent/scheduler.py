@@ -0,0 +1,218 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .metrics import TaskStats, bind_task_stats
+from .rate_limit import backoff_delay, is_retryable
+from .streaming import bind_token_sink
+
+class TaskFailed(RuntimeError):
+    """
+    A task failed for good. ``outputs`` holds what every task produced
+    before the run stopped, None for the tasks that did not finish.
+    """
+    def __init__(self, message, index, outputs):
+        super().__init__(message)
+        self.index = index
+        self.outputs = outputs
+
+
+class TaskScheduler:
+    """
+    Run crewai Tasks as a dependency graph instead of a fixed sequence.
+
+    A task starts as soon as the tasks it reads from have finished and
+    independent tasks run side by side, so wall time follows the critical
+    path of the graph rather than the sum of every LLM round-trip. The graph
+    is either given explicitly, with the scheduler assembling each task's
+    context from its upstream outputs, or read from each task's crewai
+    ``context`` list, in which case crewai assembles the context itself.
+
+    Scheduling happens on the caller's event loop. The blocking LLM calls
+    inside Task.execute run on one bounded thread pool shared by every run
+    that goes through this scheduler, so concurrent generations do not each
+    hold a thread of their own.
+    """
+    def __init__(self, max_workers=16, metrics=None, retries=3, backoff_base=1.0):
+        self.max_workers = max_workers
+        # Transient LLM errors are retried with jittered exponential backoff
+        self.retries = retries
+        self.backoff_base = backoff_base
+        # MetricsRegistry receiving per-task timings and usage, if any
+        self.metrics = metrics
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='edu-agent')
+    
+    @staticmethod
+    def dependencies(tasks):
+        """
+        Map each task index to the indices of the tasks it depends on
+        """
+        index = {id(task): i for i, task in enumerate(tasks)}
+        graph = {}
+        for i, task in enumerate(tasks):
+            deps = []
+            for upstream in task.context or []:
+                if id(upstream) not in index:
+                    raise ValueError(f"Task {i} depends on a task that is not scheduled")
+                deps.append(index[id(upstream)])
+            graph[i] = deps
+        return graph
+    
+    @staticmethod
+    def _role(task, index):
+        return task.agent.role if task.agent is not None else f"task {index}"
+    
+    @staticmethod
+    def topological_order(graph):
+        """
+        Kahn's algorithm; raises ValueError when the graph has a cycle
+        """
+        remaining = {i: len(deps) for i, deps in graph.items()}
+        dependents = {i: [] for i in graph}
+        for i, deps in graph.items():
+            for dep in deps:
+                dependents[dep].append(i)
+        
+        ready = [i for i, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            i = ready.pop(0)
+            order.append(i)
+            for child in dependents[i]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        
+        if len(order) != len(graph):
+            raise ValueError("Task dependencies contain a cycle")
+        return order
+    
+    def run(self, tasks, **kwargs):
+        """
+        Blocking wrapper around arun for callers without an event loop
+        """
+        return asyncio.run(self.arun(tasks, **kwargs))
+    
+    def _execute(self, task, index, name, on_event, context, ready_at, attempt=0):
+        """Run one task on a worker thread, reporting progress to on_event"""
+        started_at = time.perf_counter()
+        kwargs = {'context': context} if context else {}
+        sink = (lambda token: on_event(index, 'token', token)) if on_event else None
+        status = 'error'
+        stats = TaskStats()
+        stats.retries = 1 if attempt else 0
+        
+        with bind_task_stats(stats), bind_token_sink(sink):
+            try:
+                if on_event:
+                    on_event(index, 'start', None)
+                output = task.execute(**kwargs)
+                status = 'success'
+            finally:
+                if self.metrics is not None:
+                    self.metrics.observe_task(
+                        name, started_at - ready_at, time.perf_counter() - started_at, stats, status
+                    )
+        
+        if on_event:
+            on_event(index, 'done', output)
+        return output
+    
+    async def arun(self, tasks, graph=None, parallel=True, timeout=None, on_event=None,
+                   build_context=None, names=None, done=None, workers=None):
+        """
+        Execute every task and return their outputs in the order given.
+
+        With parallel=False the tasks run one at a time in dependency order.
+        ``timeout`` bounds each attempt of a task in seconds. A task that
+        fails with a transient LLM error is retried up to ``retries`` times
+        after a jittered exponential backoff; any other failure, a timeout or
+        running out of retries raises TaskFailed, carrying the outputs of the
+        tasks that did finish, and the rest of the run is cancelled. The
+        worker thread of a timed out or cancelled task is not interrupted,
+        its result is simply discarded when the LLM call returns.
+        
+        ``on_event(index, event, payload)`` is called from the worker thread
+        with 'start', then 'token' for every streamed token, then 'done' with
+        the task output.
+        
+        ``graph`` maps each task index to the indices it depends on. With an
+        explicit graph, ``build_context(index, [(dep, output), ...])`` turns
+        the upstream outputs into the context string for the task; without
+        it the outputs are joined in full.
+        
+        ``names`` label each task in the metrics; the agent role is used
+        when they are not given.
+        
+        ``done`` maps the indices of tasks whose output is already known to
+        that output. They are not executed; their output is reported with a
+        single 'done' event and passed on to their dependents as usual.
+        
+        ``workers``, when given, is a list that receives the concurrent
+        future of every attempt, so the caller can tell when the worker
+        threads are really done with the tasks.
+        """
+        if graph is None:
+            graph = self.dependencies(tasks)
+        elif build_context is None:
+            build_context = lambda index, upstream: "\n".join(output for _, output in upstream)
+        order = self.topological_order(graph)
+        outputs = [None] * len(tasks)
+        loop = asyncio.get_running_loop()
+        done = done or {}
+        
+        async def execute(i):
+            if i in done:
+                outputs[i] = done[i]
+                if on_event is not None:
+                    on_event(i, 'done', outputs[i])
+                return
+            
+            context = None
+            if build_context is not None and graph[i]:
+                context = build_context(i, [(dep, outputs[dep]) for dep in graph[i]])
+            name = names[i] if names else self._role(tasks[i], i)
+            
+            for attempt in range(self.retries + 1):
+                worker = self._executor.submit(
+                    self._execute, tasks[i], i, name, on_event, context, time.perf_counter(), attempt
+                )
+                if workers is not None:
+                    workers.append(worker)
+                future = asyncio.wrap_future(worker, loop=loop)
+                try:
+                    outputs[i] = await asyncio.wait_for(future, timeout)
+                    return
+                except asyncio.TimeoutError:
+                    raise TaskFailed(
+                        f"{self._role(tasks[i], i)} did not finish within {timeout}s", i, outputs
+                    ) from None
+                except Exception as e:
+                    if attempt == self.retries or not is_retryable(e):
+                        raise TaskFailed(str(e), i, outputs) from e
+                
+                await asyncio.sleep(backoff_delay(attempt, self.backoff_base))
+        
+        if not parallel:
+            for i in order:
+                await execute(i)
+            return outputs
+        
+        running = {}
+        
+        async def node(i):
+            for dep in graph[i]:
+                await running[dep]
+            await execute(i)
+        
+        for i in order:
+            running[i] = asyncio.ensure_future(node(i))
+        try:
+            await asyncio.gather(*running.values())
+        except BaseException:
+            for future in running.values():
+                future.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
+            raise
+        
+        return outputs
\ No newline at end of file
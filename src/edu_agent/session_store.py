@@ -0,0 +1,208 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import suppress
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_PATH = os.path.join('.cache', 'edu_agent', 'sessions.sqlite')
+
+# Queue markers for the writer thread
+_FLUSH = object()
+_STOP = object()
+
+
+class MemorySessionStore:
+    """
+    Process-local session history, at most ``max_per_user`` submissions per
+    user; for tests and deployments without a writable disk
+    """
+    def __init__(self, max_per_user=50):
+        self.max_per_user = max_per_user
+        self._sessions = defaultdict(lambda: deque(maxlen=self.max_per_user))
+        self._lock = threading.Lock()
+    
+    def record(self, user_id, student_data, timestamp=None):
+        with self._lock:
+            self._sessions[user_id].append((timestamp or time.time(), student_data))
+    
+    def history(self, user_id, limit=20):
+        """
+        Latest submissions of a user, newest first, as {'timestamp', 'student_data'}
+        """
+        with self._lock:
+            entries = list(self._sessions.get(user_id, ()))[-limit:]
+        return [{'timestamp': ts, 'student_data': data} for ts, data in reversed(entries)]
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        pass
+
+
+class SessionStore:
+    """
+    Submission history per user in SQLite.
+    
+    ``record`` only queues the submission; a writer thread commits queued
+    submissions in batches, every ``flush_interval`` seconds or once
+    ``batch_size`` are waiting, so a form submit never waits on the disk.
+    The database runs in WAL mode, so reads are not blocked by the writer,
+    and is indexed on (user_id, created). Every ``compact_interval`` seconds
+    the writer drops submissions older than ``retention`` seconds and all
+    but the newest ``max_per_user`` of each user, then checkpoints the WAL.
+    """
+    def __init__(self, path=None, batch_size=64, flush_interval=1.0, retention=180 * 24 * 3600,
+                 max_per_user=50, compact_interval=3600):
+        self.path = path or os.environ.get('EDU_AGENT_SESSION_STORE', DEFAULT_SESSION_PATH)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention = retention
+        self.max_per_user = max_per_user
+        self.compact_interval = compact_interval
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                created REAL NOT NULL,
+                student_data TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sessions_user ON sessions (user_id, created)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sessions_created ON sessions (created)")
+        self._conn.commit()
+        
+        self._compacted = 0.0
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name='session-store', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+    
+    def record(self, user_id, student_data, timestamp=None):
+        """
+        Queue one submission for writing
+        """
+        data = json.dumps(student_data, separators=(',', ':'))
+        self._queue.put((str(user_id), timestamp or time.time(), data))
+    
+    def history(self, user_id, limit=20):
+        """
+        Latest submissions of a user, newest first, as {'timestamp', 'student_data'}
+        """
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT created, student_data FROM sessions WHERE user_id = ? "
+                "ORDER BY created DESC LIMIT ?", (str(user_id), limit)
+            ).fetchall()
+        return [{'timestamp': created, 'student_data': json.loads(data)} for created, data in rows]
+    
+    def flush(self):
+        """
+        Block until everything queued so far is committed
+        """
+        if not self._closed:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+    
+    def close(self):
+        """
+        Commit what is queued and stop the writer
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+    
+    def _write_loop(self):
+        while True:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._queue.task_done()
+                    self._write(batch)
+                    return
+                if item is _FLUSH:
+                    # Write now rather than at the end of the interval
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+            
+            self._write(batch)
+            if time.time() - self._compacted > self.compact_interval:
+                try:
+                    self.compact()
+                except sqlite3.Error as e:
+                    # Tried again after the next interval
+                    logger.error("Session store compaction failed: %s", e)
+                    self._compacted = time.time()
+    
+    def _write(self, batch):
+        if not batch:
+            return
+        try:
+            with self._lock:
+                try:
+                    self._conn.executemany(
+                        "INSERT INTO sessions (user_id, created, student_data) VALUES (?, ?, ?)", batch
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    # History is best effort: drop the batch, keep the writer alive
+                    logger.error("Dropped %d session records: %s", len(batch), e)
+                    with suppress(sqlite3.Error):
+                        self._conn.rollback()
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+    
+    def compact(self):
+        """
+        Apply the retention limits and checkpoint the WAL
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE created < ?", (time.time() - self.retention,))
+            self._conn.execute("""
+                DELETE FROM sessions WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY created DESC) AS n
+                        FROM sessions
+                    ) WHERE n > ?
+                )
+            """, (self.max_per_user,))
+            self._conn.commit()
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._compacted = time.time()
+
+
+def open_session_store(location=None):
+    """
+    Session store for EDU_AGENT_SESSION_STORE: 'memory' for the process-local
+    store, otherwise the path of the SQLite database
+    """
+    location = location or os.environ.get('EDU_AGENT_SESSION_STORE', DEFAULT_SESSION_PATH)
+    if location == 'memory':
+        return MemorySessionStore()
+    return SessionStore(location)
\ No newline at end of file
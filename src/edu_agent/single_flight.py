@@ -0,0 +1,41 @@
+import threading
+from concurrent.futures import Future
+
+class SingleFlight:
+    """
+    Registry of in-flight calls, one per key.
+
+    The first caller for a key becomes its leader and gets a new Future to
+    resolve; callers arriving while it is pending get the same Future and
+    wait on it instead of doing the work again. concurrent.futures.Future is
+    used rather than an asyncio one so callers on different event loops (the
+    job queue, batch workers, blocking wrappers) can share a flight through
+    asyncio.wrap_future.
+    """
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+    
+    def join(self, key):
+        """
+        Return ``(future, leader)`` for ``key``; leader is True for the
+        caller that must resolve the future and then call ``land``
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                return future, False
+            future = self._flights[key] = Future()
+            return future, True
+    
+    def land(self, key, future):
+        """
+        Forget a resolved flight so later callers start a new one
+        """
+        with self._lock:
+            if self._flights.get(key) is future:
+                del self._flights[key]
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._flights)
\ No newline at end of file
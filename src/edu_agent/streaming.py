@@ -0,0 +1,35 @@
+import contextvars
+from contextlib import contextmanager
+
+# Receives the tokens of whichever task is executing in the current thread
+_token_sink = contextvars.ContextVar('edu_agent_token_sink', default=None)
+
+@contextmanager
+def bind_token_sink(sink):
+    """
+    Route tokens generated in this context to ``sink(token)``
+    """
+    reset_token = _token_sink.set(sink)
+    try:
+        yield
+    finally:
+        _token_sink.reset(reset_token)
+
+
+def emit_token(token):
+    """
+    Hand a streamed token to the sink bound to the running task, if any
+    """
+    sink = _token_sink.get()
+    if sink is not None:
+        sink(token)
+
+
+def final_answer(text):
+    """
+    Strip the agent's ReAct preamble from a partially streamed completion
+    """
+    marker = 'Final Answer:'
+    if marker in text:
+        return text.split(marker, 1)[1].lstrip()
+    return text
\ No newline at end of file
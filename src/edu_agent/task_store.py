@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_STORE_PATH = os.path.join('.cache', 'edu_agent', 'task_outputs.sqlite')
+
+class TaskOutputStore:
+    """
+    Last output of every task per student, stored in SQLite next to the
+    fingerprint of the inputs it was generated from.
+    
+    EducationCrew loads a student's entries before a run and reuses every
+    output whose fingerprint still matches, so updating one profile field
+    only reruns the tasks that read it and the tasks downstream of them.
+    
+    Entries older than ``retention`` seconds are never reused. Every
+    ``prune_interval`` seconds a save drops them, and the oldest entries
+    beyond ``max_entries``, from the database.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, path=None, retention=30 * 24 * 3600, max_entries=200000, prune_interval=3600):
+        self.path = path or os.environ.get('EDU_AGENT_TASK_STORE', DEFAULT_STORE_PATH)
+        self.retention = retention
+        self.max_entries = max_entries
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._pruned = 0.0
+        
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS task_outputs (
+                student_id TEXT NOT NULL,
+                task TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                output TEXT NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (student_id, task)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS task_outputs_updated ON task_outputs (updated)")
+        self._conn.commit()
+    
+    @classmethod
+    def shared(cls):
+        """
+        Store for the whole process, at EDU_AGENT_TASK_STORE or the default
+        path under .cache
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
+    def load(self, student_id):
+        """
+        task name -> (fingerprint, output) for a student
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task, fingerprint, output FROM task_outputs WHERE student_id = ? AND updated >= ?",
+                (str(student_id), time.time() - self.retention)
+            ).fetchall()
+        return {task: (fingerprint, output) for task, fingerprint, output in rows}
+    
+    def save(self, student_id, entries):
+        """
+        Store task name -> (fingerprint, output) entries for a student
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO task_outputs (student_id, task, fingerprint, output, updated) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(str(student_id), task, fingerprint, output, now)
+                 for task, (fingerprint, output) in entries.items()]
+            )
+            self._conn.commit()
+        if now - self._pruned > self.prune_interval:
+            self.prune()
+    
+    def prune(self):
+        """
+        Delete expired entries and the oldest entries beyond max_entries
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM task_outputs WHERE updated < ?", (time.time() - self.retention,))
+            self._conn.execute("""
+                DELETE FROM task_outputs WHERE rowid IN (
+                    SELECT rowid FROM task_outputs ORDER BY updated DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+            self._conn.commit()
+        self._pruned = time.time()
+    
+    def forget(self, student_id):
+        with self._lock:
+            self._conn.execute("DELETE FROM task_outputs WHERE student_id = ?", (str(student_id),))
+            self._conn.commit()
\ No newline at end of file
@@ -1,84 +1,105 @@
+import hashlib
+import json
+
 from crewai import Task
 
+from .config import TASK_NAMES, PromptConfig
+from .prompts import PromptAssembler
+
 class EducationTasks:
-    def __init__(self, agents):
+    # Agent in agents.yaml that answers each task
+    ROLES = {
+        'analyze_academic_profile': 'academic_analyzer',
+        'create_study_roadmap': 'study_planner',
+        'recommend_resources': 'resource_curator',
+        'optimize_study_schedule': 'timeline_optimizer',
+    }
+    
+    def __init__(self, agents, config=None):
         self.agents = agents
+        # Descriptions are precompiled templates from config/tasks.yaml
+        self.config = config or PromptConfig.shared()
+        self._prompts = None
     
-    def analyze_academic_profile_task(self, student_data):
+    def prompts(self, student_data):
+        """Shared prompt pieces for this student, built once per roadmap"""
+        if self._prompts is None or self._prompts.student_data is not student_data:
+            self._prompts = PromptAssembler(student_data)
+        return self._prompts
+    
+    def graph(self):
+        """
+        Task index -> indices of the tasks it reads from, with tasks numbered
+        in TASK_NAMES order as declared by ``context`` in tasks.yaml
+        """
+        specs = self.config.tasks()
+        return {
+            i: [TASK_NAMES.index(dep) for dep in specs[name]['context']]
+            for i, name in enumerate(TASK_NAMES)
+        }
+    
+    def fingerprints(self, student_data):
+        """
+        One hash per task, in TASK_NAMES order, of everything its output
+        depends on: its input fields, its prompt, the role, goal and backstory
+        of its agent, the LLM answering it and the fingerprints of the tasks
+        it reads from. A task whose fingerprint is unchanged would be asked
+        the same question again.
+        """
+        specs = self.config.tasks()
+        agents = self.config.agents()
+        llm = self.agents.llm
+        model = {
+            'backend': llm._llm_type,
+            'model': getattr(llm, 'model_name', None),
+            'temperature': getattr(llm, 'temperature', None)
+        }
+        prints = {}
+        
+        def fingerprint(name):
+            if name not in prints:
+                prints[name] = None
+                spec = specs[name]
+                payload = json.dumps([
+                    {field: student_data.get(field) for field in spec['inputs']},
+                    spec['description'].text,
+                    spec['expected_output'],
+                    agents[self.ROLES[name]],
+                    model,
+                    [fingerprint(dep) for dep in spec['context']]
+                ], sort_keys=True, default=str)
+                prints[name] = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+            if prints[name] is None:
+                raise ValueError("Task dependencies contain a cycle")
+            return prints[name]
+        
+        return [fingerprint(name) for name in TASK_NAMES]
+    
+    def _task(self, name, agent, student_data):
+        spec = self.config.tasks()[name]
+        values = self.prompts(student_data).values_for(spec['inputs'])
         return Task(
-            description=f"""
-            Analyze the student's academic profile based on the following information:
-            - Academic Percentage: {student_data['percentage']}%
-            - School Name: {student_data['school_name']}
-            - Age: {student_data['age']} years
-            
-            Provide insights on:
-            1. Current academic standing and strengths
-            2. Gaps that need to be addressed for JEE preparation
-            3. Realistic expectations based on current performance
-            4. Recommended preparation intensity level
-            """,
-            agent=self.agents.academic_analyzer_agent(),
-            expected_output="Detailed academic analysis with strengths, weaknesses, and preparation recommendations"
+            description=spec['description'].render(values),
+            agent=agent,
+            expected_output=spec['expected_output']
+        )
+    
+    def analyze_academic_profile_task(self, student_data):
+        return self._task(
+            'analyze_academic_profile', self.agents.academic_analyzer_agent(), student_data
         )
     
     def create_study_roadmap_task(self, student_data):
-        return Task(
-            description=f"""
-            Create a comprehensive study roadmap for JEE preparation considering:
-            - Student's current academic level: {student_data['percentage']}%
-            - Age: {student_data['age']} years (to determine available preparation time)
-            - School background: {student_data['school_name']}
-            
-            The roadmap should include:
-            1. Phase-wise preparation strategy
-            2. Subject-wise focus areas (Physics, Chemistry, Mathematics)
-            3. Monthly milestones and targets
-            4. Mock test schedule
-            5. Revision strategies
-            6. Backup college options (NITs, IIITs, etc.)
-            """,
-            agent=self.agents.study_planner_agent(),
-            expected_output="Detailed month-by-month study roadmap with clear milestones and strategies"
+        return self._task(
+            'create_study_roadmap', self.agents.study_planner_agent(), student_data
         )
     
     def recommend_resources_task(self, student_data):
-        return Task(
-            description=f"""
-            Recommend the best study resources tailored for a student with:
-            - Academic Performance: {student_data['percentage']}%
-            - Age: {student_data['age']} years
-            - School: {student_data['school_name']}
-            
-            Recommend:
-            1. Best books for each subject (Physics, Chemistry, Math)
-            2. Online platforms and courses
-            3. YouTube channels and free resources
-            4. Coaching institute recommendations (if needed)
-            5. Practice question banks and previous year papers
-            6. Mobile apps for preparation
-            """,
-            agent=self.agents.resource_curator_agent(),
-            expected_output="Comprehensive list of recommended study materials and resources with reasons for selection"
+        return self._task(
+            'recommend_resources', self.agents.resource_curator_agent(), student_data
         )
     
     def optimize_study_schedule_task(self, student_data):
-        return Task(
-            description=f"""
-            Create an optimized daily and weekly study schedule for:
-            - Age: {student_data['age']} years
-            - Academic Level: {student_data['percentage']}%
-            - School: {student_data['school_name']}
-            
-            Consider:
-            1. School hours and homework time
-            2. Optimal study hours per day
-            3. Subject rotation and time allocation
-            4. Break times and recreational activities
-            5. Sleep and health considerations
-            6. Weekend intensive study plans
-            7. Exam and test schedules
-            """,
-            agent=self.agents.timeline_optimizer_agent(),
-            expected_output="Detailed daily and weekly study schedule with time allocations and balance considerations"
+        return self._task(
+            'optimize_study_schedule', self.agents.timeline_optimizer_agent(), student_data
         )
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+Checks on a student profile shared by the Streamlit form and the batch CLI.
+"""
+
+
+def validate_student_data(data):
+    """
+    Validate student input data and return a list of error messages
+    """
+    errors = []
+    
+    if not data.get('school_name', '').strip():
+        errors.append("School name is required")
+    
+    if data.get('percentage', 0) < 40:
+        errors.append("Academic percentage seems too low")
+    
+    if data.get('age', 0) < 14 or data.get('age', 0) > 20:
+        errors.append("Age should be between 14-20 years")
+    
+    return errors
\ No newline at end of file
@@ -1,12 +1,14 @@
 import streamlit as st
 import sys
 import os
+import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from components.input_form import StudentInputForm
+from components.progress_tracker import ProgressTracker
 from components.roadmap_display import RoadmapDisplay
+from components.roadmap_stream import RoadmapStream
 from utils.helpers import HelperFunctions
-# from edu_agent.crew import EducationCrew
 
 def main():
     # Page configuration
@@ -17,6 +19,9 @@ def main():
         initial_sidebar_state="expanded"
     )
     
+    # Crew metrics for Prometheus, when EDU_AGENT_METRICS_PORT is set
+    HelperFunctions.start_metrics_server()
+    
     st.markdown("""
     <style>
         .main-header {
@@ -87,15 +92,39 @@ def main():
         st.session_state.student_data = None
     if 'roadmap_data' not in st.session_state:
         st.session_state.roadmap_data = None
+    if 'roadmap_job' not in st.session_state:
+        st.session_state.roadmap_job = None
+    # Puts the student ID in the URL from the first page on
+    HelperFunctions.get_student_id()
+    
+    jobs = HelperFunctions.get_job_queue()
     
     # Show different views based on state
-    if not st.session_state.roadmap_generated:
+    if st.session_state.roadmap_job is not None:
+        # Generation runs in the background; this run only polls it
+        job = jobs.status(st.session_state.roadmap_job) if jobs else None
+        
+        if job is None:
+            st.session_state.roadmap_job = None
+            st.warning("⚠️ Your roadmap request expired. Please submit the form again.")
+        elif job['state'] == 'done':
+            st.session_state.roadmap_job = None
+            st.session_state.roadmap_data = job['result']
+            st.session_state.roadmap_generated = True
+            st.rerun()
+        else:
+            RoadmapStream.render(job)
+            time.sleep(RoadmapStream.POLL_INTERVAL)
+            st.rerun()
+    
+    elif not st.session_state.roadmap_generated:
         # Input form view
         st.write("## 📝 Tell Us About Yourself")
         st.write("Help us create a personalized study roadmap tailored to your academic profile and goals.")
         
-        # Render input form
+        # Render input form, or take a profile submitted before
         student_data = StudentInputForm.render()
+        student_data = StudentInputForm.render_history(HelperFunctions.get_user_sessions()) or student_data
         
         if student_data:
             # Validate data
@@ -108,17 +137,24 @@ def main():
                 # Show profile summary
                 StudentInputForm.display_profile_summary(student_data)
                 
+                # Save student data
+                st.session_state.student_data = student_data
+                HelperFunctions.save_user_session(student_data)
+                
                 # Generate roadmap
-                with st.spinner("🤖 AI agents are working on your personalized roadmap..."):
-                    # Save student data
-                    st.session_state.student_data = student_data
-                    HelperFunctions.save_user_session(student_data)
-                    roadmap_data = HelperFunctions.generate_mock_roadmap(student_data)
+                if jobs is not None:
+                    # Queue the crew run and poll it on the following reruns
+                    # The student ID lets a regenerated roadmap reuse the
+                    # sections a profile edit did not affect
+                    st.session_state.roadmap_job = jobs.submit(student_data, HelperFunctions.get_student_id())
+                else:
+                    with st.spinner("🤖 AI agents are working on your personalized roadmap..."):
+                        roadmap_data = HelperFunctions.generate_mock_roadmap(student_data)
                     
                     st.session_state.roadmap_data = roadmap_data
                     st.session_state.roadmap_generated = True
                 
-                # Auto-rerun to show roadmap
+                # Auto-rerun to show roadmap or its progress
                 st.rerun()
     
     else:
@@ -233,8 +269,12 @@ if __name__ == "__main__":
     elif selected_page == "📚 Subject Tips":
         show_subject_tips()
     elif selected_page == "📊 Progress Tracker":
-        st.header("📊 Progress Tracker")
-        st.info("Progress tracking feature coming soon!")
+        student_data = st.session_state.get('student_data') or {}
+        ProgressTracker.render(
+            HelperFunctions.get_progress_store(),
+            HelperFunctions.get_student_id(),
+            student_data.get('current_class', 'All students')
+        )
     elif selected_page == "❓ FAQ":
         st.header("❓ Frequently Asked Questions")
         
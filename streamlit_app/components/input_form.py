@@ -1,6 +1,20 @@
 import streamlit as st
+from datetime import datetime
 
 class StudentInputForm:
+    # Choices offered by the form
+    AGES = list(range(14, 20))
+    CLASSES = ["Class 9", "Class 10", "Class 11", "Class 12", "Dropper (12th Pass)"]
+    PREPARATION_STATUSES = [
+        "Not started yet",
+        "Just beginning",
+        "3-6 months preparation",
+        "6-12 months preparation",
+        "More than 1 year"
+    ]
+    EXAMS = ["JEE Main", "JEE Advanced", "BITSAT", "VITEEE", "COMEDK"]
+    SUBJECTS = ["Mathematics", "Physics", "Chemistry"]
+    
     @staticmethod
     def render():
         """
@@ -26,7 +40,7 @@ class StudentInputForm:
                 # Age Input
                 age = st.selectbox(
                     "👤 Age",
-                    options=list(range(14, 20)),
+                    options=StudentInputForm.AGES,
                     index=2,  # Default to 16
                     help="Your current age"
                 )
@@ -42,7 +56,7 @@ class StudentInputForm:
                 # Class/Grade (Optional for better analysis)
                 current_class = st.selectbox(
                     "📖 Current Class",
-                    options=["Class 9", "Class 10", "Class 11", "Class 12", "Dropper (12th Pass)"],
+                    options=StudentInputForm.CLASSES,
                     index=2,  # Default to Class 11
                     help="Your current academic class"
                 )
@@ -55,20 +69,14 @@ class StudentInputForm:
             with col3:
                 preparation_status = st.selectbox(
                     "📚 Current JEE Preparation Status",
-                    options=[
-                        "Not started yet",
-                        "Just beginning",
-                        "3-6 months preparation",
-                        "6-12 months preparation",
-                        "More than 1 year"
-                    ],
+                    options=StudentInputForm.PREPARATION_STATUSES,
                     help="How long have you been preparing for JEE?"
                 )
             
             with col4:
                 target_exam = st.multiselect(
                     "🎯 Target Exams",
-                    options=["JEE Main", "JEE Advanced", "BITSAT", "VITEEE", "COMEDK"],
+                    options=StudentInputForm.EXAMS,
                     default=["JEE Main", "JEE Advanced"],
                     help="Select your target entrance exams"
                 )
@@ -80,14 +88,14 @@ class StudentInputForm:
             with col5:
                 strong_subjects = st.multiselect(
                     "💪 Strong Subjects",
-                    options=["Mathematics", "Physics", "Chemistry"],
+                    options=StudentInputForm.SUBJECTS,
                     help="Subjects you feel confident about"
                 )
             
             with col6:
                 weak_subjects = st.multiselect(
                     "📈 Subjects to Improve",
-                    options=["Mathematics", "Physics", "Chemistry"],
+                    options=StudentInputForm.SUBJECTS,
                     help="Subjects that need more focus"
                 )
             
@@ -152,4 +160,30 @@ class StudentInputForm:
                     st.success(f"**Strong:** {', '.join(student_data['strong_subjects'])}")
             with col5:
                 if student_data['weak_subjects']:
-                    st.info(f"**Focus Areas:** {', '.join(student_data['weak_subjects'])}")
\ No newline at end of file
+                    st.info(f"**Focus Areas:** {', '.join(student_data['weak_subjects'])}")
+    
+    @staticmethod
+    def render_history(history):
+        """
+        Earlier submissions of this student, newest first; returns the one
+        picked to generate again, or None
+        """
+        if not history:
+            return None
+        
+        chosen = None
+        with st.expander(f"🕘 Your Previous Submissions ({len(history)})"):
+            for i, entry in enumerate(history):
+                student_data = entry['student_data']
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    submitted = datetime.fromtimestamp(entry['timestamp']).strftime('%d %b %Y, %H:%M')
+                    exams = ', '.join(student_data.get('target_exams') or [])
+                    st.write(
+                        f"**{submitted}** · {student_data.get('current_class', '')} · "
+                        f"{student_data.get('percentage', 0):g}% · {exams}"
+                    )
+                with col2:
+                    if st.button("🔁 Use Again", key=f"history_{i}", use_container_width=True):
+                        chosen = student_data
+        return chosen
\ No newline at end of file
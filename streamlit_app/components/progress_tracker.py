@@ -0,0 +1,101 @@
+import streamlit as st
+from datetime import date
+
+# numpy, pandas and plotly are imported inside the methods so the other
+# pages do not pay for them at startup
+
+class ProgressTracker:
+    @staticmethod
+    def render(store, student_id, cohort):
+        """
+        Mock test log, the student's own trends and how their class is doing
+        """
+        from edu_agent.progress import SUBJECTS, student_progress
+        
+        st.header("📊 Progress Tracker")
+        
+        # Log a score
+        with st.form("mock_test_form", clear_on_submit=True):
+            st.write("### 📝 Log a Mock Test")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                subject = st.selectbox("Subject", SUBJECTS)
+            with col2:
+                score = st.number_input("Score (%)", min_value=0.0, max_value=100.0, value=50.0, step=0.5)
+            with col3:
+                test_date = st.date_input("Test date", value=date.today(), max_value=date.today())
+            
+            if st.form_submit_button("➕ Add Score"):
+                store.record(student_id, subject, score, test_date, cohort)
+                st.success(f"✅ Recorded {score:g}% in {subject}")
+        
+        # This student's trends
+        st.write("### 📈 Your Progress")
+        
+        progress = student_progress(store, student_id)
+        if not progress:
+            st.info("Log your first mock test score to see your trend.")
+        else:
+            cols = st.columns(len(progress))
+            for col, (subject, series) in zip(cols, progress.items()):
+                with col:
+                    st.metric(
+                        subject, f"{series['scores'][-1]:.1f}%",
+                        f"{series['weekly_trend']:+.1f} pts/week" if len(series['scores']) > 1 else None
+                    )
+            st.plotly_chart(ProgressTracker.progress_figure(progress), use_container_width=True)
+        
+        # The student's cohort
+        st.write(f"### 👥 How {cohort} Is Doing")
+        ProgressTracker._display_cohort(store, cohort)
+    
+    @staticmethod
+    def progress_figure(progress):
+        """Scores, moving average and projection per subject"""
+        import plotly.graph_objects as go
+        
+        fig = go.Figure()
+        for subject, series in progress.items():
+            fig.add_trace(go.Scatter(
+                x=series['dates'], y=series['scores'], mode='markers', name=f"{subject} scores"
+            ))
+            fig.add_trace(go.Scatter(
+                x=series['dates'], y=series['moving_average'], mode='lines', name=f"{subject} average"
+            ))
+            if len(series['scores']) > 1:
+                fig.add_trace(go.Scatter(
+                    x=series['projection_dates'], y=series['projection'], mode='lines',
+                    name=f"{subject} projection", line=dict(dash='dash')
+                ))
+        
+        fig.update_layout(
+            title='Mock Test Scores',
+            xaxis_title='Date',
+            yaxis_title='Score (%)',
+            yaxis=dict(range=[0, 100])
+        )
+        return fig
+    
+    @staticmethod
+    def _display_cohort(store, cohort):
+        """Per-subject summary of every student in the cohort"""
+        import pandas as pd
+        from edu_agent.progress import cohort_summary
+        
+        summary = cohort_summary(store, cohort)
+        if not summary:
+            st.info("No scores recorded for this class yet.")
+            return
+        
+        df = pd.DataFrame([
+            {
+                'Subject': subject,
+                'Students': row['students'],
+                'Average Score': f"{row['mean_score']:.1f}%",
+                'Trend': f"{row['weekly_trend']:+.2f} pts/week",
+                'Improving': f"{row['improving']:.0%}",
+                'Projected (30 days)': f"{row['projected_score']:.1f}%"
+            }
+            for subject, row in summary.items()
+        ])
+        st.dataframe(df, use_container_width=True, hide_index=True)
\ No newline at end of file
@@ -1,17 +1,36 @@
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import pandas as pd
+
+# pandas and plotly are imported inside the chart methods so the input form
+# page does not pay for them at startup
+
+# Charts and tables kept per distinct input, across sessions
+CHART_CACHE_ENTRIES = 64
 
 class RoadmapDisplay:
+    # Tab label and the method that draws it
+    TABS = [
+        ("📊 Profile Analysis", '_display_profile_analysis'),
+        ("📅 Study Plan", '_display_study_plan'),
+        ("📚 Resources", '_display_resources'),
+        ("⏰ Schedule", '_display_schedule'),
+        ("📈 Progress Tracker", '_display_progress_tracker')
+    ]
+    
     @staticmethod
-    def render(roadmap_data):
+    def render(roadmap_data, lazy=True):
         """
         Display the generated study roadmap
+        
+        With ``lazy`` only the selected section is built and sent to the
+        browser, and switching sections reruns just that part of the page;
+        otherwise every section is drawn into st.tabs on each rerun.
         """
         if roadmap_data['status'] == 'error':
             st.error(f"❌ {roadmap_data['message']}")
+            if roadmap_data.get('partial_roadmap'):
+                with st.expander("Sections generated before the error"):
+                    st.markdown(roadmap_data['partial_roadmap'].markdown())
             return
         
         st.success("✅ Your personalized study roadmap has been generated!")
@@ -19,184 +38,222 @@ class RoadmapDisplay:
         # Display roadmap content
         st.header("🗺️ Your IIT-JEE Study Roadmap")
         
-        # Create tabs for different sections
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "📊 Profile Analysis", 
-            "📅 Study Plan", 
-            "📚 Resources", 
-            "⏰ Schedule", 
-            "📈 Progress Tracker"
-        ])
-        
-        with tab1:
-            RoadmapDisplay._display_profile_analysis(roadmap_data)
-        
-        with tab2:
-            RoadmapDisplay._display_study_plan(roadmap_data)
+        if lazy:
+            RoadmapDisplay._render_selected_tab(roadmap_data)
+            return
         
-        with tab3:
-            RoadmapDisplay._display_resources(roadmap_data)
+        # Create tabs for different sections
+        tabs = st.tabs([label for label, _ in RoadmapDisplay.TABS])
         
-        with tab4:
-            RoadmapDisplay._display_schedule(roadmap_data)
+        for tab, (_, method) in zip(tabs, RoadmapDisplay.TABS):
+            with tab:
+                getattr(RoadmapDisplay, method)(roadmap_data)
+    
+    @staticmethod
+    @st.fragment
+    def _render_selected_tab(roadmap_data):
+        """Section picker and the selected section, rerun on their own"""
+        labels = [label for label, _ in RoadmapDisplay.TABS]
+        selected = st.segmented_control(
+            "Roadmap section", labels, default=labels[0],
+            key='roadmap_tab', label_visibility='collapsed'
+        )
+        # Clicking the selected option again clears it
+        if selected is None:
+            selected = labels[0]
         
-        with tab5:
-            RoadmapDisplay._display_progress_tracker(roadmap_data)
+        getattr(RoadmapDisplay, dict(RoadmapDisplay.TABS)[selected])(roadmap_data)
+    
+    @staticmethod
+    def prepare(roadmap_data, figures=True, student_id=None):
+        """
+        Data and charts behind every tab that are not read straight off the
+        Roadmap, built without touching the page
+        """
+        student_data = roadmap_data['student_profile']
+        data = {
+            'profile_analysis': RoadmapDisplay.build_profile_analysis(student_data),
+            'time_allocation': RoadmapDisplay.build_time_allocation(student_data),
+            'weekly_distribution': RoadmapDisplay.build_weekly_distribution(student_data),
+            'progress_plan': RoadmapDisplay.build_progress_plan(student_id)
+        }
+        if figures:
+            key = RoadmapDisplay.allocation_key(student_data)
+            data['figures'] = [
+                RoadmapDisplay.allocation_chart(key),
+                RoadmapDisplay.weekly_chart(key),
+                RoadmapDisplay.performance_chart(data['progress_plan']['student_progress'])
+            ]
+            data['timetable'] = RoadmapDisplay.weekly_timetable(RoadmapDisplay.schedule_key(student_data))
+        return data
     
     @staticmethod
     def _display_profile_analysis(roadmap_data):
         """Display academic profile analysis"""
         st.subheader("🎯 Academic Profile Analysis")
         
-        student_data = roadmap_data['student_profile']
+        analysis = RoadmapDisplay.build_profile_analysis(roadmap_data['student_profile'])
         
         # Performance indicators
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            # Determine performance level
-            percentage = student_data['percentage']
-            if percentage >= 90:
-                level = "Excellent"
-                color = "green"
-            elif percentage >= 75:
-                level = "Good"
-                color = "blue"
-            elif percentage >= 60:
-                level = "Average"
-                color = "orange"
-            else:
-                level = "Needs Improvement"
-                color = "red"
-            
-            st.metric("Performance Level", level)
+            st.metric("Performance Level", analysis['level'])
         
         with col2:
-            # Preparation time remaining
-            age = student_data['age']
-            if age <= 16:
-                time_left = "2+ years"
-                urgency = "Low"
-            elif age == 17:
-                time_left = "1-2 years"
-                urgency = "Medium"
-            else:
-                time_left = "<1 year"
-                urgency = "High"
-            
-            st.metric("Preparation Time", time_left)
+            st.metric("Preparation Time", analysis['time_left'])
         
         with col3:
-            st.metric("Urgency Level", urgency)
+            st.metric("Urgency Level", analysis['urgency'])
         
         # Strengths and Areas for Improvement
         col4, col5 = st.columns(2)
         
         with col4:
             st.write("### 💪 Identified Strengths")
-            strengths = [
-                f"Academic performance: {percentage}%",
-                f"Age advantage: {age} years old"
-            ]
-            
-            if student_data.get('strong_subjects'):
-                strengths.extend([f"Strong in {subject}" for subject in student_data['strong_subjects']])
-            
-            for strength in strengths:
+            for strength in analysis['strengths']:
                 st.write(f"✅ {strength}")
         
         with col5:
             st.write("### 📈 Areas for Improvement")
-            improvements = []
+            for improvement in analysis['improvements']:
+                st.write(f"🎯 {improvement}")
             
-            if percentage < 75:
-                improvements.append("Focus on strengthening academic foundation")
+    @staticmethod
+    def build_profile_analysis(student_data):
+        """
+        Performance level, time left, strengths and improvements for a student
+        """
+        # Determine performance level
+        percentage = student_data['percentage']
+        if percentage >= 90:
+            level = "Excellent"
+        elif percentage >= 75:
+            level = "Good"
+        elif percentage >= 60:
+            level = "Average"
+        else:
+            level = "Needs Improvement"
             
-            if student_data.get('weak_subjects'):
-                improvements.extend([f"Improve {subject} concepts" for subject in student_data['weak_subjects']])
+        # Preparation time remaining
+        age = student_data['age']
+        if age <= 16:
+            time_left = "2+ years"
+            urgency = "Low"
+        elif age == 17:
+            time_left = "1-2 years"
+            urgency = "Medium"
+        else:
+            time_left = "<1 year"
+            urgency = "High"
             
-            if not improvements:
-                improvements = ["Continue maintaining current performance", "Focus on advanced problem solving"]
+        strengths = [
+            f"Academic performance: {percentage}%",
+            f"Age advantage: {age} years old"
+        ]
             
-            for improvement in improvements:
-                st.write(f"🎯 {improvement}")
+        if student_data.get('strong_subjects'):
+            strengths.extend([f"Strong in {subject}" for subject in student_data['strong_subjects']])
+        
+        improvements = []
+        
+        if percentage < 75:
+            improvements.append("Focus on strengthening academic foundation")
+        
+        if student_data.get('weak_subjects'):
+            improvements.extend([f"Improve {subject} concepts" for subject in student_data['weak_subjects']])
+        
+        if not improvements:
+            improvements = ["Continue maintaining current performance", "Focus on advanced problem solving"]
+        
+        return {
+            'level': level,
+            'time_left': time_left,
+            'urgency': urgency,
+            'strengths': strengths,
+            'improvements': improvements
+        }
     
     @staticmethod
     def _display_study_plan(roadmap_data):
         """Display detailed study plan"""
         st.subheader("📋 Comprehensive Study Plan")
         
-        # Sample roadmap content (in real implementation, this would come from the AI agents)
         student_data = roadmap_data['student_profile']
         
-        # Phase-wise planning
-        phases = [
-            {
-                "phase": "Foundation Building",
-                "duration": "2-3 months",
-                "focus": "Strengthen basic concepts in PCM",
-                "activities": [
-                    "Complete NCERT thoroughly",
-                    "Solve basic numerical problems",
-                    "Clear conceptual doubts"
-                ]
-            },
-            {
-                "phase": "Concept Development",
-                "duration": "4-6 months", 
-                "focus": "Advanced problem solving",
-                "activities": [
-                    "Reference book problem solving",
-                    "Topic-wise test series",
-                    "Formula consolidation"
-                ]
-            },
-            {
-                "phase": "Practice & Revision",
-                "duration": "3-4 months",
-                "focus": "Mock tests and revision",
-                "activities": [
-                    "Full-length mock tests",
-                    "Previous year papers",
-                    "Weak area improvement"
-                ]
-            }
-        ]
-        
-        for i, phase in enumerate(phases, 1):
-            with st.expander(f"Phase {i}: {phase['phase']} ({phase['duration']})"):
-                st.write(f"**Focus:** {phase['focus']}")
+        # Phase-wise planning, as parsed from the roadmap
+        for i, phase in enumerate(roadmap_data['roadmap'].phases, 1):
+            title = f"Phase {i}: {phase.name}" + (f" ({phase.duration})" if phase.duration else "")
+            with st.expander(title):
+                if phase.focus:
+                    st.write(f"**Focus:** {phase.focus}")
                 st.write("**Key Activities:**")
-                for activity in phase['activities']:
+                for activity in phase.activities:
                     st.write(f"• {activity}")
         
         # Subject-wise breakdown
         st.write("### 📚 Subject-wise Focus Distribution")
         
-        subjects = ['Mathematics', 'Physics', 'Chemistry']
-        # Adjust time based on weak subjects
-        weak_subjects = student_data.get('weak_subjects', [])
-        
-        time_allocation = {}
-        base_time = 33.33  # Equal distribution base
+        fig = RoadmapDisplay.allocation_chart(RoadmapDisplay.allocation_key(student_data))
+        st.plotly_chart(fig, use_container_width=True)
+    
+    @staticmethod
+    def build_study_hours(student_data):
+        """Hours per day (rows) and subject or revision (columns) for the week"""
+        from edu_agent.allocation import allocate_profiles
         
-        for subject in subjects:
-            if subject in weak_subjects:
-                time_allocation[subject] = base_time + 10  # Extra 10% for weak subjects
-            else:
-                time_allocation[subject] = base_time - 5   # Reduce 5% from strong subjects
+        return allocate_profiles([student_data])[0]
+    
+    @staticmethod
+    def build_time_allocation(student_data):
+        """Percentage of weekly subject study time, weighted towards weak subjects"""
+        from edu_agent.allocation import SUBJECTS
         
-        # Normalize to 100%
-        total = sum(time_allocation.values())
-        time_allocation = {k: (v/total)*100 for k, v in time_allocation.items()}
+        weekly = RoadmapDisplay.build_study_hours(student_data).sum(axis=0)
+        total = weekly[:len(SUBJECTS)].sum()
+        return {subject: float(hours / total * 100) for subject, hours in zip(SUBJECTS, weekly)}
+    
+    @staticmethod
+    def allocation_figure(time_allocation):
+        """Pie chart of the recommended time allocation"""
+        import plotly.express as px
         
-        # Create pie chart
-        fig = px.pie(
+        return px.pie(
             values=list(time_allocation.values()),
             names=list(time_allocation.keys()),
             title="Recommended Time Allocation"
         )
-        st.plotly_chart(fig, use_container_width=True)
+    
+    @staticmethod
+    def allocation_key(student_data):
+        """The only parts of the profile the study hours depend on"""
+        hours = student_data.get('available_hours')
+        return (
+            tuple(sorted(set(student_data.get('weak_subjects') or []))),
+            tuple(sorted(set(student_data.get('strong_subjects') or []))),
+            student_data.get('current_class'),
+            tuple(hours) if isinstance(hours, (list, tuple)) else hours
+        )
+    
+    @staticmethod
+    def _allocation_profile(key):
+        weak_subjects, strong_subjects, current_class, hours = key
+        return {
+            'weak_subjects': list(weak_subjects),
+            'strong_subjects': list(strong_subjects),
+            'current_class': current_class,
+            'available_hours': hours
+        }
+    
+    @staticmethod
+    @st.cache_resource(max_entries=CHART_CACHE_ENTRIES)
+    def allocation_chart(key):
+        """
+        Time allocation pie chart, built once per allocation_key; the figure
+        is shared, so callers must not modify it
+        """
+        time_allocation = RoadmapDisplay.build_time_allocation(RoadmapDisplay._allocation_profile(key))
+        return RoadmapDisplay.allocation_figure(time_allocation)
     
     @staticmethod
     def _display_resources(roadmap_data):
@@ -206,36 +263,23 @@ class RoadmapDisplay:
         # Books section
         st.write("### 📖 Essential Books")
         
-        books = {
-            "Mathematics": [
-                "NCERT Mathematics (Class 11 & 12)",
-                "R.D. Sharma",
-                "Cengage Mathematics",
-                "Arihant Problem Book"
-            ],
-            "Physics": [
-                "NCERT Physics (Class 11 & 12)", 
-                "H.C. Verma (Concepts of Physics)",
-                "D.C. Pandey (Arihant)",
-                "Resnick Halliday Krane"
-            ],
-            "Chemistry": [
-                "NCERT Chemistry (Class 11 & 12)",
-                "O.P. Tandon",
-                "Morrison & Boyd (Organic)",
-                "J.D. Lee (Inorganic)"
-            ]
-        }
+        books = roadmap_data['roadmap'].resources_by_subject('book')
         
         for subject, book_list in books.items():
             with st.expander(f"{subject} Books"):
                 for book in book_list:
                     st.write(f"📚 {book}")
         
-        # Online platforms
+        # Online platforms the agents recommended, the usual ones otherwise
         st.write("### 💻 Online Learning Platforms")
         
+        resources = roadmap_data['roadmap'].resources
         platforms = [
+            {"name": title, "type": "All subjects" if subject == 'General' else subject, "rating": ""}
+            for subject, title in dict.fromkeys(
+                (resource.subject, resource.title) for resource in resources if resource.kind == 'online'
+            )
+        ] or [
             {"name": "Unacademy", "type": "Comprehensive courses", "rating": "⭐⭐⭐⭐"},
             {"name": "BYJU'S", "type": "Interactive learning", "rating": "⭐⭐⭐⭐"},
             {"name": "Vedantu", "type": "Live classes", "rating": "⭐⭐⭐⭐"},
@@ -250,17 +294,18 @@ class RoadmapDisplay:
             with col2:
                 st.write(platform['type'])
             with col3:
-                st.write(platform['rating'])
+                if platform['rating']:
+                    st.write(platform['rating'])
         
         # Mobile apps
         st.write("### 📱 Recommended Mobile Apps")
-        apps = [
+        apps = list(dict.fromkeys(resource.title for resource in resources if resource.kind == 'app')) or [
             "Toppr", "Embibe", "Doubtnut", "BYJU'S Learning App", "Unacademy Learning App"
         ]
         
-        cols = st.columns(len(apps))
+        cols = st.columns(min(len(apps), 5))
         for i, app in enumerate(apps):
-            with cols[i]:
+            with cols[i % len(cols)]:
                 st.write(f"📱 {app}")
     
     @staticmethod
@@ -273,66 +318,94 @@ class RoadmapDisplay:
         # Daily schedule
         st.write("### 📅 Recommended Daily Schedule")
         
-        # Adjust schedule based on current class
-        current_class = student_data.get('current_class', 'Class 11')
-        
-        if 'Dropper' in current_class:
-            # Full-time preparation schedule
-            schedule = [
-                {"time": "6:00 - 7:00 AM", "activity": "Morning Revision", "subject": "Previous day topics"},
-                {"time": "7:00 - 8:00 AM", "activity": "Exercise & Breakfast", "subject": "Health"},
-                {"time": "8:00 - 11:00 AM", "activity": "Study Session 1", "subject": "Mathematics"},
-                {"time": "11:00 - 11:30 AM", "activity": "Break", "subject": "Rest"},
-                {"time": "11:30 AM - 2:30 PM", "activity": "Study Session 2", "subject": "Physics"},
-                {"time": "2:30 - 3:30 PM", "activity": "Lunch & Rest", "subject": "Break"},
-                {"time": "3:30 - 6:30 PM", "activity": "Study Session 3", "subject": "Chemistry"},
-                {"time": "6:30 - 7:30 PM", "activity": "Evening Break", "subject": "Recreation"},
-                {"time": "7:30 - 9:30 PM", "activity": "Problem Solving", "subject": "Mixed Practice"},
-                {"time": "9:30 - 10:30 PM", "activity": "Dinner & Family Time", "subject": "Break"},
-                {"time": "10:30 - 11:30 PM", "activity": "Revision & Notes", "subject": "Day's Summary"}
-            ]
-        else:
-            # School + preparation schedule
-            schedule = [
-                {"time": "6:00 - 7:00 AM", "activity": "Morning Study", "subject": "Quick Revision"},
-                {"time": "7:00 - 8:00 AM", "activity": "Get Ready for School", "subject": "Preparation"},
-                {"time": "8:00 AM - 2:00 PM", "activity": "School Hours", "subject": "Attend Classes"},
-                {"time": "2:00 - 3:00 PM", "activity": "Lunch & Rest", "subject": "Break"},
-                {"time": "3:00 - 5:00 PM", "activity": "JEE Study Session 1", "subject": "Mathematics"},
-                {"time": "5:00 - 5:30 PM", "activity": "Break & Snacks", "subject": "Rest"},
-                {"time": "5:30 - 7:30 PM", "activity": "JEE Study Session 2", "subject": "Physics/Chemistry"},
-                {"time": "7:30 - 8:30 PM", "activity": "Dinner & Family Time", "subject": "Break"},
-                {"time": "8:30 - 10:00 PM", "activity": "School Homework", "subject": "School Work"},
-                {"time": "10:00 - 11:00 PM", "activity": "Revision & Planning", "subject": "Next Day Prep"}
-            ]
+        schedule = tuple(
+            (block.time, block.activity, block.subject) for block in roadmap_data['roadmap'].schedule
+        )
         
         # Display schedule in a table format
-        df = pd.DataFrame(schedule)
+        df = RoadmapDisplay.schedule_table(schedule)
         st.dataframe(df, use_container_width=True, hide_index=True)
         
         # Weekly plan
         st.write("### 📊 Weekly Study Distribution")
         
-        weekly_data = {
-            'Day': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'],
-            'Mathematics': [3, 2, 3, 2, 3, 4, 2],
-            'Physics': [2, 3, 2, 3, 2, 3, 3],
-            'Chemistry': [2, 2, 3, 3, 2, 2, 3],
-            'Revision': [1, 1, 1, 1, 2, 2, 3]
+        st.plotly_chart(
+            RoadmapDisplay.weekly_chart(RoadmapDisplay.allocation_key(student_data)),
+            use_container_width=True
+        )
+        
+        # Timetable for each day of the week
+        st.write("### 🗓️ Weekly Timetable")
+        
+        week = RoadmapDisplay.weekly_timetable(RoadmapDisplay.schedule_key(student_data))
+        day = st.selectbox("Day", list(week), key='timetable_day')
+        st.dataframe(RoadmapDisplay.schedule_table(week[day]), use_container_width=True, hide_index=True)
+    
+    @staticmethod
+    def schedule_key(student_data):
+        """The parts of the profile the weekly timetable depends on"""
+        exams = tuple(sorted(set(student_data.get('target_exams') or [])))
+        return RoadmapDisplay.allocation_key(student_data) + (exams,)
+    
+    @staticmethod
+    @st.cache_resource(max_entries=CHART_CACHE_ENTRIES)
+    def weekly_timetable(key):
+        """
+        day -> (time, activity, subject) rows from the local schedule
+        optimizer, built once per schedule_key
+        """
+        from edu_agent.schedule_optimizer import optimize_week
+        
+        student_data = dict(RoadmapDisplay._allocation_profile(key[:-1]), target_exams=list(key[-1]))
+        return {
+            day: tuple((block.time, block.activity, block.subject) for block in blocks)
+            for day, blocks in optimize_week(student_data).items()
         }
+    
+    @staticmethod
+    @st.cache_resource(max_entries=CHART_CACHE_ENTRIES)
+    def schedule_table(schedule):
+        """
+        DataFrame of (time, activity, subject) rows, shared like the charts
+        """
+        import pandas as pd
+        
+        return pd.DataFrame(list(schedule), columns=['time', 'activity', 'subject'])
+    
+    @staticmethod
+    def build_weekly_distribution(student_data):
+        """Study hours per subject for each day of the week"""
+        from edu_agent.allocation import COLUMNS, DAYS
+        
+        hours = RoadmapDisplay.build_study_hours(student_data)
+        weekly_data = {'Day': list(DAYS)}
+        for i, column in enumerate(COLUMNS):
+            weekly_data[column] = hours[:, i].tolist()
+        return weekly_data
+        
+    @staticmethod
+    def weekly_figure(weekly_data):
+        """Stacked bar chart of the weekly study hours"""
+        import pandas as pd
+        import plotly.express as px
         
         df_weekly = pd.DataFrame(weekly_data)
         
-        fig = px.bar(
+        return px.bar(
             df_weekly, 
             x='Day', 
             y=['Mathematics', 'Physics', 'Chemistry', 'Revision'],
             title="Weekly Study Hours Distribution",
             labels={'value': 'Hours', 'variable': 'Subject'}
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
     
+    @staticmethod
+    @st.cache_resource(max_entries=CHART_CACHE_ENTRIES)
+    def weekly_chart(key):
+        """Weekly study hours chart, built once per allocation_key"""
+        weekly_data = RoadmapDisplay.build_weekly_distribution(RoadmapDisplay._allocation_profile(key))
+        return RoadmapDisplay.weekly_figure(weekly_data)
+        
     @staticmethod
     def _display_progress_tracker(roadmap_data):
         """Display progress tracking tools"""
@@ -341,27 +414,55 @@ class RoadmapDisplay:
         # Monthly milestones
         st.write("### 🎯 Monthly Milestones")
         
-        milestones = [
-            {"month": "Month 1", "target": "Complete NCERT (50%)", "test": "Basic Concept Test"},
-            {"month": "Month 2", "target": "Complete NCERT (100%)", "test": "NCERT Based Test"},
-            {"month": "Month 3", "target": "Reference Books (25%)", "test": "Mixed Topic Test"},
-            {"month": "Month 4", "target": "Reference Books (50%)", "test": "Advanced Problems Test"},
-            {"month": "Month 5", "target": "Reference Books (75%)", "test": "Full Syllabus Test 1"},
-            {"month": "Month 6", "target": "Reference Books (100%)", "test": "Full Syllabus Test 2"}
-        ]
-        
-        for milestone in milestones:
+        for milestone in roadmap_data['roadmap'].milestones:
             col1, col2, col3 = st.columns([1, 2, 2])
             with col1:
-                st.write(f"**{milestone['month']}**")
+                st.write(f"**{milestone.month}**")
             with col2:
-                st.write(milestone['target'])
+                st.write(milestone.target)
             with col3:
-                st.write(f"📝 {milestone['test']}")
+                if milestone.test:
+                    st.write(f"📝 {milestone.test}")
         
         # Mock test schedule
         st.write("### 📝 Mock Test Schedule")
         
+        st.dataframe(RoadmapDisplay.test_schedule_table(), use_container_width=True, hide_index=True)
+        
+        # Performance tracking chart: the student's own mock tests once they
+        # have logged any, the generic curve until then
+        progress = RoadmapDisplay.build_progress_plan(st.session_state.get('student_id'))['student_progress']
+        if progress:
+            st.write("### 📊 Your Mock Test Scores")
+        else:
+            st.write("### 📊 Expected Performance Curve")
+        
+        st.plotly_chart(RoadmapDisplay.performance_chart(progress), use_container_width=True)
+        
+        # Success tips
+        st.write("### 💡 Success Tips")
+        
+        tips = [
+            "🎯 Set daily, weekly, and monthly targets",
+            "📊 Track your performance in each subject",
+            "🔄 Regular revision is key to retention",
+            "❓ Clear doubts immediately - don't accumulate them",
+            "🏃‍♂️ Maintain physical and mental health",
+            "⏰ Stick to your schedule consistently",
+            "📝 Maintain error logs for improvement",
+            "🎉 Celebrate small wins to stay motivated"
+        ]
+        
+        for tip in tips:
+            st.write(tip)
+    
+    @staticmethod
+    def build_progress_plan(student_id=None, store=None):
+        """
+        Mock test schedule, the expected score curve and the per-subject
+        progress of ``student_id`` in ``store``, the shared ProgressStore by
+        default; empty when they have not logged any scores
+        """
         test_schedule = {
             'Test Type': ['Weekly Tests', 'Bi-weekly Full Tests', 'Monthly Assessments', 'Previous Year Papers'],
             'Frequency': ['Every Sunday', 'Every 2 weeks', 'Month end', 'Last 6 months'],
@@ -369,14 +470,24 @@ class RoadmapDisplay:
             'Focus': ['Topic-wise', 'Full syllabus', 'Complete revision', 'Real exam pattern']
         }
         
-        df_tests = pd.DataFrame(test_schedule)
-        st.dataframe(df_tests, use_container_width=True, hide_index=True)
-        
-        # Performance tracking chart
-        st.write("### 📊 Expected Performance Curve")
-        
-        months = list(range(1, 13))
-        expected_scores = [30, 40, 50, 60, 68, 75, 80, 85, 88, 90, 92, 95]
+        return {
+            'test_schedule': test_schedule,
+            'months': list(range(1, 13)),
+            'expected_scores': [30, 40, 50, 60, 68, 75, 80, 85, 88, 90, 92, 95],
+            'student_progress': RoadmapDisplay._student_progress(student_id, store)
+        }
+    
+    @staticmethod
+    def _student_progress(student_id, store=None):
+        if student_id is None:
+            return {}
+        from edu_agent.progress import ProgressStore, student_progress
+        return student_progress(store or ProgressStore.shared(), student_id)
+    
+    @staticmethod
+    def performance_figure(months, expected_scores):
+        """Line chart of the expected score over the months of preparation"""
+        import plotly.graph_objects as go
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -393,25 +504,33 @@ class RoadmapDisplay:
             yaxis_title='Expected Score (%)',
             yaxis=dict(range=[0, 100])
         )
+        return fig
+    
+    @staticmethod
+    def performance_chart(progress=None):
+        """
+        Chart of a student's mock test scores from student_progress, or the
+        expected score curve when there are none
+        """
+        if progress:
+            from components.progress_tracker import ProgressTracker
+            return ProgressTracker.progress_figure(progress)
+        return RoadmapDisplay.expected_performance_chart()
+    
+    @staticmethod
+    @st.cache_resource
+    def expected_performance_chart():
+        """Expected score curve; the same for every student"""
+        progress = RoadmapDisplay.build_progress_plan()
+        return RoadmapDisplay.performance_figure(progress['months'], progress['expected_scores'])
+    
+    @staticmethod
+    @st.cache_resource
+    def test_schedule_table():
+        """Mock test schedule DataFrame; the same for every student"""
+        import pandas as pd
         
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Success tips
-        st.write("### 💡 Success Tips")
-        
-        tips = [
-            "🎯 Set daily, weekly, and monthly targets",
-            "📊 Track your performance in each subject",
-            "🔄 Regular revision is key to retention",
-            "❓ Clear doubts immediately - don't accumulate them",
-            "🏃‍♂️ Maintain physical and mental health",
-            "⏰ Stick to your schedule consistently",
-            "📝 Maintain error logs for improvement",
-            "🎉 Celebrate small wins to stay motivated"
-        ]
-        
-        for tip in tips:
-            st.write(tip)
+        return pd.DataFrame(RoadmapDisplay.build_progress_plan()['test_schedule'])
     
     @staticmethod
     def display_download_options(roadmap_data):
@@ -0,0 +1,29 @@
+import streamlit as st
+
+from edu_agent.streaming import final_answer
+
+class RoadmapStream:
+    # Seconds between polls of a running generation job
+    POLL_INTERVAL = 0.5
+    
+    @staticmethod
+    def render(job):
+        """
+        Show the live state of a background roadmap job, with one section per
+        agent filled in as its output streams in
+        """
+        st.write("### 🤖 AI agents are working on your personalized roadmap...")
+        
+        if job['state'] == 'queued':
+            st.progress(0.0, text="⏳ Waiting for a free agent crew...")
+        else:
+            st.progress(job['progress'], text=f"✍️ {len(job['finished'])} of {len(job['sections'])} sections ready")
+        
+        for section, text in job['sections'].items():
+            with st.expander(section, expanded=True):
+                if section in job['finished']:
+                    st.markdown(text)
+                elif text:
+                    st.markdown(final_answer(text))
+                else:
+                    st.caption("⏳ Waiting for the previous agent...")
\ No newline at end of file
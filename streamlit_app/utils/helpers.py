@@ -1,6 +1,13 @@
 import streamlit as st
 from datetime import datetime, timedelta
 import json
+import os
+import textwrap
+import uuid
+
+from edu_agent.roadmap_parser import parse_roadmap, split_sections
+from edu_agent.validation import validate_student_data
+from utils.jobs import RoadmapJobQueue
 
 class HelperFunctions:
     @staticmethod
@@ -8,18 +15,7 @@ class HelperFunctions:
         """
         Validate student input data
         """
-        errors = []
-        
-        if not data.get('school_name', '').strip():
-            errors.append("School name is required")
-        
-        if data.get('percentage', 0) < 40:
-            errors.append("Academic percentage seems too low")
-        
-        if data.get('age', 0) < 14 or data.get('age', 0) > 20:
-            errors.append("Age should be between 14-20 years")
-        
-        return errors
+        return validate_student_data(data)
     
     @staticmethod
     def calculate_preparation_time(age, current_class):
@@ -129,24 +125,94 @@ class HelperFunctions:
         
         return {
             'status': 'success',
-            'roadmap': roadmap_content,
+            'roadmap': parse_roadmap(split_sections(textwrap.dedent(roadmap_content)), student_data),
             'student_profile': student_data
         }
     
     @staticmethod
-    def save_user_session(student_data):
+    @st.cache_resource
+    def get_crew():
         """
-        Save user session data (in real app, this would use database)
+        Shared EducationCrew for every session, or None when no LLM is configured
         """
-        if 'user_sessions' not in st.session_state:
-            st.session_state.user_sessions = []
-        
-        session_data = {
-            'timestamp': datetime.now().isoformat(),
-            'student_data': student_data
-        }
+        fake_llm = os.environ.get('EDU_AGENT_LLM') == 'fake'
+        if not fake_llm and not os.environ.get('OPENAI_API_KEY'):
+            return None
         
-        st.session_state.user_sessions.append(session_data)
+        from edu_agent.crew import EducationCrew
+        return EducationCrew()
+    
+    @staticmethod
+    @st.cache_resource
+    def get_job_queue():
+        """
+        Background roadmap job queue shared by every session, or None when
+        no LLM is configured
+        """
+        crew = HelperFunctions.get_crew()
+        if crew is None:
+            return None
+        return RoadmapJobQueue(crew)
+    
+    @staticmethod
+    @st.cache_resource
+    def start_metrics_server():
+        """
+        Crew metrics endpoint on EDU_AGENT_METRICS_PORT, started once per
+        process; None when the variable is unset
+        """
+        from edu_agent.metrics import serve_metrics_from_env
+        return serve_metrics_from_env()
+    
+    @staticmethod
+    @st.cache_resource
+    def get_session_store():
+        """
+        Submission history store shared by every session, chosen by
+        EDU_AGENT_SESSION_STORE
+        """
+        from edu_agent.session_store import open_session_store
+        return open_session_store()
+    
+    @staticmethod
+    @st.cache_resource
+    def get_progress_store():
+        """
+        Mock test score store shared by every session
+        """
+        from edu_agent.progress import ProgressStore
+        return ProgressStore.shared()
+    
+    @staticmethod
+    def get_student_id():
+        """
+        ID of the student using this browser, created on first use. It is
+        kept in the page's ``student`` query parameter, so a reload or a
+        bookmarked link finds the same history, stored task outputs and
+        mock test scores.
+        """
+        if 'student_id' not in st.session_state:
+            student_id = st.query_params.get('student')
+            if not student_id:
+                student_id = uuid.uuid4().hex
+                st.query_params['student'] = student_id
+            st.session_state.student_id = student_id
+        return st.session_state.student_id
+    
+    @staticmethod
+    def save_user_session(student_data):
+        """
+        Record a form submission under this student's ID; nothing is kept in
+        st.session_state
+        """
+        HelperFunctions.get_session_store().record(HelperFunctions.get_student_id(), student_data)
+    
+    @staticmethod
+    def get_user_sessions(limit=5):
+        """
+        This student's latest form submissions, newest first
+        """
+        return HelperFunctions.get_session_store().history(HelperFunctions.get_student_id(), limit)
     
     @staticmethod
     def get_motivational_quote():
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+class RoadmapJob:
+    """
+    State of one background roadmap generation, updated from worker threads
+    """
+    def __init__(self, student_data, sections, student_id=None):
+        self.id = uuid.uuid4().hex
+        self.student_data = student_data
+        self.student_id = student_id
+        self.state = 'queued'
+        self.sections = {section: '' for section in sections}
+        self.finished = set()
+        self.result = None
+        self.updated = time.time()
+        self._lock = threading.Lock()
+    
+    def on_event(self, section, event, payload):
+        with self._lock:
+            # Sections reused from an earlier roadmap arrive as 'done' alone
+            self.state = 'running'
+            if event == 'start':
+                # A retried task streams its answer again from the start
+                self.sections[section] = ''
+            elif event == 'token':
+                self.sections[section] += payload
+            elif event == 'done':
+                self.sections[section] = payload
+                self.finished.add(section)
+            self.updated = time.time()
+    
+    def finish(self, result):
+        with self._lock:
+            self.result = result
+            self.state = 'done'
+            self.updated = time.time()
+    
+    def snapshot(self):
+        with self._lock:
+            return {
+                'id': self.id,
+                'state': self.state,
+                'sections': dict(self.sections),
+                'finished': set(self.finished),
+                'progress': len(self.finished) / len(self.sections) if self.sections else 1.0,
+                'result': self.result
+            }
+
+
+class RoadmapJobQueue:
+    """
+    Process-local queue of roadmap generations shared by every session.
+
+    Jobs run as coroutines on a single background event loop, so Streamlit
+    script runs only submit and poll and never block on generation. How many
+    generations run at once is bounded by the crew's max_concurrent and its
+    scheduler's thread pool, whatever the number of open sessions. Finished
+    jobs are kept for ``retention`` seconds so a result survives reruns and
+    reconnects, and at most ``max_jobs`` are held at any time.
+    """
+    def __init__(self, crew, max_jobs=512, retention=3600):
+        self.crew = crew
+        self.max_jobs = max_jobs
+        self.retention = retention
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='roadmap-jobs', daemon=True)
+        self._thread.start()
+    
+    def submit(self, student_data, student_id=None):
+        """
+        Queue a generation and return its job ID
+        """
+        job = RoadmapJob(student_data, self.crew.SECTIONS, student_id)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        asyncio.run_coroutine_threadsafe(self._run(job), self._loop)
+        return job.id
+    
+    def status(self, job_id):
+        """
+        Snapshot of a job, or None if it is unknown or expired
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job.snapshot() if job is not None else None
+    
+    async def _run(self, job):
+        try:
+            result = await self.crew.acreate_study_roadmap(
+                job.student_data, on_event=job.on_event, student_id=job.student_id
+            )
+        except Exception as e:
+            result = {
+                'status': 'error',
+                'message': f"Error generating roadmap: {str(e)}",
+                'student_profile': job.student_data
+            }
+        job.finish(result)
+    
+    def _prune(self):
+        """Drop expired finished jobs, then the oldest finished ones over max_jobs"""
+        cutoff = time.time() - self.retention
+        for job_id, job in list(self._jobs.items()):
+            if job.state == 'done' and job.updated < cutoff:
+                del self._jobs[job_id]
+        
+        for job_id, job in list(self._jobs.items()):
+            if len(self._jobs) < self.max_jobs:
+                break
+            if job.state == 'done':
+                del self._jobs[job_id]
\ No newline at end of file
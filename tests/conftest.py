@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+os.environ.setdefault('OTEL_SDK_DISABLED', 'true')
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path, monkeypatch):
+    """Point every store at the test's own directory and use the fake LLM"""
+    monkeypatch.setenv('EDU_AGENT_LLM', 'fake')
+    monkeypatch.setenv('EDU_AGENT_FAKE_LATENCY', '0')
+    monkeypatch.setenv('EDU_AGENT_SCHEDULE', 'agent')
+    monkeypatch.setenv('EDU_AGENT_LLM_CACHE', str(tmp_path / 'llm_cache.sqlite'))
+    monkeypatch.setenv('EDU_AGENT_TASK_STORE', ':memory:')
+    monkeypatch.setenv('EDU_AGENT_ROADMAP_LIBRARY', str(tmp_path / 'library.sqlite'))
+    monkeypatch.setenv('EDU_AGENT_SESSION_STORE', str(tmp_path / 'sessions.sqlite'))
+    monkeypatch.setenv('EDU_AGENT_PROGRESS_STORE', str(tmp_path / 'progress'))
+    monkeypatch.delenv('EDU_AGENT_METRICS_PORT', raising=False)
+
+
+@pytest.fixture
+def student():
+    """A valid profile as StudentInputForm returns it"""
+    return {
+        'school_name': 'Allen Career Institute',
+        'current_class': 'Class 12',
+        'percentage': 88.0,
+        'age': 17,
+        'target_exams': ['JEE Main', 'JEE Advanced'],
+        'strong_subjects': ['Mathematics'],
+        'weak_subjects': ['Chemistry'],
+        'preparation_status': '6-12 months preparation',
+    }
+
+
+@pytest.fixture
+def make_crew():
+    """EducationCrew on a FakeLLM, with every kind of reuse off unless asked for"""
+    from edu_agent.agents import AgentPool, EducationAgents
+    from edu_agent.crew import EducationCrew
+    from edu_agent.metrics import MetricsRegistry
+    
+    def make(llm, **kwargs):
+        options = dict(
+            roadmap_cache=False, library=False, coalesce=False, task_store=False,
+            schedule='agent', metrics=MetricsRegistry(),
+        )
+        options.update(kwargs)
+        crew = EducationCrew(pool=AgentPool(EducationAgents(llm=llm)), **options)
+        crew.scheduler.backoff_base = 0.01
+        return crew
+    return make
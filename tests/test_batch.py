@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from edu_agent.batch import normalize_record, read_rows, run_batch
+
+
+def write_lines(path, lines):
+    path.write_text(''.join(line + '\n' for line in lines), encoding='utf-8')
+    return str(path)
+
+
+def test_read_rows_passes_malformed_lines_on(tmp_path, student):
+    path = write_lines(tmp_path / 'students.jsonl', [
+        json.dumps(dict(student, student_id='s1')),
+        '{"school_name": "Allen", "percentage": 9',
+        '[1, 2]',
+        json.dumps(student),
+    ])
+    rows = list(read_rows(path))
+    assert [student_id for student_id, _ in rows] == ['s1', '2', '3', '4']
+    assert rows[0][1] == student
+    assert rows[1][1].startswith('{"school_name"')
+    assert rows[2][1] == [1, 2]
+
+
+@pytest.mark.parametrize('row', ['{"school_name": "Allen"', [1, 2], 'null'])
+def test_normalize_rejects_non_objects(row):
+    with pytest.raises(ValueError, match="not a JSON object"):
+        normalize_record(row)
+
+
+def test_normalize_replaces_nulls():
+    data = normalize_record({
+        'school_name': None, 'current_class': None, 'preparation_status': '',
+        'percentage': None, 'age': '17', 'target_exams': None,
+        'strong_subjects': 'Physics; Mathematics', 'weak_subjects': 'Chemistry',
+    })
+    assert data == {
+        'school_name': '', 'current_class': 'Class 11', 'preparation_status': 'Not started yet',
+        'percentage': 0.0, 'age': 17, 'target_exams': [],
+        'strong_subjects': ['Physics', 'Mathematics'], 'weak_subjects': ['Chemistry'],
+    }
+
+
+def test_normalize_rejects_bad_numbers():
+    with pytest.raises(ValueError, match="percentage must be a number"):
+        normalize_record({'percentage': 'ninety'})
+
+
+def test_run_batch_reports_bad_lines_and_generates_the_rest(tmp_path, student):
+    input_path = write_lines(tmp_path / 'students.jsonl', [
+        json.dumps(dict(student, student_id='good')),
+        '{"school_name": "Allen", "percentage": 9',
+        '"just a string"',
+        json.dumps(dict(student, student_id='null-school', school_name=None)),
+        json.dumps(dict(student, student_id='null-fields', current_class=None, target_exams=None)),
+    ])
+    output_path = str(tmp_path / 'roadmaps.jsonl')
+    
+    summary = run_batch(input_path, output_path, workers=1)
+    assert summary == {'skipped': 0, 'invalid': 3, 'success': 2, 'error': 0}
+    
+    with open(output_path, encoding='utf-8') as f:
+        results = {result['student_id']: result for result in map(json.loads, f)}
+    assert results['good']['status'] == results['null-fields']['status'] == 'success'
+    assert results['2']['status'] == results['3']['status'] == 'invalid'
+    assert results['null-school']['errors'] == ["School name is required"]
+    
+    # The output is the checkpoint; a rerun only skips
+    summary = run_batch(input_path, output_path, workers=1)
+    assert summary == {'skipped': 5, 'invalid': 0, 'success': 0, 'error': 0}
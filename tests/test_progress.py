@@ -0,0 +1,41 @@
+import os
+
+import numpy as np
+
+from edu_agent.progress import COLUMNS, ProgressStore, student_progress
+
+
+def test_record_and_read_back(tmp_path):
+    store = ProgressStore(str(tmp_path / 'progress'))
+    store.record('a', 'Physics', 72)
+    store.record('b', 'Chemistry', 140)
+    
+    columns = store.columns()
+    assert len(columns['score']) == 2
+    assert columns['score'].tolist() == [72.0, 100.0]
+    assert columns['student'].tolist() == [store.student_code('a'), store.student_code('b')]
+    assert student_progress(store, 'a') is not None
+
+
+def test_append_recovers_from_torn_write(tmp_path):
+    store = ProgressStore(str(tmp_path / 'progress'))
+    store.append(['a', 'b'], ['Physics', 'Mathematics'], [60, 70])
+    
+    # A crash part way through an append: only some columns got the row
+    for column in ('student', 'cohort', 'subject'):
+        with open(store._file(column), 'ab') as f:
+            np.zeros(1, dtype=COLUMNS[column]).tofile(f)
+    assert len(store.columns()['score']) == 2
+    
+    store.append(['d'], ['Chemistry'], [80])
+    sizes = {
+        column: os.path.getsize(store._file(column)) // dtype.itemsize
+        for column, dtype in COLUMNS.items()
+    }
+    assert set(sizes.values()) == {3}
+    
+    columns = store.columns()
+    students = [store._keys['students'][code] for code in columns['student']]
+    assert students == ['a', 'b', 'd']
+    assert columns['score'].tolist() == [60.0, 70.0, 80.0]
+    assert columns['subject'].tolist() == [1, 0, 2]
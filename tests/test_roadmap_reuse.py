@@ -0,0 +1,78 @@
+import asyncio
+
+from edu_agent.crew import EducationCrew
+from edu_agent.fake_llm import FakeLLM
+from edu_agent.models import Roadmap
+from edu_agent.roadmap_cache import RoadmapCache
+from edu_agent.roadmap_library import RoadmapLibrary
+
+ANALYSIS = "Keep attending the weekend tests at Allen Career Institute."
+
+
+def other_school(student):
+    return dict(student, school_name='Delhi Public School', percentage=86.5)
+
+
+def counter(metrics, name):
+    return sum(c['value'] for c in metrics.snapshot()['counters'] if c['name'] == name)
+
+
+def generated(student):
+    roadmap = Roadmap(sections={'Academic Profile Analysis': ANALYSIS})
+    return {'status': 'success', 'roadmap': roadmap, 'student_profile': student}
+
+
+def test_cache_serves_roadmap_unchanged_to_another_school(student):
+    cache = RoadmapCache()
+    cache.put(student, generated(student))
+    
+    hit = cache.get(other_school(student))
+    assert hit['roadmap'].sections['Academic Profile Analysis'] == ANALYSIS
+    assert hit['student_profile'] == other_school(student)
+
+
+def test_library_serves_roadmap_unchanged_to_another_school(student, tmp_path):
+    library = RoadmapLibrary(str(tmp_path / 'library.sqlite'))
+    library.put(student, generated(student)['roadmap'])
+    
+    hit = library.get(other_school(student))
+    assert hit['roadmap'].sections['Academic Profile Analysis'] == ANALYSIS
+    assert hit['student_profile'] == other_school(student)
+
+
+def test_share_only_readdresses_the_result(student):
+    result = generated(student)
+    shared = EducationCrew._share(result, other_school(student))
+    assert shared['roadmap'] is result['roadmap']
+    assert shared['student_profile'] == other_school(student)
+    assert result['student_profile'] == student
+
+
+def test_coalesced_request_gets_the_leaders_roadmap(student, make_crew):
+    # Without a cache identical profiles coalesce on the exact percentage
+    other = dict(student, school_name='Delhi Public School')
+    llm = FakeLLM(latency=0.2, latency_sigma=0, responses={"Analyze this student's": ANALYSIS})
+    crew = make_crew(llm, coalesce=True)
+    
+    async def both():
+        return await asyncio.gather(
+            crew.acreate_study_roadmap(student),
+            crew.acreate_study_roadmap(other),
+        )
+    
+    leader, waiter = asyncio.run(both())
+    assert leader['status'] == waiter['status'] == 'success'
+    assert waiter['roadmap'] is leader['roadmap']
+    assert ANALYSIS in waiter['roadmap'].sections['Academic Profile Analysis']
+    assert waiter['student_profile'] == other
+    assert counter(crew.metrics, 'edu_agent_roadmap_coalesced_total') == 1
+
+
+def test_crew_cache_hit_for_another_school(student, make_crew):
+    llm = FakeLLM(latency=0, responses={"Analyze this student's": ANALYSIS})
+    crew = make_crew(llm, roadmap_cache=RoadmapCache())
+    
+    first = crew.create_study_roadmap(student)
+    second = crew.create_study_roadmap(other_school(student))
+    assert second['roadmap'] is first['roadmap']
+    assert second['student_profile'] == other_school(student)
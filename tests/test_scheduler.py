@@ -0,0 +1,68 @@
+import time
+
+from edu_agent.fake_llm import FakeLLM, FakeLLMError
+
+
+class FailingScheduleLLM(FakeLLM):
+    """FakeLLM whose timeline optimizer call always fails"""
+    
+    def _call(self, prompt, stop=None, run_manager=None, **kwargs):
+        if "daily and weekly study schedule" in prompt:
+            raise FakeLLMError("Injected LLM failure")
+        return super()._call(prompt, stop=stop, run_manager=run_manager, **kwargs)
+
+
+def counter(metrics, name):
+    return sum(c['value'] for c in metrics.snapshot()['counters'] if c['name'] == name)
+
+
+def test_transient_failures_are_retried(student, make_crew):
+    crew = make_crew(FakeLLM(latency=0, failure_rate=0.3, seed=0), retries=3)
+    
+    result = crew.create_study_roadmap(student)
+    assert result['status'] == 'success'
+    assert counter(crew.metrics, 'edu_agent_task_retries_total') > 0
+
+
+def test_failure_without_retries_fails_the_roadmap(student, make_crew):
+    crew = make_crew(FakeLLM(latency=0, failure_rate=1.0), retries=0)
+    
+    result = crew.create_study_roadmap(student)
+    assert result['status'] == 'error'
+    assert "Injected LLM failure" in result['message']
+    assert 'partial_roadmap' not in result
+    assert counter(crew.metrics, 'edu_agent_task_retries_total') == 0
+
+
+def test_timeout_fails_the_roadmap_and_holds_the_lease(student, make_crew):
+    crew = make_crew(FakeLLM(latency=1.0, latency_sigma=0), task_timeout=0.2)
+    
+    result = crew.create_study_roadmap(student)
+    assert result['status'] == 'error'
+    assert "did not finish within 0.2s" in result['message']
+    # The agents go back to the pool only once the abandoned call returns
+    assert not crew.pool._idle
+    deadline = time.monotonic() + 5
+    while not crew.pool._idle and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert len(crew.pool._idle) == 1
+
+
+def test_failed_task_keeps_the_finished_sections(student, make_crew):
+    # One at a time, the schedule is the last task to run
+    crew = make_crew(FailingScheduleLLM(latency=0), retries=0, parallel=False)
+    
+    result = crew.create_study_roadmap(student)
+    assert result['status'] == 'error'
+    sections = result['partial_roadmap'].sections
+    assert list(sections) == ['Academic Profile Analysis', 'Study Roadmap', 'Recommended Resources']
+    assert all(sections.values())
+
+
+def test_failed_parallel_task_keeps_its_dependencies(student, make_crew):
+    crew = make_crew(FailingScheduleLLM(latency=0), retries=0)
+    
+    result = crew.create_study_roadmap(student)
+    assert result['status'] == 'error'
+    assert result['partial_roadmap'].sections['Academic Profile Analysis']
+    assert 'Study Schedule' not in result['partial_roadmap'].sections